@@ -1139,7 +1139,10 @@ class Component(JSONDumpable, metaclass=ComponentsMeta):
         except AttributeError:
             stateful = []
 
-        return (p for p in self.parameters if p.name in stateful or isinstance(p.get(), Component))
+        # Sort by name to keep the structure layout (and generated code)
+        # independent of the iteration order of parameters
+        return sorted((p for p in self.parameters if p.name in stateful or isinstance(p.get(), Component)),
+                      key=lambda p: p.name)
 
     def _get_state_ids(self):
         return [sp.name for sp in self._get_compilation_state()]
@@ -1174,7 +1177,7 @@ class Component(JSONDumpable, metaclass=ComponentsMeta):
                 return not isinstance(val, (str, ComponentsMeta))
             return False
 
-        return filter(_is_compilation_param, self.parameters)
+        return sorted(filter(_is_compilation_param, self.parameters), key=lambda p: p.name)
 
     def _get_param_ids(self, context=None):
         return [p.name for p in self._get_compilation_params(context)]
@@ -1211,6 +1214,34 @@ class Component(JSONDumpable, metaclass=ComponentsMeta):
     def _get_param_initializer(self, context):
         return pnlvm._tupleize(self._get_param_values(context))
 
+    def _get_compilation_key(self, ctx):
+        """Return a structural key of the code generated for the Component.
+
+        The compiled function is reused as long as the key does not change.
+        The key covers the layout of the compiled structures and parameter
+        values that are used during code generation instead of being passed
+        in the parameter structure (strings selecting a method, Components
+        and functions that are called by the generated code, etc.).
+        """
+        def _static_value(value):
+            if isinstance(value, (str, bool, type, types.FunctionType)):
+                return value
+            # Only identities of other objects are used; the key must not keep them alive
+            if isinstance(value, types.MethodType):
+                return (type(value.__self__), id(value.__self__), value.__func__)
+            if isinstance(value, Component):
+                return (type(value), id(value))
+            return type(value)
+
+        static_values = tuple((p.name, _static_value(p.get())) for p in self.parameters
+                              if not isinstance(p, ParameterAlias))
+        return (type(self),
+                str(ctx.get_param_struct_type(self)),
+                str(ctx.get_state_struct_type(self)),
+                str(ctx.get_input_struct_type(self)),
+                str(ctx.get_output_struct_type(self)),
+                static_values)
+
     def _gen_llvm_function(self, extra_args=[]):
         with pnlvm.LLVMBuilderContext.get_global() as ctx:
             args = [ctx.get_param_struct_type(self).as_pointer(),
@@ -1794,19 +1825,28 @@ class Component(JSONDumpable, metaclass=ComponentsMeta):
                     skip_log=True,
                 )
 
-    def _initialize_from_context(self, context, base_context=Context(execution_id=None), override=True, visited=None):
+    def _initialize_from_context(
+        self,
+        context,
+        base_context=Context(execution_id=None),
+        override=True,
+        visited=None,
+        copy_on_write=False
+    ):
         if visited is None:
             visited = set()
 
         for comp in self._dependent_components:
             if comp not in visited:
                 visited.add(comp)
-                comp._initialize_from_context(context, base_context, override, visited=visited)
+                comp._initialize_from_context(
+                    context, base_context, override, visited=visited, copy_on_write=copy_on_write
+                )
 
         non_alias_params = [p for p in self.stateful_parameters if not isinstance(p, ParameterAlias)]
         for param in non_alias_params:
             if param.setter is None:
-                param._initialize_from_context(context, base_context, override)
+                param._initialize_from_context(context, base_context, override, copy_on_write=copy_on_write)
 
         # attempt to initialize any params with setters (some params with setters may depend on the
         # initialization of other params)
@@ -1815,7 +1855,7 @@ class Component(JSONDumpable, metaclass=ComponentsMeta):
         # initialization value
         for param in non_alias_params:
             if param.setter is not None:
-                param._initialize_from_context(context, base_context, override)
+                param._initialize_from_context(context, base_context, override, copy_on_write=copy_on_write)
 
     def _delete_contexts(self, *contexts, check_simulation_storage=False, visited=None):
         if visited is None:
@@ -2025,3 +2025,26 @@ class PredictionErrorDeltaFunction(CombinationFunction):
             delta[t] = reward[t] + gamma * sample[t] - sample[t - 1]
 
         return self.convert_output_type(delta)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        # Sometimes we arg_out to 2d array
+        arg_out = ctx.unwrap_2d_array(builder, arg_out)
+
+        gamma_ptr = ctx.get_param_ptr(self, builder, params, GAMMA)
+        gamma = pnlvm.helpers.load_extract_scalar_array_one(builder, gamma_ptr)
+
+        zero = ctx.int32_ty(0)
+        sample = builder.gep(arg_in, [zero, zero])
+        reward = builder.gep(arg_in, [zero, ctx.int32_ty(1)])
+
+        builder.store(ctx.float_ty(0), builder.gep(arg_out, [zero, zero]))
+        stop = ctx.int32_ty(arg_out.type.pointee.count)
+        with pnlvm.helpers.for_loop(builder, ctx.int32_ty(1), stop, ctx.int32_ty(1), "delta") as (b1, t):
+            val = b1.load(b1.gep(sample, [zero, t]))
+            val = b1.fmul(val, gamma)
+            val = b1.fadd(val, b1.load(b1.gep(reward, [zero, t])))
+            prev = b1.load(b1.gep(sample, [zero, b1.sub(t, ctx.int32_ty(1))]))
+            val = b1.fsub(val, prev)
+            b1.store(val, b1.gep(arg_out, [zero, t]))
+
+        return builder
@@ -47,15 +47,145 @@ __all__ = [
 ]
 
 
+# Coefficients of the rational approximations of the normal quantile function,
+# algorithm AS241 (Wichura, 1988), accurate to about 1e-16
+_AS241_CENTRAL = (
+    (2509.0809287301226727, 33430.575583588128105, 67265.770927008700853, 45921.953931549871457,
+     13731.693765509461125, 1971.5909503065514427, 133.14166789178437745, 3.387132872796366608),
+    (5226.495278852545925, 28729.085735721942674, 39307.89580009271061, 21213.794301586595867,
+     5394.1960214247511077, 687.1870074920579083, 42.313330701600911252, 1.0),
+)
+_AS241_INTERMEDIATE = (
+    (7.7454501427834140764e-4, 0.0227238449892691845833, 0.24178072517745061177, 1.27045825245236838258,
+     3.64784832476320460504, 5.7694972214606914055, 4.6303378461565452959, 1.42343711074968357734),
+    (1.05075007164441684324e-9, 5.475938084995344946e-4, 0.0151986665636164571966, 0.14810397642748007459,
+     0.68976733498510000455, 1.6763848301838038494, 2.05319162663775882187, 1.0),
+)
+_AS241_TAIL = (
+    (2.01033439929228813265e-7, 2.71155556874348757815e-5, 0.0012426609473880784386, 0.026532189526576123093,
+     0.29656057182850489123, 1.7848265399172913358, 5.4637849111641143699, 6.6579046435011037772),
+    (2.04426310338993978564e-15, 1.4215117583164458887e-7, 1.8463183175100546818e-5, 7.868691311456132591e-4,
+     0.0148753612908506148525, 0.13692988092273580531, 0.59983220655588793769, 1.0),
+)
+
+
+def _gen_llvm_rational(builder, x, coeffs):
+    def _polynomial(coeffs):
+        val = x.type(coeffs[0])
+        for c in coeffs[1:]:
+            val = builder.fadd(builder.fmul(val, x), x.type(c))
+        return val
+
+    numerator, denominator = coeffs
+    return builder.fdiv(_polynomial(numerator), _polynomial(denominator))
+
+
+def _gen_llvm_normal_quantile(ctx, builder, p):
+    """Return the quantile function (inverse CDF) of the standard normal distribution at **p**."""
+    log_f = ctx.get_builtin("log", [ctx.float_ty])
+    sqrt_f = ctx.get_builtin("sqrt", [ctx.float_ty])
+    fabs_f = ctx.get_builtin("fabs", [ctx.float_ty])
+
+    with builder.goto_entry_block():
+        res_p = builder.alloca(ctx.float_ty)
+
+    q = builder.fsub(p, p.type(0.5))
+    central = builder.fcmp_ordered("<=", builder.call(fabs_f, [q]), q.type(0.425))
+    with builder.if_else(central) as (then, otherwise):
+        with then:
+            r = builder.fsub(q.type(0.180625), builder.fmul(q, q))
+            val = builder.fmul(q, _gen_llvm_rational(builder, r, _AS241_CENTRAL))
+            builder.store(val, res_p)
+        with otherwise:
+            lower = builder.fcmp_ordered("<", q, q.type(0.0))
+            r = builder.select(lower, p, builder.fsub(p.type(1.0), p))
+            r = builder.call(sqrt_f, [pnlvm.helpers.fneg(builder, builder.call(log_f, [r]))])
+
+            intermediate = builder.fcmp_ordered("<=", r, r.type(5.0))
+            r_intermediate = builder.fsub(r, r.type(1.6))
+            r_tail = builder.fsub(r, r.type(5.0))
+            with builder.if_else(intermediate) as (near, far):
+                with near:
+                    val = _gen_llvm_rational(builder, r_intermediate, _AS241_INTERMEDIATE)
+                    builder.store(val, res_p)
+                with far:
+                    val = _gen_llvm_rational(builder, r_tail, _AS241_TAIL)
+                    builder.store(val, res_p)
+
+            val = builder.load(res_p)
+            builder.store(builder.select(lower, pnlvm.helpers.fneg(builder, val), val), res_p)
+
+    return builder.load(res_p)
+
+
 class DistributionFunction(Function_Base):
     componentType = DIST_FUNCTION_TYPE
 
+    def _get_random_state(self, context):
+        # Functions constructed without a seed draw from the global numpy generator
+        random_state = self.get_current_function_param('random_state', context)
+        return np.random if random_state is None else random_state
+
+    def _get_state_values(self, context=None):
+        # Compiled code needs a generator of its own. Functions constructed
+        # without a seed start from the current state of the global generator
+        def _state_value(name, value):
+            if name == 'random_state' and value is None:
+                value = np.random.RandomState()
+                value.set_state(np.random.get_state())
+            return value
+
+        return tuple(_state_value(name, value) for name, value in
+                     zip(self._get_state_ids(), super()._get_state_values(context)))
+
+    def _gen_llvm_rand_call(self, ctx, builder, random_state, name):
+        rand_f = ctx.import_llvm_function(name)
+        # Samples are drawn in (rejection) loops, keep the stack allocation
+        # in the entry block
+        with builder.goto_entry_block():
+            rand_p = builder.alloca(ctx.float_ty)
+        builder.call(rand_f, [random_state, rand_p])
+        return builder.load(rand_p)
+
+    def _gen_llvm_rand_double(self, ctx, builder, random_state):
+        return self._gen_llvm_rand_call(ctx, builder, random_state, "__pnl_builtin_mt_rand_double")
+
+    def _gen_llvm_rand_normal(self, ctx, builder, random_state):
+        return self._gen_llvm_rand_call(ctx, builder, random_state, "__pnl_builtin_mt_rand_normal")
+
+    def _gen_llvm_rand_exponential(self, ctx, builder, random_state):
+        # Same as numpy: -log(1 - U), since U is in [0, 1)
+        val = self._gen_llvm_rand_double(ctx, builder, random_state)
+        val = builder.fsub(val.type(1.0), val)
+        log_f = ctx.get_builtin("log", [ctx.float_ty])
+        val = builder.call(log_f, [val])
+        return pnlvm.helpers.fneg(builder, val)
+
+    def _gen_llvm_load_param(self, ctx, builder, params, name):
+        param_ptr = ctx.get_param_ptr(self, builder, params, name)
+        return pnlvm.helpers.load_extract_scalar_array_one(builder, param_ptr)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out):
+        random_state = ctx.get_state_ptr(self, builder, state, "random_state")
+
+        # Arguments used in mechanisms are 2D
+        arg_out = ctx.unwrap_2d_array(builder, arg_out)
+        if isinstance(arg_out.type.pointee, pnlvm.ir.ArrayType):
+            with pnlvm.helpers.array_ptr_loop(builder, arg_out, "dist_sample") as (b, idx):
+                ptro = b.gep(arg_out, [ctx.int32_ty(0), idx])
+                b.store(self._gen_llvm_sample(ctx, b, params, random_state), ptro)
+        else:
+            builder.store(self._gen_llvm_sample(ctx, builder, params, random_state), arg_out)
+
+        return builder
+
 
 class NormalDist(DistributionFunction):
     """
     NormalDist(                      \
              mean=0.0,               \
              standard_deviation=1.0, \
+             seed=None,              \
              params=None,            \
              owner=None,             \
              prefs=None              \
@@ -80,6 +210,10 @@ class NormalDist(DistributionFunction):
     standard_deviation : float : default 1.0
         Standard deviation of the normal distribution. Must be > 0.0
 
+    seed : int : default None
+        seed for the Function's own random number generator; if it is not specified, samples are drawn from the
+        global numpy random number generator.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -103,6 +237,9 @@ class NormalDist(DistributionFunction):
     standard_deviation : float : default 1.0
         Standard deviation of the normal distribution; if it is 0.0, returns `mean <NormalDist.mean>`.
 
+    random_state : numpy.RandomState or None
+        the Function's own random number generator, or None if **seed** was not specified.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -132,6 +269,12 @@ class NormalDist(DistributionFunction):
                     :default value: 0.0
                     :type: float
 
+                random_state
+                    see `random_state <NormalDist.random_state>`
+
+                    :default value: None
+                    :type: numpy.random.RandomState
+
                 standard_deviation
                     see `standard_deviation <NormalDist.standard_deviation>`
 
@@ -141,19 +284,27 @@ class NormalDist(DistributionFunction):
         """
         mean = Parameter(0.0, modulable=True, aliases=[ADDITIVE_PARAM])
         standard_deviation = Parameter(1.0, modulable=True, aliases=[MULTIPLICATIVE_PARAM])
+        random_state = Parameter(None, stateful=True, loggable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  mean=0.0,
                  standard_deviation=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+
+        random_state = None if seed is None else np.random.RandomState([seed])
+        if not hasattr(self, "stateful_attributes"):
+            self.stateful_attributes = ["random_state"]
+
         super().__init__(
             default_variable=default_variable,
             mean=mean,
             standard_deviation=standard_deviation,
+            random_state=random_state,
             params=params,
             owner=owner,
             prefs=prefs,
@@ -175,16 +326,27 @@ class NormalDist(DistributionFunction):
         mean = self.get_current_function_param(DIST_MEAN, context)
         standard_deviation = self.get_current_function_param(STANDARD_DEVIATION, context)
 
-        result = np.random.normal(mean, standard_deviation)
+        random_state = self._get_random_state(context)
+
+        result = random_state.normal(mean, standard_deviation)
 
         return self.convert_output_type(result)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        mean = self._gen_llvm_load_param(ctx, builder, params, DIST_MEAN)
+        std_dev = self._gen_llvm_load_param(ctx, builder, params, STANDARD_DEVIATION)
+
+        val = self._gen_llvm_rand_normal(ctx, builder, random_state)
+        val = builder.fmul(std_dev, val)
+        return builder.fadd(mean, val)
+
 
 class UniformToNormalDist(DistributionFunction):
     """
     UniformToNormalDist(             \
              mean=0.0,               \
              standard_deviation=1.0, \
+             seed=None,              \
              params=None,            \
              owner=None,             \
              prefs=None              \
@@ -222,6 +384,10 @@ class UniformToNormalDist(DistributionFunction):
     standard_deviation : float : default 1.0
         Standard deviation of the normal distribution
 
+    seed : int : default None
+        seed for the Function's own random number generator; if it is not specified, samples are drawn from the
+        global numpy random number generator.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -245,6 +411,9 @@ class UniformToNormalDist(DistributionFunction):
     standard_deviation : float : default 1.0
         Standard deviation of the normal distribution
 
+    random_state : numpy.RandomState or None
+        the Function's own random number generator, or None if **seed** was not specified.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -281,6 +450,12 @@ class UniformToNormalDist(DistributionFunction):
                     :default value: 0.0
                     :type: float
 
+                random_state
+                    see `random_state <UniformToNormalDist.random_state>`
+
+                    :default value: None
+                    :type: numpy.random.RandomState
+
                 standard_deviation
                     see `standard_deviation <UniformToNormalDist.standard_deviation>`
 
@@ -291,19 +466,27 @@ class UniformToNormalDist(DistributionFunction):
         variable = Parameter(np.array([0]), read_only=True, pnl_internal=True, constructor_argument='default_variable')
         mean = Parameter(0.0, modulable=True, aliases=[ADDITIVE_PARAM])
         standard_deviation = Parameter(1.0, modulable=True, aliases=[MULTIPLICATIVE_PARAM])
+        random_state = Parameter(None, stateful=True, loggable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  mean=0.0,
                  standard_deviation=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+
+        random_state = None if seed is None else np.random.RandomState([seed])
+        if not hasattr(self, "stateful_attributes"):
+            self.stateful_attributes = ["random_state"]
+
         super().__init__(
             default_variable=default_variable,
             mean=mean,
             standard_deviation=standard_deviation,
+            random_state=random_state,
             params=params,
             owner=owner,
             prefs=prefs,
@@ -323,16 +506,31 @@ class UniformToNormalDist(DistributionFunction):
         mean = self.get_current_function_param(DIST_MEAN, context)
         standard_deviation = self.get_current_function_param(STANDARD_DEVIATION, context)
 
-        sample = np.random.rand(1)[0]
+        random_state = self._get_random_state(context)
+
+        sample = random_state.rand(1)[0]
         result = ((np.sqrt(2) * erfinv(2 * sample - 1)) * standard_deviation) + mean
 
         return self.convert_output_type(result)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        mean = self._gen_llvm_load_param(ctx, builder, params, DIST_MEAN)
+        std_dev = self._gen_llvm_load_param(ctx, builder, params, STANDARD_DEVIATION)
+
+        # sqrt(2) * erfinv(2 * p - 1) is the quantile function of the
+        # standard normal distribution. There's no erfinv builtin,
+        # so compute the quantile directly.
+        val = self._gen_llvm_rand_double(ctx, builder, random_state)
+        val = _gen_llvm_normal_quantile(ctx, builder, val)
+        val = builder.fmul(val, std_dev)
+        return builder.fadd(val, mean)
+
 
 class ExponentialDist(DistributionFunction):
     """
     ExponentialDist(                \
              beta=1.0,              \
+             seed=None,             \
              params=None,           \
              owner=None,            \
              prefs=None             \
@@ -353,6 +551,10 @@ class ExponentialDist(DistributionFunction):
     beta : float : default 1.0
         The scale parameter of the exponential distribution
 
+    seed : int : default None
+        seed for the Function's own random number generator; if it is not specified, samples are drawn from the
+        global numpy random number generator.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -373,6 +575,9 @@ class ExponentialDist(DistributionFunction):
     beta : float : default 1.0
         The scale parameter of the exponential distribution
 
+    random_state : numpy.RandomState or None
+        the Function's own random number generator, or None if **seed** was not specified.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -401,19 +606,33 @@ class ExponentialDist(DistributionFunction):
                     :default value: 1.0
                     :type: float
 
+                random_state
+                    see `random_state <ExponentialDist.random_state>`
+
+                    :default value: None
+                    :type: numpy.random.RandomState
+
         """
         beta = Parameter(1.0, modulable=True, aliases=[MULTIPLICATIVE_PARAM])
+        random_state = Parameter(None, stateful=True, loggable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  beta=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+
+        random_state = None if seed is None else np.random.RandomState([seed])
+        if not hasattr(self, "stateful_attributes"):
+            self.stateful_attributes = ["random_state"]
+
         super().__init__(
             default_variable=default_variable,
             beta=beta,
+            random_state=random_state,
             params=params,
             owner=owner,
             prefs=prefs,
@@ -426,16 +645,25 @@ class ExponentialDist(DistributionFunction):
                  ):
 
         beta = self.get_current_function_param(BETA, context)
-        result = np.random.exponential(beta)
+        random_state = self._get_random_state(context)
+
+        result = random_state.exponential(beta)
 
         return self.convert_output_type(result)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        beta = self._gen_llvm_load_param(ctx, builder, params, BETA)
+
+        val = self._gen_llvm_rand_exponential(ctx, builder, random_state)
+        return builder.fmul(beta, val)
+
 
 class UniformDist(DistributionFunction):
     """
     UniformDist(                      \
              low=0.0,             \
              high=1.0,             \
+             seed=None,             \
              params=None,           \
              owner=None,            \
              prefs=None             \
@@ -454,6 +682,10 @@ class UniformDist(DistributionFunction):
     high : float : default 1.0
         Upper bound of the uniform distribution
 
+    seed : int : default None
+        seed for the Function's own random number generator; if it is not specified, samples are drawn from the
+        global numpy random number generator.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -477,6 +709,9 @@ class UniformDist(DistributionFunction):
     high : float : default 1.0
         Upper bound of the uniform distribution
 
+    random_state : numpy.RandomState or None
+        the Function's own random number generator, or None if **seed** was not specified.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -511,22 +746,36 @@ class UniformDist(DistributionFunction):
                     :default value: 0.0
                     :type: float
 
+                random_state
+                    see `random_state <UniformDist.random_state>`
+
+                    :default value: None
+                    :type: numpy.random.RandomState
+
         """
         low = Parameter(0.0, modulable=True)
         high = Parameter(1.0, modulable=True)
+        random_state = Parameter(None, stateful=True, loggable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  low=0.0,
                  high=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+
+        random_state = None if seed is None else np.random.RandomState([seed])
+        if not hasattr(self, "stateful_attributes"):
+            self.stateful_attributes = ["random_state"]
+
         super().__init__(
             default_variable=default_variable,
             low=low,
             high=high,
+            random_state=random_state,
             params=params,
             owner=owner,
             prefs=prefs,
@@ -540,16 +789,27 @@ class UniformDist(DistributionFunction):
 
         low = self.get_current_function_param(LOW, context)
         high = self.get_current_function_param(HIGH, context)
-        result = np.random.uniform(low, high)
+        random_state = self._get_random_state(context)
+
+        result = random_state.uniform(low, high)
 
         return self.convert_output_type(result)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        low = self._gen_llvm_load_param(ctx, builder, params, LOW)
+        high = self._gen_llvm_load_param(ctx, builder, params, HIGH)
+
+        val = self._gen_llvm_rand_double(ctx, builder, random_state)
+        val = builder.fmul(builder.fsub(high, low), val)
+        return builder.fadd(low, val)
+
 
 class GammaDist(DistributionFunction):
     """
     GammaDist(\
              scale=1.0,\
              dist_shape=1.0,\
+             seed=None,\
              params=None,\
              owner=None,\
              prefs=None\
@@ -574,6 +834,10 @@ class GammaDist(DistributionFunction):
     dist_shape : float : default 1.0
         The shape of the gamma distribution. Should be greater than zero.
 
+    seed : int : default None
+        seed for the Function's own random number generator; if it is not specified, samples are drawn from the
+        global numpy random number generator.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -597,6 +861,9 @@ class GammaDist(DistributionFunction):
     dist_shape : float : default 1.0
         The shape of the gamma distribution. Should be greater than zero.
 
+    random_state : numpy.RandomState or None
+        the Function's own random number generator, or None if **seed** was not specified.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -626,6 +893,12 @@ class GammaDist(DistributionFunction):
                     :default value: 1.0
                     :type: float
 
+                random_state
+                    see `random_state <GammaDist.random_state>`
+
+                    :default value: None
+                    :type: numpy.random.RandomState
+
                 scale
                     see `scale <GammaDist.scale>`
 
@@ -635,19 +908,27 @@ class GammaDist(DistributionFunction):
         """
         scale = Parameter(1.0, modulable=True, aliases=[MULTIPLICATIVE_PARAM])
         dist_shape = Parameter(1.0, modulable=True, aliases=[ADDITIVE_PARAM])
+        random_state = Parameter(None, stateful=True, loggable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  scale=1.0,
                  dist_shape=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+
+        random_state = None if seed is None else np.random.RandomState([seed])
+        if not hasattr(self, "stateful_attributes"):
+            self.stateful_attributes = ["random_state"]
+
         super().__init__(
             default_variable=default_variable,
             scale=scale,
             dist_shape=dist_shape,
+            random_state=random_state,
             params=params,
             owner=owner,
             prefs=prefs,
@@ -662,16 +943,145 @@ class GammaDist(DistributionFunction):
         scale = self.get_current_function_param(SCALE, context)
         dist_shape = self.get_current_function_param(DIST_SHAPE, context)
 
-        result = np.random.gamma(dist_shape, scale)
+        random_state = self._get_random_state(context)
+
+        result = random_state.gamma(dist_shape, scale)
 
         return self.convert_output_type(result)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        scale = self._gen_llvm_load_param(ctx, builder, params, SCALE)
+        dist_shape = self._gen_llvm_load_param(ctx, builder, params, DIST_SHAPE)
+
+        # Same algorithm as numpy.random.RandomState.gamma
+        # to produce the same stream of samples
+        with builder.goto_entry_block():
+            res_p = builder.alloca(ctx.float_ty)
+        is_one = builder.fcmp_ordered("==", dist_shape, dist_shape.type(1.0))
+        is_zero = builder.fcmp_ordered("==", dist_shape, dist_shape.type(0.0))
+        is_small = builder.fcmp_ordered("<", dist_shape, dist_shape.type(1.0))
+        with builder.if_else(is_one) as (then, otherwise):
+            with then:
+                val = self._gen_llvm_rand_exponential(ctx, builder, random_state)
+                builder.store(val, res_p)
+            with otherwise:
+                with builder.if_else(is_zero) as (zero, non_zero):
+                    with zero:
+                        builder.store(res_p.type.pointee(0.0), res_p)
+                    with non_zero:
+                        with builder.if_else(is_small) as (small, large):
+                            with small:
+                                self._gen_llvm_gamma_small_shape(ctx, builder, dist_shape, random_state, res_p)
+                            with large:
+                                self._gen_llvm_gamma_large_shape(ctx, builder, dist_shape, random_state, res_p)
+
+        return builder.fmul(scale, builder.load(res_p))
+
+    def _gen_llvm_gamma_small_shape(self, ctx, builder, dist_shape, random_state, res_p):
+        log_f = ctx.get_builtin("log", [ctx.float_ty])
+        pow_f = ctx.get_builtin("pow", [ctx.float_ty])
+        inv_shape = builder.fdiv(dist_shape.type(1.0), dist_shape)
+
+        loop_block = builder.append_basic_block("gamma_small_loop")
+        first_block = builder.append_basic_block("gamma_small_first")
+        second_block = builder.append_basic_block("gamma_small_second")
+        out_block = builder.append_basic_block("gamma_small_out")
+
+        builder.branch(loop_block)
+        builder.position_at_end(loop_block)
+        u = self._gen_llvm_rand_double(ctx, builder, random_state)
+        v = self._gen_llvm_rand_exponential(ctx, builder, random_state)
+        one_m_shape = builder.fsub(dist_shape.type(1.0), dist_shape)
+        first = builder.fcmp_ordered("<=", u, one_m_shape)
+        builder.cbranch(first, first_block, second_block)
+
+        # X = U ** (1 / shape), accept if X <= V
+        builder.position_at_end(first_block)
+        x = builder.call(pow_f, [u, inv_shape])
+        builder.store(x, res_p)
+        accept = builder.fcmp_ordered("<=", x, v)
+        builder.cbranch(accept, out_block, loop_block)
+
+        # Y = -log((1 - U) / shape)
+        # X = (1 - shape + shape * Y) ** (1 / shape), accept if X <= V + Y
+        builder.position_at_end(second_block)
+        y = builder.fdiv(builder.fsub(u.type(1.0), u), dist_shape)
+        y = pnlvm.helpers.fneg(builder, builder.call(log_f, [y]))
+        x = builder.fadd(one_m_shape, builder.fmul(dist_shape, y))
+        x = builder.call(pow_f, [x, inv_shape])
+        builder.store(x, res_p)
+        accept = builder.fcmp_ordered("<=", x, builder.fadd(v, y))
+        builder.cbranch(accept, out_block, loop_block)
+
+        builder.position_at_end(out_block)
+
+    def _gen_llvm_gamma_large_shape(self, ctx, builder, dist_shape, random_state, res_p):
+        log_f = ctx.get_builtin("log", [ctx.float_ty])
+        sqrt_f = ctx.get_builtin("sqrt", [ctx.float_ty])
+
+        # b = shape - 1/3, c = 1 / sqrt(9 * b)
+        b = builder.fsub(dist_shape, dist_shape.type(1.0 / 3.0))
+        c = builder.call(sqrt_f, [builder.fmul(b.type(9.0), b)])
+        c = builder.fdiv(c.type(1.0), c)
+
+        with builder.goto_entry_block():
+            x_p = builder.alloca(ctx.float_ty)
+            v_p = builder.alloca(ctx.float_ty)
+
+        loop_block = builder.append_basic_block("gamma_large_loop")
+        cont_block = builder.append_basic_block("gamma_large_cont")
+        check_block = builder.append_basic_block("gamma_large_check")
+        accept_block = builder.append_basic_block("gamma_large_accept")
+        out_block = builder.append_basic_block("gamma_large_out")
+
+        # Draw X from N(0, 1) until V = 1 + c * X is positive
+        builder.branch(loop_block)
+        builder.position_at_end(loop_block)
+        x = self._gen_llvm_rand_normal(ctx, builder, random_state)
+        v = builder.fadd(x.type(1.0), builder.fmul(c, x))
+        builder.store(x, x_p)
+        builder.store(v, v_p)
+        retry = builder.fcmp_ordered("<=", v, v.type(0.0))
+        builder.cbranch(retry, loop_block, cont_block)
+
+        builder.position_at_end(cont_block)
+        x = builder.load(x_p)
+        v = builder.load(v_p)
+        v = builder.fmul(builder.fmul(v, v), v)
+        builder.store(v, v_p)
+        u = self._gen_llvm_rand_double(ctx, builder, random_state)
+
+        # Accept if U < 1 - 0.0331 * X^4
+        x_sqr = builder.fmul(x, x)
+        squeeze = builder.fmul(x.type(0.0331), x_sqr)
+        squeeze = builder.fmul(squeeze, x_sqr)
+        squeeze = builder.fsub(squeeze.type(1.0), squeeze)
+        accept = builder.fcmp_ordered("<", u, squeeze)
+        builder.cbranch(accept, accept_block, check_block)
+
+        # Accept if log(U) < 0.5 * X^2 + b * (1 - V + log(V))
+        builder.position_at_end(check_block)
+        log_u = builder.call(log_f, [u])
+        bound = builder.fsub(v.type(1.0), v)
+        bound = builder.fadd(bound, builder.call(log_f, [v]))
+        bound = builder.fmul(b, bound)
+        bound = builder.fadd(builder.fmul(builder.fmul(x.type(0.5), x), x), bound)
+        accept = builder.fcmp_ordered("<", log_u, bound)
+        builder.cbranch(accept, accept_block, loop_block)
+
+        builder.position_at_end(accept_block)
+        builder.store(builder.fmul(b, builder.load(v_p)), res_p)
+        builder.branch(out_block)
+
+        builder.position_at_end(out_block)
+
 
 class WaldDist(DistributionFunction):
     """
      WaldDist(             \
               scale=1.0,\
               mean=1.0,\
+              seed=None,\
               params=None,\
               owner=None,\
               prefs=None\
@@ -696,6 +1106,10 @@ class WaldDist(DistributionFunction):
      mean : float : default 1.0
          Mean of the Wald distribution. Should be greater than or equal to zero.
 
+     seed : int : default None
+         seed for the Function's own random number generator; if it is not specified, samples are drawn from the
+         global numpy random number generator.
+
      params : Dict[param keyword: param value] : default None
          a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
          function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -718,6 +1132,9 @@ class WaldDist(DistributionFunction):
      mean : float : default 1.0
          Mean of the Wald distribution. Should be greater than or equal to zero.
 
+     random_state : numpy.RandomState or None
+         the Function's own random number generator, or None if **seed** was not specified.
+
      params : Dict[param keyword: param value] : default None
          a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
          function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -746,6 +1163,12 @@ class WaldDist(DistributionFunction):
                     :default value: 1.0
                     :type: float
 
+                random_state
+                    see `random_state <WaldDist.random_state>`
+
+                    :default value: None
+                    :type: numpy.random.RandomState
+
                 scale
                     see `scale <WaldDist.scale>`
 
@@ -755,19 +1178,27 @@ class WaldDist(DistributionFunction):
         """
         scale = Parameter(1.0, modulable=True, aliases=[MULTIPLICATIVE_PARAM])
         mean = Parameter(1.0, modulable=True, aliases=[ADDITIVE_PARAM])
+        random_state = Parameter(None, stateful=True, loggable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  scale=1.0,
                  mean=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+
+        random_state = None if seed is None else np.random.RandomState([seed])
+        if not hasattr(self, "stateful_attributes"):
+            self.stateful_attributes = ["random_state"]
+
         super().__init__(
             default_variable=default_variable,
             scale=scale,
             mean=mean,
+            random_state=random_state,
             params=params,
             owner=owner,
             prefs=prefs,
@@ -782,10 +1213,34 @@ class WaldDist(DistributionFunction):
         scale = self.get_current_function_param(SCALE, context)
         mean = self.get_current_function_param(DIST_MEAN, context)
 
-        result = np.random.wald(mean, scale)
+        random_state = self._get_random_state(context)
+
+        result = random_state.wald(mean, scale)
 
         return self.convert_output_type(result)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        scale = self._gen_llvm_load_param(ctx, builder, params, SCALE)
+        mean = self._gen_llvm_load_param(ctx, builder, params, DIST_MEAN)
+
+        # Same algorithm as numpy.random.RandomState.wald
+        # to produce the same stream of samples
+        mu_2l = builder.fdiv(mean, builder.fmul(scale.type(2.0), scale))
+        y = self._gen_llvm_rand_normal(ctx, builder, random_state)
+        y = builder.fmul(builder.fmul(mean, y), y)
+
+        sqrt_f = ctx.get_builtin("sqrt", [ctx.float_ty])
+        root = builder.fmul(builder.fmul(scale.type(4.0), scale), y)
+        root = builder.fadd(root, builder.fmul(y, y))
+        root = builder.call(sqrt_f, [root])
+        x = builder.fadd(mean, builder.fmul(mu_2l, builder.fsub(y, root)))
+
+        u = self._gen_llvm_rand_double(ctx, builder, random_state)
+        threshold = builder.fdiv(mean, builder.fadd(mean, x))
+        accept = builder.fcmp_ordered("<=", u, threshold)
+        alt = builder.fdiv(builder.fmul(mean, mean), x)
+        return builder.select(accept, x, alt)
+
 
 # Note:  For any of these that correspond to args, value must match the name of the corresponding arg in __init__()
 DRIFT_RATE = 'drift_rate'
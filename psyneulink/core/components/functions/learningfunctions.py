@@ -28,13 +28,14 @@ import numpy as np
 import typecheck as tc
 import types
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.functions.function import Function_Base, FunctionError, is_function_type
-from psyneulink.core.components.functions.transferfunctions import Logistic
+from psyneulink.core.components.functions.transferfunctions import Linear, Logistic
 from psyneulink.core.components.component import ComponentError
 from psyneulink.core.globals.keywords import \
     CONTRASTIVE_HEBBIAN_FUNCTION, DEFAULT_VARIABLE, TDLEARNING_FUNCTION, LEARNING_FUNCTION_TYPE, LEARNING_RATE, \
     KOHONEN_FUNCTION, GAUSSIAN, LINEAR, EXPONENTIAL, HEBBIAN_FUNCTION, RL_FUNCTION, BACKPROPAGATION_FUNCTION, MATRIX, \
-    MSE, SSE
+    MSE, SSE, GAIN, SCALE, SLOPE
 from psyneulink.core.globals.parameters import Parameter
 from psyneulink.core.globals.context import ContextFlags, handle_external_context
 from psyneulink.core.globals.utilities import is_numeric, scalar_distance
@@ -67,6 +68,14 @@ ERROR_MATRIX = 'error_matrix'
 ReturnVal = namedtuple('ReturnVal', 'learning_signal, error_signal')
 
 
+def _get_llvm_items_struct_type(ctx, value):
+    # Items of learning function variables and values often have different
+    # shapes (e.g. activation vectors and a matrix); use a struct for those
+    if all(np.shape(item) == np.shape(value[0]) for item in value):
+        return ctx.convert_python_struct_to_llvm_ir(np.asfarray(value))
+    return ctx.convert_python_struct_to_llvm_ir(tuple(np.asfarray(item) for item in value))
+
+
 class LearningFunction(Function_Base):
     """Abstract class of `Function <Function>` used for learning.
 
@@ -166,6 +175,30 @@ class LearningFunction(Function_Base):
                 raise FunctionError("{} arg for {} ({}) must be a single value".
                                     format(LEARNING_RATE, self.name, learning_rate))
 
+    def _get_compilation_params(self, context=None):
+        # Activation and error params are items of variable,
+        # Python functions are compiled as part of the function body
+        return [p for p in super()._get_compilation_params(context)
+                if p.name not in {ACTIVATION_INPUT, ACTIVATION_OUTPUT, ERROR_SIGNAL}
+                and not isinstance(p.get(context), (types.FunctionType, types.MethodType))]
+
+    def _get_input_struct_type(self, ctx):
+        return _get_llvm_items_struct_type(ctx, self.defaults.variable)
+
+    def _get_output_struct_type(self, ctx):
+        return _get_llvm_items_struct_type(ctx, self.defaults.value)
+
+    def _gen_llvm_learning_rate(self, ctx, builder, params):
+        lr_ptr = ctx.get_param_ptr(self, builder, params, LEARNING_RATE)
+        if lr_ptr.type.pointee == pnlvm.ir.LiteralStructType([]):
+            # learning_rate was not assigned, use the default value
+            return ctx.float_ty(self.class_defaults.learning_rate)
+
+        learning_rate = pnlvm.helpers.load_extract_scalar_array_one(builder, lr_ptr)
+        assert learning_rate.type == ctx.float_ty, \
+            "Unsupported learning_rate for compiled {}: {}".format(self.name, lr_ptr.type.pointee)
+        return learning_rate
+
 
 class BayesGLM(LearningFunction):
     """
@@ -889,6 +922,95 @@ class Kohonen(LearningFunction):  # --------------------------------------------
 
         return self.convert_output_type(weight_change_matrix)
 
+    def _gen_llvm_distance(self, ctx, builder, value):
+        assert self.distance_function is scalar_distance, \
+            "Compiled {} doesn't support custom distance_function".format(self.name)
+        if self.measure is GAUSSIAN:
+            exp_f = ctx.get_builtin("exp", [ctx.float_ty])
+            val = builder.fmul(value, value)
+            val = builder.fmul(val, ctx.float_ty(-0.5))
+            val = builder.call(exp_f, [val])
+            return builder.fdiv(val, ctx.float_ty(np.sqrt(2 * np.pi)))
+        elif self.measure is LINEAR:
+            return value
+        elif self.measure is EXPONENTIAL:
+            exp_f = ctx.get_builtin("exp", [ctx.float_ty])
+            return builder.call(exp_f, [value])
+
+        assert False, "Unsupported distance measure for compiled {}: {}".format(self.name, self.measure)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        learning_rate = self._gen_llvm_learning_rate(ctx, builder, params)
+
+        zero = ctx.int32_ty(0)
+        input_pattern = builder.gep(arg_in, [zero, ctx.int32_ty(0)])
+        activities = builder.gep(arg_in, [zero, ctx.int32_ty(1)])
+        matrix = builder.gep(arg_in, [zero, ctx.int32_ty(2)])
+
+        # Find the (first) most active element
+        index_of_max_ptr = builder.alloca(ctx.int32_ty)
+        builder.store(zero, index_of_max_ptr)
+        with pnlvm.helpers.array_ptr_loop(builder, activities, "kohonen_max") as (b1, idx):
+            index_of_max = b1.load(index_of_max_ptr)
+            max_val = b1.load(b1.gep(activities, [zero, index_of_max]))
+            val = b1.load(b1.gep(activities, [zero, idx]))
+            greater = b1.fcmp_ordered(">", val, max_val)
+            b1.store(b1.select(greater, idx, index_of_max), index_of_max_ptr)
+
+        # Weight changes are the differences between the weights and the input pattern,
+        # scaled by the distance of the receiving element from the most active one
+        index_of_max = builder.load(index_of_max_ptr)
+        with pnlvm.helpers.array_ptr_loop(builder, arg_out, "kohonen_rows") as (b1, row):
+            input_val = b1.load(b1.gep(input_pattern, [zero, row]))
+            out_row = b1.gep(arg_out, [zero, row])
+            with pnlvm.helpers.array_ptr_loop(b1, out_row, "kohonen_cols") as (b2, col):
+                offset = b2.sub(col, index_of_max)
+                offset = b2.select(b2.icmp_signed("<", offset, zero), b2.neg(offset), offset)
+                distance = self._gen_llvm_distance(ctx, b2, b2.sitofp(offset, ctx.float_ty))
+                distance = b2.fsub(ctx.float_ty(1), distance)
+
+                weight = b2.load(b2.gep(matrix, [zero, row, col]))
+                val = b2.fsub(weight, input_val)
+                val = b2.fmul(val, distance)
+                val = b2.fmul(val, learning_rate)
+                b2.store(val, b2.gep(out_row, [zero, col]))
+
+        return builder
+
+
+def _gen_llvm_hebbian_weight_changes(function, ctx, builder, params, arg_in, arg_out):
+    # Outer product of the activity vector with itself, with a zero diagonal
+    lr_ptr = ctx.get_param_ptr(function, builder, params, LEARNING_RATE)
+    lr_ty = lr_ptr.type.pointee
+    learning_rate_dim = 0
+    if isinstance(lr_ty, pnlvm.ir.ArrayType) and lr_ty.count > 1:
+        learning_rate_dim = 2 if isinstance(lr_ty.element, pnlvm.ir.ArrayType) else 1
+    if learning_rate_dim == 0:
+        learning_rate = function._gen_llvm_learning_rate(ctx, builder, params)
+
+    zero = ctx.int32_ty(0)
+
+    def _load_activity(b, idx):
+        val = b.load(b.gep(arg_in, [zero, idx]))
+        if learning_rate_dim == 1:
+            val = b.fmul(val, b.load(b.gep(lr_ptr, [zero, idx])))
+        return val
+
+    with pnlvm.helpers.array_ptr_loop(builder, arg_out, "hebbian_rows") as (b1, row):
+        row_val = _load_activity(b1, row)
+        out_row = b1.gep(arg_out, [zero, row])
+        with pnlvm.helpers.array_ptr_loop(b1, out_row, "hebbian_cols") as (b2, col):
+            val = b2.fmul(_load_activity(b2, col), row_val)
+            if learning_rate_dim == 0:
+                val = b2.fmul(val, learning_rate)
+            elif learning_rate_dim == 2:
+                val = b2.fmul(val, b2.load(b2.gep(lr_ptr, [zero, row, col])))
+            diagonal = b2.icmp_signed("==", row, col)
+            val = b2.select(diagonal, ctx.float_ty(0), val)
+            b2.store(val, b2.gep(out_row, [zero, col]))
+
+    return builder
+
 
 class Hebbian(LearningFunction):  # -------------------------------------------------------------------------------
     """
@@ -1122,6 +1244,9 @@ class Hebbian(LearningFunction):  # --------------------------------------------
 
         return self.convert_output_type(weight_change_matrix)
 
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        return _gen_llvm_hebbian_weight_changes(self, ctx, builder, params, arg_in, arg_out)
+
 
 class ContrastiveHebbian(LearningFunction):  # -------------------------------------------------------------------------
     """
@@ -1350,6 +1475,9 @@ class ContrastiveHebbian(LearningFunction):  # ---------------------------------
 
         return self.convert_output_type(weight_change_matrix)
 
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        return _gen_llvm_hebbian_weight_changes(self, ctx, builder, params, arg_in, arg_out)
+
 
 def _activation_input_getter(owning_component=None, context=None):
     return owning_component.parameters.variable._get(context)[LEARNING_ACTIVATION_INPUT]
@@ -1627,6 +1755,25 @@ class Reinforcement(LearningFunction):  # --------------------------------------
         weight_change_matrix = np.diag(error_array)
         return [error_array, error_array]
 
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        learning_rate = self._gen_llvm_learning_rate(ctx, builder, params)
+
+        zero = ctx.int32_ty(0)
+        output = builder.gep(arg_in, [zero, ctx.int32_ty(LEARNING_ACTIVATION_OUTPUT)])
+        error = builder.gep(arg_in, [zero, ctx.int32_ty(LEARNING_ERROR_OUTPUT)])
+        error = pnlvm.helpers.load_extract_scalar_array_one(builder, error)
+        error = builder.fmul(error, learning_rate)
+
+        # Assign error term to chosen item of output array
+        error_array = builder.gep(arg_out, [zero, zero])
+        with pnlvm.helpers.array_ptr_loop(builder, output, "reinforcement_error") as (b1, idx):
+            val = b1.load(b1.gep(output, [zero, idx]))
+            chosen = b1.fcmp_unordered("!=", val, ctx.float_ty(0))
+            b1.store(b1.select(chosen, error, ctx.float_ty(0)), b1.gep(error_array, [zero, idx]))
+
+        builder.store(builder.load(error_array), builder.gep(arg_out, [zero, ctx.int32_ty(1)]))
+        return builder
+
 
 class BackPropagation(LearningFunction):
     """
@@ -2106,6 +2253,101 @@ class BackPropagation(LearningFunction):
 
         return [weight_change_matrix, dE_dW]
 
+    def _get_param_values(self, context=None):
+        values = list(super()._get_param_values(context))
+
+        # error_matrix can be assigned a ParameterPort or MappingProjection
+        # (see _validate_params), use the current value of their matrix
+        from psyneulink.core.components.ports.parameterport import ParameterPort
+        from psyneulink.core.components.projections.pathway.mappingprojection import MappingProjection
+        error_matrix = self.parameters.error_matrix.get(context)
+        if isinstance(error_matrix, MappingProjection):
+            error_matrix = error_matrix._parameter_ports[MATRIX]
+        if isinstance(error_matrix, ParameterPort):
+            error_matrix = error_matrix.parameters.value.get(context)
+            error_matrix = np.asfarray(error_matrix)
+            if len(error_matrix) == 1:
+                error_matrix = error_matrix[0]
+            values[self._get_param_ids(context).index(ERROR_MATRIX)] = error_matrix.tolist()
+
+        return tuple(values)
+
+    def _gen_llvm_activation_derivative(self, ctx, builder, output):
+        # The derivative function is assigned as a Python callable;
+        # compile the ones that are known, using their current parameters
+        derivative_fct = getattr(self.activation_derivative_fct, '__self__', None)
+
+        def _get_fct_param(name):
+            val = getattr(derivative_fct.parameters, name).get()
+            return ctx.float_ty(np.asfarray(val).flat[0])
+
+        if isinstance(derivative_fct, Logistic) and self.activation_derivative_fct.__name__ == 'derivative':
+            # gain * scale * output * (1 - output)
+            val = builder.fsub(ctx.float_ty(1), output)
+            val = builder.fmul(val, output)
+            val = builder.fmul(val, _get_fct_param(SCALE))
+            return builder.fmul(val, _get_fct_param(GAIN))
+        elif isinstance(derivative_fct, Linear) and self.activation_derivative_fct.__name__ == 'derivative':
+            return _get_fct_param(SLOPE)
+
+        assert False, "Unsupported activation_derivative_fct for compiled {}: {}".format(
+            self.name, self.activation_derivative_fct)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        learning_rate = self._gen_llvm_learning_rate(ctx, builder, params)
+
+        zero = ctx.int32_ty(0)
+        activation_input = builder.gep(arg_in, [zero, ctx.int32_ty(LEARNING_ACTIVATION_INPUT)])
+        activation_output = builder.gep(arg_in, [zero, ctx.int32_ty(LEARNING_ACTIVATION_OUTPUT)])
+        error_signal = builder.gep(arg_in, [zero, ctx.int32_ty(LEARNING_ERROR_OUTPUT)])
+        weight_change_matrix = builder.gep(arg_out, [zero, zero])
+        dE_dW = builder.gep(arg_out, [zero, ctx.int32_ty(1)])
+
+        output_len = activation_output.type.pointee.count
+        error_len = error_signal.type.pointee.count
+
+        # error_matrix is (output_len x error_len); a single row is stored
+        # as a 1d array, so access it as a flat array of floats
+        error_matrix = ctx.get_param_ptr(self, builder, params, ERROR_MATRIX)
+        error_matrix = builder.bitcast(error_matrix, ctx.float_ty.as_pointer())
+
+        # Derivative of error with respect to output activity
+        dE_dA = builder.alloca(activation_output.type.pointee)
+        vxm_transposed = ctx.import_llvm_function("__pnl_builtin_vxm_transposed")
+        builder.call(vxm_transposed, [builder.gep(error_signal, [zero, zero]),
+                                      error_matrix,
+                                      ctx.int32_ty(output_len),
+                                      ctx.int32_ty(error_len),
+                                      builder.gep(dE_dA, [zero, zero])])
+
+        loss_function = self.loss_function
+        if loss_function is MSE:
+            loss_scale = 2 / error_len
+        elif loss_function is SSE:
+            loss_scale = 2
+        else:
+            loss_scale = None
+
+        # Chain rule to get the derivative of the error with respect to the weights
+        with pnlvm.helpers.array_ptr_loop(builder, dE_dA, "backprop_dE_dW") as (b1, idx):
+            val = b1.load(b1.gep(dE_dA, [zero, idx]))
+            if loss_scale is not None:
+                val = b1.fmul(val, ctx.float_ty(loss_scale))
+            output = b1.load(b1.gep(activation_output, [zero, idx]))
+            val = b1.fmul(val, self._gen_llvm_activation_derivative(ctx, b1, output))
+            b1.store(val, b1.gep(dE_dW, [zero, idx]))
+
+        # Weight changes = delta rule (learning rate * activity * error)
+        with pnlvm.helpers.array_ptr_loop(builder, weight_change_matrix, "backprop_rows") as (b1, row):
+            val = b1.load(b1.gep(activation_input, [zero, row]))
+            val = b1.fmul(val, learning_rate)
+            out_row = b1.gep(weight_change_matrix, [zero, row])
+            with pnlvm.helpers.array_ptr_loop(b1, out_row, "backprop_cols") as (b2, col):
+                error = b2.load(b2.gep(dE_dW, [zero, col]))
+                b2.store(b2.fmul(val, error), b2.gep(out_row, [zero, col]))
+
+        return builder
+
 
 class TDLearning(Reinforcement):
     """Implement temporal difference learning using the `Reinforcement` Function
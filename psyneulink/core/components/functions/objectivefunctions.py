@@ -843,6 +843,62 @@ class Distance(ObjectiveFunction):
         denom = np.sqrt(np.sum(v1_norm ** 2) * np.sum(v2_norm ** 2)) or EPSILON
         return np.sum(v1_norm * v2_norm) / denom
 
+    def _row_distances(self, v1, rows):
+        """Return the distances of vector *v1* from every row of 2d array *rows*.
+
+        The result is the same as calling the function with [v1, row] for each row, but all rows
+        are scored at once.  Returns None if the results would be converted to `output_type
+        <Function_Base.output_type>`, or if the metric can't be computed this way.
+        """
+        if self.enable_output_type_conversion and self.output_type is not None:
+            return None
+
+        metric = self.metric
+        v1 = np.asfarray(v1)
+        rows = np.asfarray(rows)
+
+        if metric == MAX_ABS_DIFF:
+            result = np.max(np.abs(v1 - rows), axis=1)
+
+        elif metric == DIFFERENCE:
+            result = np.sum(np.abs(v1 - rows), axis=1)
+
+        elif metric == NORMED_L0_SIMILARITY:
+            result = 1 - np.sum(np.abs(v1 - rows), axis=1) / 4
+
+        elif metric == EUCLIDEAN:
+            result = np.linalg.norm(rows - v1, axis=1)
+
+        elif metric == COSINE:
+            numer = np.sum(v1 * rows, axis=1)
+            denom = np.sqrt(np.sum(v1 ** 2)) * np.sqrt(np.sum(rows ** 2, axis=1))
+            return 1 - np.abs(numer / np.where(denom == 0, EPSILON, denom))
+
+        elif metric == CORRELATION:
+            v1_norm = v1 - np.mean(v1)
+            rows_norm = rows - np.mean(rows, axis=1, keepdims=True)
+            denom = np.sqrt(np.sum(v1_norm ** 2) * np.sum(rows_norm ** 2, axis=1))
+            return 1 - np.abs(np.sum(v1_norm * rows_norm, axis=1) / np.where(denom == 0, EPSILON, denom))
+
+        elif metric == CROSS_ENTROPY:
+            v1 = np.where(v1 == 0, EPSILON, v1)
+            rows = np.where(rows == 0, EPSILON, rows)
+            result = -np.sum(v1 * np.log(rows), axis=1)
+
+        elif metric == ENERGY:
+            result = -np.sum(v1 * rows, axis=1) / 2
+
+        else:
+            return None
+
+        if self.normalize and not metric in {MAX_ABS_DIFF, CORRELATION}:
+            if metric == ENERGY:
+                result /= len(v1) ** 2
+            else:
+                result /= len(v1)
+
+        return result
+
     def __gen_llvm_sum_difference(self, builder, index, ctx, v1, v2, acc):
         ptr1 = builder.gep(v1, [index])
         ptr2 = builder.gep(v2, [index])
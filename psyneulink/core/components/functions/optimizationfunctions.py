@@ -25,7 +25,9 @@ Functions that return the sample of a variable yielding the optimized value of a
 import warnings
 import sys
 # from fractions import Fraction
+import concurrent.futures
 import itertools
+import multiprocessing
 import numpy as np
 import typecheck as tc
 from numbers import Number
@@ -56,6 +58,11 @@ SEARCH_SPACE = 'search_space'
 SEARCH_TERMINATION_FUNCTION = 'search_termination_function'
 DIRECTION = 'direction'
 
+# (GridSearch, context) being evaluated by GridSearch._evaluate_grid_in_processes;  assigned before the worker
+# processes are forked, so that each inherits its own copy of the objective_function (and, for an
+# OptimizationControlMechanism, of its agent_rep) without having to pickle it
+_grid_search_in_processes = None
+
 class OptimizationFunctionError(Exception):
     def __init__(self, error_value):
         self.error_value = error_value
@@ -1098,6 +1105,8 @@ class GridSearch(OptimizationFunction):
         max_iterations=1000,         \
         save_samples=False,          \
         save_values=False,           \
+        num_processes=None,          \
+        num_threads=None,            \
         params=None,                 \
         owner=None,                  \
         prefs=None                   \
@@ -1126,6 +1135,34 @@ class GridSearch(OptimizationFunction):
     samples evaluated and their values if either `save_samples <GridSearch.save_samples>` or `save_values
     <GridSearch.save_values>` is `True`, respectively.
 
+    .. _GridSearch_Parallel:
+
+    **Parallel Evaluation**
+
+    If `num_processes <GridSearch.num_processes>` is greater than 1, the samples in `search_space
+    <GridSearch.search_space>` are divided into contiguous chunks that are evaluated by that many worker processes.
+    The workers are forked from the current process each time `function <GridSearch.function>` is executed, so that
+    each has its own copy of the `objective_function <GridSearch.objective_function>` (including, for an
+    `OptimizationControlMechanism`, its `agent_rep <OptimizationControlMechanism.agent_rep>`) in its current state,
+    and receives only the indices of the samples it evaluates.  The values are returned in the same order as they would
+    be evaluated serially, so the sample returned is the same (unless `objective_function
+    <GridSearch.objective_function>` is stochastic).  However, any changes the `objective_function
+    <GridSearch.objective_function>` makes to its own state (e.g., the results of simulations) are not retained.
+    Parallel evaluation requires the *fork* start method of `multiprocessing`;  where it is not available (e.g.,
+    on Windows), a warning is issued and the samples are evaluated serially.
+
+    If `num_threads <GridSearch.num_threads>` is greater than 1, the compiled version of `function
+    <GridSearch.function>` (used when a Composition is executed with **bin_execute** set to an LLVM mode) divides the
+    samples in the same way among that many threads.  Each thread has its own copy of the state of `objective_function
+    <GridSearch.objective_function>`, and its own random number generator (seeded from `random_state
+    <GridSearch.random_state>`) that it uses to choose among samples that yield equally optimal values if
+    **select_randomly_from_optimal_values** is True.  The optimal samples from the threads are then combined in order,
+    so that the sample returned is the same as for serial evaluation if **select_randomly_from_optimal_values** is
+    False, and otherwise is again chosen with equal probability from all of the optimal samples.  As for processes,
+    changes that `objective_function <GridSearch.objective_function>` makes to its own state are not retained.  The
+    number of threads is fixed when `function <GridSearch.function>` is compiled, and threads are only used when it
+    is compiled for the CPU.
+
     Arguments
     ---------
 
@@ -1159,6 +1196,15 @@ class GridSearch(OptimizationFunction):
         specifies whether or not to save and return the values of `objective_function <GridSearch.objective_function>`
         for all samples evaluated in the `optimization process <GridSearch_Procedure>`.
 
+    num_processes : int : default None
+        specifies the number of processes used to evaluate the samples in `search_space <GridSearch.search_space>`
+        (see `GridSearch_Parallel`);  if None or 1, they are evaluated serially in the current process.
+
+    num_threads : int : default None
+        specifies the number of threads used to evaluate the samples in `search_space <GridSearch.search_space>` when
+        `function <GridSearch.function>` is compiled (see `GridSearch_Parallel`);  if None or 1, they are evaluated
+        serially.
+
     Attributes
     ----------
 
@@ -1200,6 +1246,14 @@ class GridSearch(OptimizationFunction):
     save_values : bool
         determines whether or not to save and return the value of `objective_function
         <GridSearch.objective_function>` for all samples evaluated in the `optimization process <GridSearch_Procedure>`.
+
+    num_processes : int
+        determines the number of processes used to evaluate the samples in `search_space <GridSearch.search_space>`
+        (see `GridSearch_Parallel`).
+
+    num_threads : int
+        determines the number of threads used to evaluate the samples in `search_space <GridSearch.search_space>` when
+        `function <GridSearch.function>` is compiled (see `GridSearch_Parallel`).
     """
 
     componentName = GRID_SEARCH_FUNCTION
@@ -1221,6 +1275,18 @@ class GridSearch(OptimizationFunction):
                     :default value: None
                     :type:
 
+                num_processes
+                    see `num_processes <GridSearch.num_processes>`
+
+                    :default value: None
+                    :type:
+
+                num_threads
+                    see `num_threads <GridSearch.num_threads>`
+
+                    :default value: None
+                    :type:
+
                 random_state
                     see `random_state <GridSearch.random_state>`
 
@@ -1241,6 +1307,8 @@ class GridSearch(OptimizationFunction):
 
         """
         grid = Parameter(None)
+        num_processes = Parameter(None, stateful=False, loggable=False)
+        num_threads = Parameter(None, stateful=False, loggable=False)
         save_samples = Parameter(True, pnl_internal=True)
         save_values = Parameter(True, pnl_internal=True)
         random_state = Parameter(None, stateful=True, loggable=False)
@@ -1259,6 +1327,8 @@ class GridSearch(OptimizationFunction):
                  # tolerance=0.,
                  select_randomly_from_optimal_values=False,
                  seed=None,
+                 num_processes:tc.optional(int)=None,
+                 num_threads:tc.optional(int)=None,
                  params=None,
                  owner=None,
                  prefs=None,
@@ -1291,6 +1361,8 @@ class GridSearch(OptimizationFunction):
             save_values=True,
             random_state=random_state,
             direction=direction,
+            num_processes=num_processes,
+            num_threads=num_threads,
             params=params,
             owner=owner,
             prefs=prefs,
@@ -1460,6 +1532,133 @@ class GridSearch(OptimizationFunction):
             val[0] = [0.0] * len(self.search_space)
         return ctx.convert_python_struct_to_llvm_ir((val[0], val[1]))
 
+    def _get_llvm_search_dim_size(self, ctx, builder, dimension):
+        if isinstance(dimension.type.pointee, pnlvm.ir.ArrayType):
+            return ctx.int32_ty(len(dimension.type.pointee))
+        elif isinstance(dimension.type.pointee, pnlvm.ir.LiteralStructType):
+            assert len(dimension.type.pointee) == 3
+            num_ptr = builder.gep(dimension, [ctx.int32_ty(0), ctx.int32_ty(2)])
+            return builder.load(num_ptr)
+        else:
+            assert False, "Unknown dimension type: {}".format(dimension.type)
+
+    def _get_llvm_search_space_size(self, ctx, builder, search_space_ptr):
+        size = ctx.int32_ty(1)
+        for i in range(len(search_space_ptr.type.pointee)):
+            dimension = builder.gep(search_space_ptr, [ctx.int32_ty(0), ctx.int32_ty(i)])
+            size = builder.mul(size, self._get_llvm_search_dim_size(ctx, builder, dimension))
+        return size
+
+    def _gen_llvm_load_sample(self, ctx, builder, search_space_ptr, sample_ptr, index):
+        # Samples are numbered in the order they are generated by nested
+        # loops over the dimensions, the last dimension changes the fastest.
+        for i in reversed(range(len(search_space_ptr.type.pointee))):
+            dimension = builder.gep(search_space_ptr, [ctx.int32_ty(0), ctx.int32_ty(i)])
+            arg_elem = builder.gep(sample_ptr, [ctx.int32_ty(0), ctx.int32_ty(i)])
+            num = self._get_llvm_search_dim_size(ctx, builder, dimension)
+            idx = builder.urem(index, num)
+            index = builder.udiv(index, num)
+            if isinstance(dimension.type.pointee, pnlvm.ir.ArrayType):
+                alloc_elem = builder.gep(dimension, [ctx.int32_ty(0), idx])
+                builder.store(builder.load(alloc_elem), arg_elem)
+            else:
+                start_ptr = builder.gep(dimension, [ctx.int32_ty(0), ctx.int32_ty(0)])
+                step_ptr = builder.gep(dimension, [ctx.int32_ty(0), ctx.int32_ty(1)])
+                start = builder.load(start_ptr)
+                step = builder.load(step_ptr)
+                val = builder.uitofp(idx, start.type)
+                val = builder.fmul(val, step)
+                val = builder.fadd(val, start)
+                builder.store(val, arg_elem)
+
+    def _gen_llvm_update_optimum(self, ctx, builder, value, sample, weight, min_value_ptr, min_sample_ptr,
+                                 opt_count_ptr, replace_ptr, select_random, random_state):
+        """Replace the optimum with **value** and **sample** if **value** is better;  if it is (close to) equal, and
+        **select_random** is set, replace it with probability **weight** / (total weight of equal values) so that
+        each of them is equally likely to be selected (reservoir sampling).
+        """
+        # Check if smaller than current best.
+        # This will also set 'replace' if min_value is NaN.
+        min_value = builder.load(min_value_ptr)
+        # KDM 8/22/19: nonstateful direction here - OK?
+        direction = "<" if self.direction is MINIMIZE else ">"
+        replace = builder.fcmp_unordered(direction, value, min_value)
+        builder.store(replace, replace_ptr)
+
+        # Python does "is_close" check first.
+        # This implements reservoir sampling
+        with builder.if_then(select_random):
+            close = pnlvm.helpers.is_close(builder, value, min_value)
+            with builder.if_else(close) as (tb, eb):
+                with tb:
+                    opt_count = builder.load(opt_count_ptr)
+                    opt_count = builder.fadd(opt_count, weight)
+                    prob = builder.fdiv(weight, opt_count)
+                    # reuse opt_count location. it will be overwritten later anyway
+                    res_ptr = opt_count_ptr
+                    rand_f = ctx.import_llvm_function("__pnl_builtin_mt_rand_double")
+                    builder.call(rand_f, [random_state, res_ptr])
+                    res = builder.load(res_ptr)
+                    builder.store(opt_count, opt_count_ptr)
+                    replace = builder.fcmp_ordered("<", res, prob)
+                    builder.store(replace, replace_ptr)
+                with eb:
+                    # we need to reset the counter if we are replacing with new best value
+                    with builder.if_then(builder.load(replace_ptr)):
+                        builder.store(weight, opt_count_ptr)
+
+        with builder.if_then(builder.load(replace_ptr)):
+            builder.store(value, min_value_ptr)
+            builder.store(sample, min_sample_ptr)
+
+    def _gen_llvm_search_range(self, ctx, builder, obj_func, start, stop, obj_param_ptr, obj_state_ptr,
+                               search_space_ptr, select_random, random_state, extra_args,
+                               min_sample_ptr, min_value_ptr, opt_count_ptr):
+        sample_ptr = builder.alloca(min_sample_ptr.type.pointee)
+        value_ptr = builder.alloca(min_value_ptr.type.pointee)
+        replace_ptr = builder.alloca(pnlvm.ir.IntType(1))
+
+        # Use NaN here. fcmp_unordered below returns true if one of the
+        # operands is a NaN. This makes sure we always set min_*
+        # in the first iteration
+        builder.store(min_value_ptr.type.pointee("NaN"), min_value_ptr)
+        builder.store(opt_count_ptr.type.pointee(0), opt_count_ptr)
+
+        with pnlvm.helpers.for_loop(builder, start, stop, stop.type(1), "grid_loop") as (b, idx):
+            self._gen_llvm_load_sample(ctx, b, search_space_ptr, sample_ptr, idx)
+
+            # sample_ptr is setup for execution
+            b.call(obj_func, [obj_param_ptr, obj_state_ptr, sample_ptr,
+                              value_ptr] + extra_args)
+
+            self._gen_llvm_update_optimum(ctx, b, b.load(value_ptr), b.load(sample_ptr),
+                                          opt_count_ptr.type.pointee(1), min_value_ptr, min_sample_ptr,
+                                          opt_count_ptr, replace_ptr, select_random, random_state)
+
+    def _gen_llvm_search_worker(self, ctx, obj_func, closure_t):
+        """Generate a thread start routine that searches the range of samples described by its closure"""
+        void_ptr_ty = pnlvm.ir.IntType(8).as_pointer()
+        worker_ty = pnlvm.ir.FunctionType(void_ptr_ty, [void_ptr_ty])
+        worker = pnlvm.ir.Function(ctx.module, worker_ty, name=ctx.get_unique_name(str(self) + "_search_worker"))
+        builder = pnlvm.ir.IRBuilder(worker.append_basic_block(name="entry"))
+
+        closure = builder.bitcast(worker.args[0], closure_t.as_pointer())
+
+        def _get_field(i):
+            return builder.gep(closure, [ctx.int32_ty(0), ctx.int32_ty(i)])
+
+        start, stop, obj_param_ptr, search_space_ptr, select_random = \
+            (builder.load(_get_field(i)) for i in range(5))
+        obj_state_ptr, random_state, min_sample_ptr, min_value_ptr, opt_count_ptr = \
+            (_get_field(i) for i in range(5, 10))
+        extra_args = [builder.load(_get_field(i)) for i in range(10, len(closure_t))]
+
+        self._gen_llvm_search_range(ctx, builder, obj_func, start, stop, obj_param_ptr, obj_state_ptr,
+                                    search_space_ptr, select_random, random_state, extra_args,
+                                    min_sample_ptr, min_value_ptr, opt_count_ptr)
+        builder.ret(void_ptr_ty(None))
+        return worker
+
     def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out):
         ocm = getattr(self.objective_function, '__self__', None)
         if ocm is not None:
@@ -1476,8 +1675,6 @@ class GridSearch(OptimizationFunction):
 
         min_sample_ptr = builder.alloca(sample_t)
         min_value_ptr = builder.alloca(value_t)
-        sample_ptr = builder.alloca(sample_t)
-        value_ptr = builder.alloca(value_t)
 
         random_state = ctx.get_state_ptr(self, builder, state,
                                          self.parameters.random_state.name)
@@ -1492,79 +1689,19 @@ class GridSearch(OptimizationFunction):
         select_random = builder.trunc(builder.load(select_random_ptr), pnlvm.ir.IntType(1))
 
         opt_count_ptr = builder.alloca(ctx.float_ty)
-        builder.store(opt_count_ptr.type.pointee(0), opt_count_ptr)
-        replace_ptr = builder.alloca(pnlvm.ir.IntType(1))
 
-        # Use NaN here. fcmp_unordered below returns true if one of the
-        # operands is a NaN. This makes sure we always set min_*
-        # in the first iteration
-        builder.store(min_value_ptr.type.pointee("NaN"), min_value_ptr)
-
-        b = builder
-        with contextlib.ExitStack() as stack:
-            for i in range(len(search_space_ptr.type.pointee)):
-                dimension = b.gep(search_space_ptr, [ctx.int32_ty(0), ctx.int32_ty(i)])
-                arg_elem = b.gep(sample_ptr, [ctx.int32_ty(0), ctx.int32_ty(i)])
-                if isinstance(dimension.type.pointee,  pnlvm.ir.ArrayType):
-                    b, idx = stack.enter_context(pnlvm.helpers.array_ptr_loop(b, dimension, "loop_" + str(i)))
-                    alloc_elem = b.gep(dimension, [ctx.int32_ty(0), idx])
-                    b.store(b.load(alloc_elem), arg_elem)
-                elif isinstance(dimension.type.pointee, pnlvm.ir.LiteralStructType):
-                    assert len(dimension.type.pointee) == 3
-                    start_ptr = b.gep(dimension, [ctx.int32_ty(0), ctx.int32_ty(0)])
-                    step_ptr = b.gep(dimension, [ctx.int32_ty(0), ctx.int32_ty(1)])
-                    num_ptr = b.gep(dimension, [ctx.int32_ty(0), ctx.int32_ty(2)])
-                    start = b.load(start_ptr)
-                    step = b.load(step_ptr)
-                    num = b.load(num_ptr)
-                    b, idx = stack.enter_context(pnlvm.helpers.for_loop_zero_inc(b, num, "loop_" + str(i)))
-                    val = b.uitofp(idx, start.type)
-                    val = b.fmul(val, step)
-                    val = b.fadd(val, start)
-                    b.store(val, arg_elem)
-                else:
-                    assert False, "Unknown dimension type: {}".format(dimension.type)
-
-            # We are in the inner most loop now with sample_ptr setup for execution
-            b.call(obj_func, [obj_param_ptr, obj_state_ptr, sample_ptr,
-                              value_ptr] + extra_args)
-
-            # Check if smaller than current best.
-            # This will also set 'replace' if min_value is NaN.
-            value = b.load(value_ptr)
-            min_value = b.load(min_value_ptr)
-            # KDM 8/22/19: nonstateful direction here - OK?
-            direction = "<" if self.direction is MINIMIZE else ">"
-            replace = b.fcmp_unordered(direction, value, min_value)
-            b.store(replace, replace_ptr)
-
-            # Python does "is_close" check first.
-            # This implements reservoir sampling
-            with b.if_then(select_random):
-                close = pnlvm.helpers.is_close(b, value, min_value)
-                with b.if_else(close) as (tb, eb):
-                    with tb:
-                        opt_count = b.load(opt_count_ptr)
-                        opt_count = b.fadd(opt_count, opt_count.type(1))
-                        prob = b.fdiv(opt_count.type(1), opt_count)
-                        # reuse opt_count location. it will be overwritten later anyway
-                        res_ptr = opt_count_ptr
-                        rand_f = ctx.import_llvm_function("__pnl_builtin_mt_rand_double")
-                        b.call(rand_f, [random_state, res_ptr])
-                        res = b.load(res_ptr)
-                        b.store(opt_count, opt_count_ptr)
-                        replace = b.fcmp_ordered("<", res, prob)
-                        b.store(replace, replace_ptr)
-                    with eb:
-                        # we need to reset the counter if we are replacing with new best value
-                        with b.if_then(b.load(replace_ptr)):
-                            b.store(opt_count_ptr.type.pointee(1), opt_count_ptr)
-
-            with b.if_then(b.load(replace_ptr)):
-                b.store(b.load(value_ptr), min_value_ptr)
-                b.store(b.load(sample_ptr), min_sample_ptr)
-
-            builder = b
+        num_samples = self._get_llvm_search_space_size(ctx, builder, search_space_ptr)
+        # The number of threads is fixed when the function is compiled, and
+        # only CPU code can start threads.
+        num_threads = self.parameters.num_threads.get()
+        if num_threads is None or num_threads <= 1:
+            self._gen_llvm_search_range(ctx, builder, obj_func, num_samples.type(0), num_samples,
+                                        obj_param_ptr, obj_state_ptr, search_space_ptr, select_random,
+                                        random_state, extra_args, min_sample_ptr, min_value_ptr, opt_count_ptr)
+        else:
+            self._gen_llvm_parallel_search(ctx, builder, obj_func, num_threads, num_samples,
+                                           obj_param_ptr, obj_state_ptr, search_space_ptr, select_random,
+                                           random_state, extra_args, min_sample_ptr, min_value_ptr, opt_count_ptr)
 
         # Produce output
         out_sample_ptr = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0)])
@@ -1573,6 +1710,95 @@ class GridSearch(OptimizationFunction):
         builder.store(builder.load(min_value_ptr), out_value_ptr)
         return builder
 
+    def _gen_llvm_parallel_search(self, ctx, builder, obj_func, num_threads, num_samples,
+                                  obj_param_ptr, obj_state_ptr, search_space_ptr, select_random,
+                                  random_state, extra_args, min_sample_ptr, min_value_ptr, opt_count_ptr):
+        """Divide the samples into **num_threads** contiguous ranges, search each of them in its own thread, and
+        select the optimum of the results (see `GridSearch_Parallel`).
+        """
+        # Each thread gets its own copy of the objective function state and
+        # random state, and returns the optimum of its range of samples, with
+        # the number of samples that were (close to) equal to it.
+        closure_t = pnlvm.ir.LiteralStructType([ctx.int32_ty, ctx.int32_ty,
+                                                obj_param_ptr.type, search_space_ptr.type,
+                                                select_random.type,
+                                                obj_state_ptr.type.pointee, random_state.type.pointee,
+                                                min_sample_ptr.type.pointee, min_value_ptr.type.pointee,
+                                                opt_count_ptr.type.pointee] +
+                                               [a.type for a in extra_args])
+        worker = self._gen_llvm_search_worker(ctx, obj_func, closure_t)
+        thread_create = ctx.get_builtin("thread_create")
+        thread_join = ctx.get_builtin("thread_join")
+        rand_int = ctx.import_llvm_function("__pnl_builtin_mt_rand_int32")
+        rand_init = ctx.import_llvm_function("__pnl_builtin_mt_rand_init")
+
+        closures = builder.alloca(pnlvm.ir.ArrayType(closure_t, num_threads))
+        handles = builder.alloca(pnlvm.ir.ArrayType(thread_create.args[2].type.pointee, num_threads))
+        started = builder.alloca(pnlvm.ir.ArrayType(pnlvm.ir.IntType(1), num_threads))
+        seed_ptr = builder.alloca(rand_int.args[1].type.pointee)
+        replace_ptr = builder.alloca(pnlvm.ir.IntType(1))
+
+        # Round up so that the last range is not longer than the others
+        range_size = builder.add(num_samples, num_samples.type(num_threads - 1))
+        range_size = builder.udiv(range_size, num_samples.type(num_threads))
+
+        def _get_field(closure, i):
+            return builder.gep(closure, [ctx.int32_ty(0), ctx.int32_ty(i)])
+
+        for t in range(num_threads):
+            closure = builder.gep(closures, [ctx.int32_ty(0), ctx.int32_ty(t)])
+            start = pnlvm.helpers.uint_min(builder, builder.mul(range_size, range_size.type(t)), num_samples)
+            stop = pnlvm.helpers.uint_min(builder, builder.add(start, range_size), num_samples)
+            for i, val in enumerate([start, stop, obj_param_ptr, search_space_ptr, select_random]):
+                builder.store(val, _get_field(closure, i))
+            builder.store(builder.load(obj_state_ptr), _get_field(closure, 5))
+            for i, val in enumerate(extra_args, 10):
+                builder.store(val, _get_field(closure, i))
+
+            # Seed each thread's random stream from the main one
+            builder.call(rand_int, [random_state, seed_ptr])
+            seed = builder.trunc(builder.load(seed_ptr), rand_init.args[1].type)
+            builder.call(rand_init, [_get_field(closure, 6), seed])
+
+        void_ptr_ty = worker.args[0].type
+        for t in range(1, num_threads):
+            closure = builder.gep(closures, [ctx.int32_ty(0), ctx.int32_ty(t)])
+            handle_ptr = builder.gep(handles, [ctx.int32_ty(0), ctx.int32_ty(t)])
+            res = builder.call(thread_create, [worker, builder.bitcast(closure, void_ptr_ty), handle_ptr])
+            is_started = builder.icmp_signed("==", res, res.type(0))
+            builder.store(is_started, builder.gep(started, [ctx.int32_ty(0), ctx.int32_ty(t)]))
+            # Search the range in this thread if we failed to start one
+            with builder.if_then(builder.not_(is_started)):
+                builder.call(worker, [builder.bitcast(closure, void_ptr_ty)])
+
+        # The first range is searched in this thread
+        closure = builder.gep(closures, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        builder.call(worker, [builder.bitcast(closure, void_ptr_ty)])
+
+        for t in range(1, num_threads):
+            is_started = builder.load(builder.gep(started, [ctx.int32_ty(0), ctx.int32_ty(t)]))
+            with builder.if_then(is_started):
+                handle = builder.load(builder.gep(handles, [ctx.int32_ty(0), ctx.int32_ty(t)]))
+                builder.call(thread_join, [handle])
+
+        # Combine the results in the order of the ranges. Ties between ranges
+        # are resolved with the main random stream, each range is weighted by
+        # the number of samples that tied in it, so every optimal sample is
+        # equally likely to be selected.
+        builder.store(min_value_ptr.type.pointee("NaN"), min_value_ptr)
+        builder.store(opt_count_ptr.type.pointee(0), opt_count_ptr)
+        for t in range(num_threads):
+            closure = builder.gep(closures, [ctx.int32_ty(0), ctx.int32_ty(t)])
+            start = builder.load(_get_field(closure, 0))
+            stop = builder.load(_get_field(closure, 1))
+            # Skip empty ranges, their result is NaN
+            with builder.if_then(builder.icmp_unsigned("<", start, stop)):
+                self._gen_llvm_update_optimum(ctx, builder, builder.load(_get_field(closure, 8)),
+                                              builder.load(_get_field(closure, 7)),
+                                              builder.load(_get_field(closure, 9)),
+                                              min_value_ptr, min_sample_ptr, opt_count_ptr, replace_ptr,
+                                              select_random, random_state)
+
     def _function(self,
                  variable=None,
                  context=None,
@@ -1698,11 +1924,15 @@ class GridSearch(OptimizationFunction):
                 "PROGRAM ERROR: bad value for {} arg of {}: {}". \
                     format(repr(DIRECTION), self.name, direction)
 
-            last_sample, last_value, all_samples, all_values = super()._function(
-                variable=variable,
-                context=context,
-                params=params,
-            )
+            num_processes = self.parameters.num_processes._get(context)
+            if num_processes is not None and num_processes > 1 and not self.is_initializing:
+                all_samples, all_values = self._evaluate_grid_in_processes(num_processes, context)
+            else:
+                last_sample, last_value, all_samples, all_values = super()._function(
+                    variable=variable,
+                    context=context,
+                    params=params,
+                )
 
             optimal_value_count = 1
             value_sample_pairs = zip(all_values, all_samples)
@@ -1733,6 +1963,52 @@ class GridSearch(OptimizationFunction):
 
         return sample_optimal, value_optimal, return_all_samples, return_all_values
 
+    def _evaluate_grid_in_processes(self, num_processes, context=None):
+        """Evaluate `objective_function <GridSearch.objective_function>` for all samples in `grid <GridSearch.grid>`
+        using **num_processes** worker processes (see `GridSearch_Parallel`).
+
+        Returns
+        -------
+
+        samples, values : list, list
+            all of the samples in the order they would be evaluated serially, and the corresponding values of
+            `objective_function <GridSearch.objective_function>`.
+        """
+        global _grid_search_in_processes
+
+        num_samples = self.num_iterations
+        max_iterations = self.parameters.max_iterations._get(context)
+        if max_iterations and num_samples > max_iterations:
+            warnings.warn("{} failed to converge after {} iterations".format(self.name, max_iterations))
+            num_samples = max_iterations
+
+        samples = list(itertools.islice(self.grid, num_samples))
+
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            warnings.warn("{} cannot evaluate its {} in parallel on this platform ({}); "
+                          "evaluating serially.".format(self.name, repr(SEARCH_SPACE), sys.platform))
+            values = [call_with_pruned_args(self.objective_function, sample, context=context) for sample in samples]
+        else:
+            chunk_size = -(-num_samples // num_processes)
+            chunks = [(start, min(start + chunk_size, num_samples)) for start in range(0, num_samples, chunk_size)]
+
+            _grid_search_in_processes = (self, context)
+            try:
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=len(chunks),
+                    mp_context=multiprocessing.get_context('fork')
+                ) as executor:
+                    values = list(itertools.chain.from_iterable(executor.map(_evaluate_grid_chunk, chunks)))
+            finally:
+                _grid_search_in_processes = None
+
+        if self.parameters.save_samples._get(context):
+            self.parameters.saved_samples._set(samples, context)
+        if self.parameters.save_values._get(context):
+            self.parameters.saved_values._set(values, context)
+
+        return samples, values
+
     def _traverse_grid(self, variable, sample_num, context=None):
         """Get next sample from grid.
         This is assigned as the `search_function <OptimizationFunction.search_function>` of the `OptimizationFunction`.
@@ -1759,6 +2035,21 @@ class GridSearch(OptimizationFunction):
             return True
 
 
+def _evaluate_grid_chunk(chunk):
+    """Evaluate the objective_function of the GridSearch in _grid_search_in_processes for the samples of its grid
+    in the range specified by **chunk** (start, stop);  run in a worker process forked by
+    GridSearch._evaluate_grid_in_processes.
+    """
+    grid_search, context = _grid_search_in_processes
+    start, stop = chunk
+
+    grid_search.reset_grid()
+    return [
+        call_with_pruned_args(grid_search.objective_function, sample, context=context)
+        for sample in itertools.islice(grid_search.grid, start, stop)
+    ]
+
+
 class GaussianProcess(OptimizationFunction):
     """
     GaussianProcess(                 \
@@ -22,11 +22,15 @@ Functions that store and can return a record of their input.
 
 """
 
+import itertools
+import json
+import os
 from collections import deque, OrderedDict
 
 import numpy as np
 import typecheck as tc
 import warnings
+import weakref
 
 from psyneulink.core import llvm as pnlvm
 
@@ -50,6 +54,120 @@ class MemoryFunction(StatefulFunction):  # -------------------------------------
     componentType = MEMORY_FUNCTION
 
 
+class _RingBuffer:
+    """Items stored by a `Buffer`, kept in a preallocated array that is used as a ring buffer.
+
+    Rate and noise are not applied to the stored items on every call.  Instead, each item is kept as w, and its
+    current value is scale * (w + offset), where scale is the product of the rates applied since the buffer was last
+    rebased and offset is the sum of the noise applied, each divided by the scale at the time it was applied;  applying
+    rate and noise only updates scale and offset, and the items are computed when they are read.  The buffer is
+    rebased (w is replaced by the current values of the items, and scale and offset are reset) when scale becomes too
+    small or too large for the items to be computed precisely.
+
+    Supports the deque operations used on `previous_value <Buffer.previous_value>`, and is converted by numpy to an
+    array of the current values of the items (oldest first).
+    """
+    _min_scale = 1e-6
+    _max_scale = 1e6
+    _min_capacity = 16
+
+    def __init__(self, items=(), maxlen=None):
+        self.maxlen = maxlen
+        self._items = None
+        self._start = 0
+        self._count = 0
+        self._scale = 1.0
+        self._offset = 0.0
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __getitem__(self, index):
+        return self.materialize()[index]
+
+    def __array__(self, dtype=None, copy=None):
+        items = self.materialize()
+        return items if dtype is None else items.astype(dtype)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.materialize().tolist()}, maxlen={self.maxlen})'
+
+    def _stored(self):
+        end = self._start + self._count
+        if end <= len(self._items):
+            return self._items[self._start:end]
+        return np.concatenate((self._items[self._start:], self._items[:end - len(self._items)]))
+
+    def _rebase(self, items):
+        self._items[:self._count] = items
+        self._start = 0
+        self._scale = 1.0
+        self._offset = 0.0
+
+    def materialize(self):
+        """Return an array of the current values of the items, oldest first."""
+        if self._items is None:
+            return np.array([])
+        return self._scale * (self._stored() + self._offset)
+
+    def append(self, item):
+        """Add **item**, deleting the oldest item if that would exceed maxlen."""
+        if self.maxlen == 0:
+            return
+
+        item = np.asfarray(item)
+        if self._items is None:
+            capacity = self._min_capacity if self.maxlen is None else min(self.maxlen, self._min_capacity)
+            self._items = np.empty((capacity,) + item.shape)
+        elif item.shape != self._items.shape[1:]:
+            if item.size != self._items[0].size:
+                raise FunctionError(f"Items stored by a {Buffer.__name__} must all have the same shape "
+                                    f"({self._items.shape[1:]}; got {item.shape}).")
+            item = item.reshape(self._items.shape[1:])
+
+        capacity = len(self._items)
+        if self._count == capacity:
+            if self._count == self.maxlen:
+                # Replace the oldest item
+                self._items[self._start] = item / self._scale - self._offset
+                self._start = (self._start + 1) % capacity
+                return
+            capacity = 2 * capacity if self.maxlen is None else min(2 * capacity, self.maxlen)
+            items = np.empty((capacity,) + self._items.shape[1:])
+            items[:self._count] = self._stored()
+            self._items = items
+            self._start = 0
+
+        self._items[(self._start + self._count) % capacity] = item / self._scale - self._offset
+        self._count += 1
+
+    def decay(self, rate, noise):
+        """Multiply the current values of the items by **rate** and add **noise** to them."""
+        if self._count == 0:
+            return
+
+        scale = self._scale * rate
+        if np.any(np.abs(scale) < self._min_scale) or np.any(np.abs(scale) > self._max_scale):
+            self._rebase(self.materialize())
+            scale = rate
+            if np.any(np.abs(scale) < self._min_scale) or np.any(np.abs(scale) > self._max_scale):
+                # e.g., a rate of 0, which can't be applied lazily
+                self._rebase(self._stored() * rate + noise)
+                return
+
+        self._scale = scale
+        self._offset = self._offset + noise / scale
+
+    def clear(self):
+        """Delete all items."""
+        self.__init__(maxlen=self.maxlen)
+
+
 class Buffer(MemoryFunction):  # ------------------------------------------------------------------------------
     """
     Buffer(                     \
@@ -84,6 +202,10 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
     If the length of the result exceeds `history <Buffer.history>`, delete the first item.
     Return `previous_value <Buffer.previous_value>` appended with `variable <Buffer.variable>`.
 
+    The items are stored in a preallocated array that is used as a ring buffer, and **rate** and **noise** are
+    accumulated and applied to them only when they are read, so that the time a call takes does not depend on the
+    number of items stored (other than to return them).
+
     Arguments
     ---------
 
@@ -145,8 +267,9 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
         if the **new_previous_value** argument is not specified in the call to `reinitialize
         <StatefulFUnction.reinitialize>`.
 
-    previous_value : 1d array : default class_defaults.variable
-        state of the deque prior to appending `variable <Buffer.variable>` in the current call.
+    previous_value : deque-like : default class_defaults.variable
+        state of the deque prior to appending `variable <Buffer.variable>` in the current call;  it supports ``len``,
+        iteration and indexing, and ``numpy.asarray`` converts it to an array of the items in the deque.
 
     owner : Component
         `component <Component>` to which the Function has been assigned.
@@ -233,7 +356,7 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
 
     def _initialize_previous_value(self, initializer, context=None):
         initializer = initializer or []
-        previous_value = deque(initializer, maxlen=self.parameters.history.get(context))
+        previous_value = _RingBuffer(initializer, maxlen=self.parameters.history.get(context))
 
         self.parameters.previous_value.set(previous_value, context, override=True)
 
@@ -284,11 +407,26 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
             value = deque([], maxlen=self.parameters.history.get(context))
 
         else:
-            value = self._initialize_previous_value(reinitialization_value, context=context)
+            value = self._initialize_previous_value(reinitialization_value, context=context).materialize()
 
         self.parameters.value.set(value, context, override=True)
         return value
 
+    def _get_ring_buffer(self, context):
+        """Return the _RingBuffer in `previous_value <Buffer.previous_value>` for **context**, replacing any other
+        value of previous_value (e.g., one assigned directly) with one that contains the same items.
+        """
+        history = self.parameters.history._get(context)
+        previous_value = self.parameters.previous_value._get(context)
+        if isinstance(previous_value, _RingBuffer) and previous_value.maxlen == history:
+            return previous_value
+
+        if previous_value is None:
+            previous_value = self.get_previous_value(context)
+        previous_value = _RingBuffer(previous_value if previous_value is not None else [], maxlen=history)
+        self.parameters.previous_value._set(previous_value, context)
+        return previous_value
+
     def _function(self,
                  variable=None,
                  context=None,
@@ -310,7 +448,7 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
         Returns
         -------
 
-        updated value of deque : deque
+        updated value of deque : 2d array
 
         """
         rate = np.array(self.get_current_function_param(RATE, context)).astype(float)
@@ -323,18 +461,15 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
         if self.is_initializing:
             return variable
 
-        previous_value = self.get_previous_value(context)
+        # The stored items are updated in place, rather than assigning a new previous_value
+        previous_value = self._get_ring_buffer(context)
 
         # Apply rate and/or noise, if they are specified, to all stored items
-        if len(previous_value):
-            previous_value = previous_value * rate + noise
-
-        previous_value = deque(previous_value, maxlen=self.parameters.history._get(context))
+        previous_value.decay(rate, noise)
 
         previous_value.append(variable)
 
-        self.parameters.previous_value._set(previous_value, context)
-        return self.convert_output_type(previous_value)
+        return self.convert_output_type(previous_value.materialize())
 
 
 RETRIEVAL_PROB = 'retrieval_prob'
@@ -344,6 +479,194 @@ SELECTION_FUNCTION = 'selection_function'
 KEYS = 0
 VALS = 1
 
+# files in a directory to which the memory of a ContentAddressableMemory is saved
+MEMORY_KEYS_FILE = 'keys.npy'
+MEMORY_VALS_FILE = 'values.npy'
+MEMORY_METADATA_FILE = 'metadata.json'
+MEMORY_FORMAT_VERSION = 1
+
+
+def _row_view(rows):
+    """Return the array that 2d array **rows** is a view of the rows of (**rows** itself if none) and its first row."""
+    base = rows.base
+    if isinstance(base, np.ndarray) and base.ndim == 2 and rows.ndim == 2 and rows.strides == base.strides:
+        return base, (rows.__array_interface__['data'][0] - base.__array_interface__['data'][0]) // base.strides[0]
+    return rows, 0
+
+
+class _RowBuffers:
+    """Preallocated, growable 2d arrays of equal length rows.
+
+    Memory contents are views of rows of a buffer.  Appending a row to the view that ends at the last row written to
+    its buffer writes the row in place and returns a view that is one row longer; rows covered by the previous view
+    are not modified, so earlier contents (e.g., in other execution contexts) remain valid.  Appending to any other
+    array copies its rows to a new buffer with spare capacity.
+    """
+    _min_capacity = 16
+
+    def __init__(self):
+        # id of buffer: [weak reference to buffer, number of rows written]
+        self._ends = {}
+
+    def __reduce__(self):
+        # Buffers are not shared with copies
+        return (self.__class__, ())
+
+    def _track(self, buffer, end):
+        key = id(buffer)
+        ends = self._ends
+        ends[key] = [weakref.ref(buffer, lambda _: ends.pop(key, None)), end]
+
+    def append(self, rows, row):
+        """Return a 2d array with the rows of **rows** followed by **row**."""
+        base, start = _row_view(rows) if isinstance(rows, np.ndarray) else (None, 0)
+        entry = self._ends.get(id(base))
+        if entry is not None and entry[0]() is base:
+            end = start + len(rows)
+            if end == entry[1] and end < len(base):
+                base[end] = row
+                entry[1] = end + 1
+                return base[start:end + 1]
+
+        size = len(rows)
+        buffer = np.empty((max(2 * (size + 1), self._min_capacity), len(row)))
+        if size > 0:
+            buffer[:size] = rows
+        buffer[size] = row
+        self._track(buffer, size + 1)
+        return buffer[:size + 1]
+
+
+class _KeyIndex:
+    """Random-projection locality-sensitive hashing index of the rows of 2d arrays of keys.
+
+    Each of **n_tables** hash tables assigns a key a code made of the signs of its projections onto **n_bits** random
+    hyperplanes, and maps each code to the rows with that code;  keys separated by a small angle are likely to share
+    a code in at least one of the tables.  Like `_RowBuffers`, rows are indexed by the array that an array of keys is
+    a view of, so that storing entries or deleting the oldest one only requires hashing the rows that are new.
+    """
+
+    def __init__(self, n_tables, n_bits, seed):
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self._seed = seed
+        self._planes = None
+        # id of array: [weak reference to array, codes of rows, number of rows hashed, tables]
+        self._entries = {}
+
+    def __reduce__(self):
+        return (self.__class__, (self.n_tables, self.n_bits, self._seed))
+
+    def _hash(self, rows):
+        signs = np.dot(rows, self._planes) > 0
+        return signs.reshape(len(rows), self.n_tables, self.n_bits).dot(1 << np.arange(self.n_bits))
+
+    @staticmethod
+    def _add(tables, first, codes):
+        if len(codes) < 16:
+            for row, row_codes in enumerate(codes.tolist(), first):
+                for table, code in zip(tables, row_codes):
+                    table.setdefault(code, []).append(row)
+            return
+        for table, column in zip(tables, codes.T):
+            order = np.argsort(column, kind='stable')
+            column = column[order]
+            bounds = np.flatnonzero(np.diff(column)) + 1
+            for code, rows in zip(column[np.r_[0, bounds]].tolist(), np.split(order + first, bounds)):
+                table.setdefault(code, []).extend(rows.tolist())
+
+    def update(self, keys, source=None, rows=slice(None)):
+        """Hash the rows of **keys** that are not yet indexed, and return their entry and range in it.
+
+        If **keys** is not a view of an indexed array, the codes of its first rows are copied from rows **rows** of
+        **source** rather than computed.
+        """
+        if self._planes is None or len(self._planes) != keys.shape[1]:
+            # Codes computed with other hyperplanes are no longer valid
+            self._entries.clear()
+            random_state = np.random.RandomState([self._seed])
+            self._planes = random_state.standard_normal((keys.shape[1], self.n_tables * self.n_bits))
+
+        base, start = _row_view(keys)
+        end = start + len(keys)
+
+        entries = self._entries
+        entry = entries.get(id(base))
+        if entry is None or entry[0]() is not base:
+            key = id(base)
+            entry = [weakref.ref(base, lambda _: entries.pop(key, None)),
+                     np.empty((len(base), self.n_tables), dtype=np.int64), 0, [{} for _ in range(self.n_tables)]]
+            entries[key] = entry
+            if start == 0 and source is not None and len(source):
+                source_entry, source_start, source_end = self.update(source)
+                codes = source_entry[1][source_start:source_end][rows][:end]
+                entry[1][:len(codes)] = codes
+                entry[2] = len(codes)
+                self._add(entry[3], 0, codes)
+
+        if entry[2] < end:
+            codes = self._hash(base[entry[2]:end])
+            entry[1][entry[2]:end] = codes
+            self._add(entry[3], entry[2], codes)
+            entry[2] = end
+
+        return entry, start, end
+
+    def candidates(self, keys, query, symmetric=False):
+        """Return the indices, in ascending order, of the rows of **keys** that share a code with **query**.
+
+        If **symmetric** is True, rows that share a code with -**query** are included as well.
+        """
+        entry, start, end = self.update(keys)
+        codes = self._hash(np.atleast_2d(query))[0].tolist()
+        buckets = [table.get(code, ()) for table, code in zip(entry[3], codes)]
+        if symmetric:
+            mask = (1 << self.n_bits) - 1
+            buckets += [table.get(code ^ mask, ()) for table, code in zip(entry[3], codes)]
+        rows = np.unique(np.fromiter(itertools.chain.from_iterable(buckets), dtype=np.int64))
+        return rows[(rows >= start) & (rows < end)] - start
+
+
+class _KeyTable:
+    """Hash table of the rows of 2d arrays of keys, used to find the rows that are identical to a key.
+
+    Rows are looked up by their contents, and are indexed by the array that an array of keys is a view of (as in
+    `_KeyIndex`), so that storing entries or deleting the oldest one only requires adding the rows that are new.
+    """
+
+    def __init__(self):
+        # id of array: [weak reference to array, number of rows added, {contents of row: rows}]
+        self._entries = {}
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+    @staticmethod
+    def _contents(rows):
+        # Adding 0.0 turns -0.0 into 0.0, which are equal but are not represented by the same bytes
+        rows = np.ascontiguousarray(rows + 0.0)
+        return rows.view(np.dtype((np.void, rows.shape[1] * rows.itemsize))).ravel().tolist()
+
+    def find(self, keys, key):
+        """Return the indices, in ascending order, of the rows of **keys** that are equal to **key**."""
+        base, start = _row_view(keys)
+        end = start + len(keys)
+
+        entries = self._entries
+        entry = entries.get(id(base))
+        if entry is None or entry[0]() is not base:
+            id_base = id(base)
+            entry = [weakref.ref(base, lambda _: entries.pop(id_base, None)), 0, {}]
+            entries[id_base] = entry
+        if entry[1] < end:
+            table = entry[2]
+            for row, contents in enumerate(self._contents(base[entry[1]:end]), entry[1]):
+                table.setdefault(contents, []).append(row)
+            entry[1] = end
+
+        rows = np.array(entry[2].get(self._contents(np.atleast_2d(key))[0], ()), dtype=np.int64)
+        return rows[(rows >= start) & (rows < end)] - start
+
 
 class ContentAddressableMemory(MemoryFunction):  # ---------------------------------------------------------------------
     """
@@ -359,6 +682,9 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
         equidistant_keys_select=RANDOM,              \
         duplicate_keys=False,                \
         max_entries=None,                            \
+        approximate_retrieval=False,                 \
+        hash_tables=8,                               \
+        hash_bits=12,                                \
         params=None,                                 \
         owner=None,                                  \
         prefs=None,                                  \
@@ -391,6 +717,42 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
     method.  The current contents of the memory can be inspected using the `memory <ContentAddressableMemory.memory>`
     attribute, which returns a list containing the current entries, each as a 2 item list containing a key-value pair.
 
+    Keys (and values, as long as they are all the same length) are stored as rows of preallocated 2d arrays that grow
+    as entries are added, and if `distance_function <ContentAddressableMemory.distance_function>` is a `Distance`
+    Function, the distances of all keys from the one in the call are computed at once.  Keys are also entered in a
+    hash table, so that finding the ones identical to a key being stored (see `duplicate_keys
+    <ContentAddressableMemory.duplicate_keys>`) or deleted does not require comparing it with every key in memory.
+
+    .. _ContentAddressableMemory_Saving_And_Loading:
+
+    The contents of memory can be saved to a directory using `save_memory <ContentAddressableMemory.save_memory>`,
+    which writes the keys and the values as 2d arrays in NumPy ``.npy`` files, along with a JSON file containing the
+    number and sizes of the entries, and later restored using `load_memory <ContentAddressableMemory.load_memory>`
+    (values must all be the same length to be saved).  If the **mmap** argument of `load_memory
+    <ContentAddressableMemory.load_memory>` is True, the files are memory-mapped read-only rather than read, so that
+    loading a large memory is immediate, and processes that load the same files share the memory used for them.  The
+    files are never modified;  storing or deleting entries after loading copies the contents of memory (once) into
+    the memory of the process.
+
+    .. _ContentAddressableMemory_Approximate_Retrieval:
+
+    If `approximate_retrieval <ContentAddressableMemory.approximate_retrieval>` is True, the keys are also entered in
+    an index that uses random-projection locality-sensitive hashing:  each of `hash_tables
+    <ContentAddressableMemory.hash_tables>` tables assigns a key a code made of the signs of its projections onto
+    `hash_bits <ContentAddressableMemory.hash_bits>` random hyperplanes.  On retrieval, only the entries with keys that
+    share a code with the one in the call in at least one table are considered, so that the time it takes depends
+    on the number of those entries rather than the size of `memory <ContentAddressableMemory.memory>`.  The
+    `distance_function <ContentAddressableMemory.distance_function>`, `selection_function
+    <ContentAddressableMemory.selection_function>` and `equidistant_keys_select
+    <ContentAddressableMemory.equidistant_keys_select>` are then applied to those entries as usual (keys identical
+    to the one in the call are always among them).  The keys most likely to share a code are those separated by a
+    small angle, which makes the index best suited to distance functions based on angle (e.g., *COSINE*, for which
+    keys with a small angle to the negative of the key in the call are considered as well).  Using more
+    `hash_tables <ContentAddressableMemory.hash_tables>` increases the chance that the best match is considered
+    (recall), and using more `hash_bits <ContentAddressableMemory.hash_bits>` reduces the number of entries
+    considered;  if no entry shares a code with the key in the call, all entries are considered.  The index is
+    updated as entries are stored and deleted, and is used only when the Function is executed in Python.
+
     .. _ContentAddressableMemory_Execution:
 
     Execution
@@ -477,6 +839,19 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
         specifies the maximum number of entries allowed in `memory <ContentAddressableMemory.memory>`
         (see `max_entries <ContentAddressableMemory.max_entries for additional details>`).
 
+    approximate_retrieval : bool : default False
+        specifies whether retrieval considers only entries found using an index of the keys in `memory
+        <ContentAddressableMemory.memory>` (see `approximate retrieval
+        <ContentAddressableMemory_Approximate_Retrieval>`).
+
+    hash_tables : int : default 8
+        specifies the number of hash tables used by the index for `approximate_retrieval
+        <ContentAddressableMemory.approximate_retrieval>`.
+
+    hash_bits : int : default 12
+        specifies the number of bits of the codes used by the index for `approximate_retrieval
+        <ContentAddressableMemory.approximate_retrieval>`.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -557,6 +932,21 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
         maximum number of entries allowed in `memory <ContentAddressableMemory.memory>`;  if storing a memory
         exceeds the number, the oldest memory is deleted.
 
+    approximate_retrieval : bool
+        determines whether retrieval considers only entries found using an index of the keys in `memory
+        <ContentAddressableMemory.memory>` (see `approximate retrieval
+        <ContentAddressableMemory_Approximate_Retrieval>`).
+
+    hash_tables : int
+        number of hash tables used by the index for `approximate_retrieval
+        <ContentAddressableMemory.approximate_retrieval>`;  more tables make it more likely that the best match is
+        retrieved, at the cost of considering more entries.
+
+    hash_bits : int
+        number of bits of the codes used by the index for `approximate_retrieval
+        <ContentAddressableMemory.approximate_retrieval>`;  more bits reduce the number of entries considered, at the
+        cost of making it less likely that the best match is retrieved.
+
     random_state: numpy.RandomState instance
 
     owner : Component
@@ -592,6 +982,12 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
                     :default value: [[0], [0]]
                     :type: list
 
+                approximate_retrieval
+                    see `approximate_retrieval <ContentAddressableMemory.approximate_retrieval>`
+
+                    :default value: False
+                    :type: bool
+
                 distance_function
                     see `distance_function <ContentAddressableMemory.distance_function>`
 
@@ -610,6 +1006,18 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
                     :default value: `RANDOM`
                     :type: str
 
+                hash_bits
+                    see `hash_bits <ContentAddressableMemory.hash_bits>`
+
+                    :default value: 12
+                    :type: int
+
+                hash_tables
+                    see `hash_tables <ContentAddressableMemory.hash_tables>`
+
+                    :default value: 8
+                    :type: int
+
                 key_size
                     see `key_size <ContentAddressableMemory.key_size>`
 
@@ -675,6 +1083,9 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
         rate = Parameter(1.0, modulable=True)
         noise = Parameter(0.0, modulable=True, aliases=[ADDITIVE_PARAM])
         max_entries = Parameter(1000)
+        approximate_retrieval = Parameter(False)
+        hash_tables = Parameter(8)
+        hash_bits = Parameter(12)
         random_state = Parameter(None, stateful=True, loggable=False)
 
         distance_function = Parameter(Distance(metric=COSINE), stateful=False, loggable=False)
@@ -694,6 +1105,9 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
                  duplicate_keys:tc.any(bool, tc.enum(OVERWRITE))=False,
                  equidistant_keys_select:tc.enum(RANDOM, OLDEST, NEWEST)=RANDOM,
                  max_entries=1000,
+                 approximate_retrieval:bool=False,
+                 hash_tables:int=8,
+                 hash_bits:int=12,
                  seed=None,
                  params: tc.optional(tc.any(list, np.ndarray)) = None,
                  owner=None,
@@ -707,6 +1121,10 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
         random_state = np.random.RandomState([seed])
 
         self._memory = []
+        self._row_buffers = _RowBuffers()
+        self._key_table = _KeyTable()
+        self._key_index = None
+        self._key_index_seed = seed
 
         super().__init__(
             default_variable=default_variable,
@@ -718,6 +1136,9 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
             rate=rate,
             noise=noise,
             max_entries=max_entries,
+            approximate_retrieval=approximate_retrieval,
+            hash_tables=hash_tables,
+            hash_bits=hash_bits,
             random_state=random_state,
             params=params,
             owner=owner,
@@ -1004,7 +1425,7 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
                     warnings.warn(f"Attempt to initialize memory of {self.__class__.__name__} with an entry ({entry}) "
                                   f"that has the same key as a previous one, while 'duplicate_keys'==False; "
                                   f"that entry has been skipped")
-            return np.asarray(self._memory)
+            return self._memory
 
     def _instantiate_attributes_before_function(self, function=None, context=None):
         self.parameters.previous_value._set(
@@ -1056,7 +1477,8 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
                                 "reinitialize previous_value".format(args, self.name))
 
         if reinitialization_value == []:
-            self.get_previous_value(context).clear()
+            self._memory = np.ndarray(shape=(2, 0))
+            self.parameters.previous_value._set(self._memory, context)
             value = np.ndarray(shape=(2, 0, len(self.defaults.variable[0])))
 
         else:
@@ -1187,8 +1609,24 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
             zeros_val = [0] * self.val_size
             return [zeros_key, zeros_val]
 
-        # Get distances between query_key and all keys in memory
-        distances = [self.distance_function([query_key, list(m)]) for m in _memory[KEYS]]
+        keys = np.asfarray(_memory[KEYS])
+
+        # Only consider entries with keys found by the index
+        candidates = None
+        if self.parameters.approximate_retrieval._get(context):
+            symmetric = isinstance(self.distance_function, Distance) and self.distance_function.metric == COSINE
+            candidates = self._get_key_index(context).candidates(keys, np.asfarray(query_key), symmetric)
+            if len(candidates) == 0:
+                candidates = None
+            else:
+                keys = keys[candidates]
+
+        # Get distances between query_key and all keys considered
+        distances = None
+        if isinstance(self.distance_function, Distance):
+            distances = self.distance_function._row_distances(query_key, keys)
+        if distances is None:
+            distances = [self.distance_function([query_key, list(m)]) for m in keys]
 
         # Get the best-match(es) in memory based on selection_function and return as non-zero value(s) in an array
         selection_array = self.selection_function(distances)
@@ -1199,11 +1637,10 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
             index_of_selected_item = int(np.flatnonzero(selection_array))
         # More than one key identified
         else:
-            selected_keys = _memory[KEYS]
+            selected_keys = keys[indices_of_selected_items]
             # Check for any duplicate keys in matches and, if they are not allowed, return zeros
             if (not self.duplicate_keys
-                    and any(list(selected_keys[indices_of_selected_items[0]])==list(selected_keys[other])
-                            for other in indices_of_selected_items[1:])):
+                    and np.any(np.all(selected_keys[1:] == selected_keys[0], axis=1))):
                 warnings.warn(f'More than one item matched key ({query_key}) in memory for {self.name} of ' \
                                   f'{self.owner.name} even though {repr("duplicate_keys")} is False')
                 return [[0]* self.parameters.key_size._get(context),
@@ -1218,6 +1655,8 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
             else:
                 assert False, f'PROGRAM ERROR:  bad specification ({self.equidistant_keys_select}) for  ' \
                     f'\'equidistant_keys_select parameter of {self.name} for {self.owner.name}'
+        if candidates is not None:
+            index_of_selected_item = candidates[index_of_selected_item]
         best_match_key = _memory[KEYS][index_of_selected_item]
         best_match_val = _memory[VALS][index_of_selected_item]
 
@@ -1237,47 +1676,58 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
 
         self._validate_memory(memory, context)
 
-        key = list(memory[KEYS])
-        val = list(memory[VALS])
+        key = np.asfarray(memory[KEYS])
+        val = np.asfarray(memory[VALS])
 
         d = self.get_previous_value(context)
+        keys = d[KEYS]
+        vals = d[VALS]
 
-        matches = [k for k in d[KEYS] if key==list(k)]
+        if len(keys) > 0:
+            keys = np.asfarray(keys)
+            matches = self._key_table.find(keys, key)
+        else:
+            matches = []
 
         # If dupliciate keys are not allowed and key matches any existing keys, don't store
-        if matches and self.duplicate_keys == False:
+        if len(matches) and self.duplicate_keys == False:
             storage_succeeded = False
 
         # If dupliciate_keys is specified as OVERWRITE, replace value for matching key:
-        elif matches and self.duplicate_keys == OVERWRITE:
+        elif len(matches) and self.duplicate_keys == OVERWRITE:
             if len(matches)>1:
                 raise FunctionError(f"Attempt to store item ({memory}) in {self.name} "
                                     f"with 'duplicate_keys'='OVERWRITE' "
                                     f"when there is more than one matching key in its memory; "
                                     f"'duplicate_keys' may have previously been set to 'True'")
-            try:
-                index = d[KEYS].index(key)
-            except AttributeError:
-                index = d[KEYS].tolist().index(key)
-            except ValueError:
-                index = np.array(d[KEYS]).tolist().index(key)
-            d[VALS][index] = val
+            # Copy, other contents of memory may share the stored values
+            if isinstance(vals, np.ndarray) and vals.ndim == 2 and vals.shape[1] == len(val):
+                vals = vals.copy()
+            else:
+                vals = list(vals)
+            vals[matches[0]] = val
             storage_succeeded = True
 
         else:
-            # Append new key and value to their respective lists
-            keys = list(d[KEYS])
-            keys.append(key)
-            values = list(d[VALS])
-            values.append(val)
-
-            # Return 3d array with keys and vals as lists
-            d = [keys, values]
+            # Append new key and value to the preallocated arrays of keys and values
+            previous_keys = keys
+            keys = self._row_buffers.append(keys, key)
+            if self.parameters.approximate_retrieval._get(context):
+                self._get_key_index(context).update(keys, previous_keys)
+            if len(vals) == 0 or (isinstance(vals, np.ndarray) and vals.ndim == 2 and vals.shape[1] == len(val)):
+                vals = self._row_buffers.append(vals, val)
+            else:
+                # Values of different lengths are kept in a list
+                vals = list(vals)
+                vals.append(val)
             storage_succeeded = True
 
-        if len(d[KEYS]) > self.max_entries:
-            d = np.delete(d, [KEYS], axis=1)
+        # Delete the oldest entry
+        if len(keys) > self.max_entries:
+            keys = keys[1:]
+            vals = vals[1:]
 
+        d = [keys, vals]
         self.parameters.previous_value._set(d,context)
         self._memory = d
 
@@ -1319,19 +1769,122 @@ class ContentAddressableMemory(MemoryFunction):  # -----------------------------
             delete only memories that have the same key *and* value as those listed in **memories**.
 
         """
-        memories = self._parse_memories(memories, 'add_to_memory', context)
+        memories = self._parse_memories(memories, 'delete_from_memory', context)
+
+        _memory = self.get_previous_value(context)
+        if len(_memory[KEYS]) == 0:
+            return
+
+        keys = np.asfarray(_memory[KEYS])
+        vals = _memory[VALS]
+        keep = np.ones(len(keys), dtype=bool)
+        for memory in memories:
+            matches = self._key_table.find(keys, np.asfarray(memory[KEYS]))
+            if not key_only:
+                matches = [i for i in matches
+                           if len(vals[i]) == len(memory[VALS]) and np.array_equal(vals[i], memory[VALS])]
+            keep[matches] = False
+
+        indices = np.flatnonzero(keep)
+        if isinstance(vals, np.ndarray):
+            vals = vals[indices]
+        else:
+            vals = [vals[i] for i in indices]
+        self._memory = [keys[indices], vals]
+        self.parameters.previous_value._set(self._memory, context)
+        if len(indices) and self.parameters.approximate_retrieval._get(context):
+            self._get_key_index(context).update(self._memory[KEYS], keys, indices)
+
+    def _get_key_index(self, context):
+        """Return the index used for `approximate_retrieval <ContentAddressableMemory.approximate_retrieval>`"""
+        hash_tables = self.parameters.hash_tables._get(context)
+        hash_bits = self.parameters.hash_bits._get(context)
+        key_index = self._key_index
+        if key_index is None or key_index.n_tables != hash_tables or key_index.n_bits != hash_bits:
+            key_index = self._key_index = _KeyIndex(hash_tables, hash_bits, self._key_index_seed)
+        return key_index
 
-        keys = [list(k) for k in memories[0]]
-        vals = [list(k) for k in memories[0]]
-
-        for i, key in enumerate(keys):
-            for j, stored_key in enumerate(self._memory[KEYS]):
-                if key == list(stored_key):
-                    if key_only or vals[j] == list(self._memory[VALS][j]):
-                        memory_keys = np.delete(self._memory[KEYS],j,axis=0)
-                        memory_vals = np.delete(self._memory[VALS],j,axis=0)
-                        self._memory = np.array([list(memory_keys), list(memory_vals)])
-                        self.parameters.previous_value._set(self._memory, context)
+    @handle_external_context()
+    def save_memory(self, path, context=None):
+        """save_memory(path, context=None)
+
+        Save the entries in `memory <ContentAddressableMemory.memory>` to files in directory **path** (created if
+        it does not exist), which can be loaded using `load_memory <ContentAddressableMemory.load_memory>` (see
+        `ContentAddressableMemory_Saving_And_Loading`).
+
+        Arguments
+        ---------
+
+        path : str or path-like
+            directory in which to save the files;  files from a previously saved memory are overwritten.
+        """
+        _memory = self.get_previous_value(context)
+        if len(_memory[KEYS]) == 0:
+            keys = np.empty((0, self.parameters.key_size._get(context)))
+            vals = np.empty((0, self.parameters.val_size._get(context)))
+        else:
+            keys = np.asfarray(_memory[KEYS])
+            try:
+                vals = np.asfarray(_memory[VALS])
+            except ValueError:
+                vals = None
+            if vals is None or vals.ndim != 2:
+                raise FunctionError(f"The values in the memory of {self.name} must all be the same length "
+                                    f"to be saved.")
+
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, MEMORY_KEYS_FILE), keys)
+        np.save(os.path.join(path, MEMORY_VALS_FILE), vals)
+        with open(os.path.join(path, MEMORY_METADATA_FILE), 'w') as metadata_file:
+            json.dump({'format': self.__class__.__name__,
+                       'version': MEMORY_FORMAT_VERSION,
+                       'entries': len(keys),
+                       'key_size': keys.shape[1],
+                       'val_size': vals.shape[1]},
+                      metadata_file)
+
+    @handle_external_context()
+    def load_memory(self, path, mmap=False, context=None):
+        """load_memory(path, mmap=False, context=None)
+
+        Replace the entries in `memory <ContentAddressableMemory.memory>` with ones saved to directory **path** by
+        `save_memory <ContentAddressableMemory.save_memory>` (see `ContentAddressableMemory_Saving_And_Loading`).
+
+        Arguments
+        ---------
+
+        path : str or path-like
+            directory that contains the saved files.
+
+        mmap : bool : default False
+            if True, memory-map the files read-only rather than reading them into memory.
+        """
+        try:
+            with open(os.path.join(path, MEMORY_METADATA_FILE)) as metadata_file:
+                metadata = json.load(metadata_file)
+        except (OSError, ValueError) as e:
+            raise FunctionError(f"Could not read memory for {self.name} from {path} ({e}).")
+        if metadata.get('format') != self.__class__.__name__ or metadata.get('version') != MEMORY_FORMAT_VERSION:
+            raise FunctionError(f"{path} does not contain a memory saved by {self.__class__.__name__}.")
+
+        mmap_mode = 'r' if mmap else None
+        keys = np.load(os.path.join(path, MEMORY_KEYS_FILE), mmap_mode=mmap_mode)
+        vals = np.load(os.path.join(path, MEMORY_VALS_FILE), mmap_mode=mmap_mode)
+        if keys.shape != (metadata['entries'], metadata['key_size']) \
+                or vals.shape != (metadata['entries'], metadata['val_size']):
+            raise FunctionError(f"The files in {path} do not match its {MEMORY_METADATA_FILE}.")
+        if len(keys) > self.parameters.max_entries._get(context):
+            raise FunctionError(f"The memory saved in {path} has more entries ({len(keys)}) than "
+                                f"{repr('max_entries')} of {self.name} ({self.parameters.max_entries._get(context)}).")
+
+        if len(keys) == 0:
+            _memory = np.ndarray(shape=(2, 0))
+        else:
+            _memory = [keys, vals]
+            self.parameters.key_size._set(metadata['key_size'], context)
+            self.parameters.val_size._set(metadata['val_size'], context)
+        self._memory = _memory
+        self.parameters.previous_value._set(_memory, context)
 
     def _parse_memories(self, memories, method, context=None):
         """Parse passing of single vs. multiple memories, validate memories, and return ndarray"""
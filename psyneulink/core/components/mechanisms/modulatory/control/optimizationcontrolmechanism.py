@@ -939,7 +939,14 @@ class OptimizationControlMechanism(ControlMechanism):
         except AttributeError:
             self.parameters.simulation_ids._set([sim_context.execution_id], base_context)
 
-        self.agent_rep._initialize_from_context(sim_context, self._get_frozen_context(base_context), override=False)
+        # the frozen context is not modified during simulations, so its values can be shared with each simulation
+        # until they are used (see Parameter_portfulness)
+        self.agent_rep._initialize_from_context(
+            sim_context,
+            self._get_frozen_context(base_context),
+            override=False,
+            copy_on_write=True
+        )
 
         return sim_context
 
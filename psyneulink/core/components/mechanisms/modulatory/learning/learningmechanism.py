@@ -530,8 +530,9 @@ import typecheck as tc
 
 from enum import Enum
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.component import parameter_keywords
-from psyneulink.core.components.functions.learningfunctions import BackPropagation
+from psyneulink.core.components.functions.learningfunctions import BackPropagation, ERROR_MATRIX
 from psyneulink.core.components.mechanisms.modulatory.modulatorymechanism import ModulatoryMechanism_Base
 from psyneulink.core.components.mechanisms.mechanism import Mechanism_Base
 from psyneulink.core.components.mechanisms.processing.objectivemechanism import ObjectiveMechanism
@@ -675,6 +676,22 @@ def _learning_mechanism_learning_rate_setter(value, owning_component=None, conte
         pass
     return value
 
+def _gen_llvm_accumulate(ctx, builder, acc, val):
+    acc_ty = acc.type.pointee
+    if isinstance(acc_ty, pnlvm.ir.ArrayType):
+        with pnlvm.helpers.array_ptr_loop(builder, acc, "accumulate") as (b1, idx):
+            _gen_llvm_accumulate(ctx, b1, b1.gep(acc, [ctx.int32_ty(0), idx]),
+                                 b1.gep(val, [ctx.int32_ty(0), idx]))
+    elif isinstance(acc_ty, pnlvm.ir.LiteralStructType):
+        for idx in range(len(acc_ty.elements)):
+            _gen_llvm_accumulate(ctx, builder, builder.gep(acc, [ctx.int32_ty(0), ctx.int32_ty(idx)]),
+                                 builder.gep(val, [ctx.int32_ty(0), ctx.int32_ty(idx)]))
+    else:
+        builder.store(builder.fadd(builder.load(acc), builder.load(val)), acc)
+
+    return builder
+
+
 class LearningMechanism(ModulatoryMechanism_Base):
     """
     LearningMechanism(                    \
@@ -1353,6 +1370,73 @@ class LearningMechanism(ModulatoryMechanism_Base):
 
         return [summed_learning_signal, summed_error_signal]
 
+    def _get_mech_params_init(self, context):
+        # Compiled execution keeps (flattened) error matrices in the mechanism parameters;
+        # Composition refreshes them from the learned projections after their weights change
+        if ERROR_MATRIX not in self.function._get_param_ids():
+            return ()
+
+        error_matrices = self.error_matrices
+        if error_matrices is None:
+            # See _execute
+            error_len = len(self.error_signal_input_ports[0].defaults.value)
+            error_matrices = [np.identity(error_len)] * len(self.error_signal_input_ports)
+
+        def _get_matrix_values(matrix):
+            if isinstance(matrix, ParameterPort):
+                matrix = matrix.parameters.value.get(context)
+            return np.asfarray(matrix).flatten().tolist()
+
+        return tuple(_get_matrix_values(m) for m in error_matrices)
+
+    def _get_mech_param_struct_type(self, ctx):
+        return ctx.convert_python_struct_to_llvm_ir(self._get_mech_params_init(None))
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out):
+        assert len(self.error_signal_input_ports) > 0, \
+            "Compiled {} requires error signal inputs".format(self.name)
+
+        zero = ctx.int32_ty(0)
+        ip_output, builder = self._gen_llvm_input_ports(ctx, builder, params, state, arg_in)
+
+        mf_params_ptr = builder.gep(params, [zero, ctx.int32_ty(1)])
+        mf_params, builder = self._gen_llvm_param_ports(self.function, mf_params_ptr, ctx, builder,
+                                                        params, state, arg_in)
+        mf_state = builder.gep(state, [zero, ctx.int32_ty(1)])
+        mech_params = builder.gep(params, [zero, ctx.int32_ty(2)])
+
+        function = ctx.import_llvm_function(self.function)
+        function_variable = builder.alloca(function.args[2].type.pointee)
+        learning_signal = builder.alloca(function.args[3].type.pointee)
+        value = builder.alloca(function.args[3].type.pointee)
+        builder.store(value.type.pointee(None), value)
+
+        for idx in (ACTIVATION_INPUT_INDEX, ACTIVATION_OUTPUT_INDEX):
+            src = builder.gep(ip_output, [zero, ctx.int32_ty(idx)])
+            dst = builder.gep(function_variable, [zero, ctx.int32_ty(idx)])
+            builder.store(builder.load(src), dst)
+
+        # Compute learning_signal for each error_signal (and corresponding error_matrix)
+        for error_signal_idx in self.error_signal_indices:
+            src = builder.gep(ip_output, [zero, ctx.int32_ty(error_signal_idx)])
+            dst = builder.gep(function_variable, [zero, ctx.int32_ty(ERROR_SIGNAL_INDEX)])
+            builder.store(builder.load(src), dst)
+
+            if ERROR_MATRIX in self.function._get_param_ids():
+                error_matrix_idx = error_signal_idx - ERROR_SIGNAL_INDEX
+                error_matrix = builder.gep(mech_params, [zero, ctx.int32_ty(error_matrix_idx)])
+                dst = ctx.get_param_ptr(self.function, builder, mf_params, ERROR_MATRIX)
+                dst = builder.bitcast(dst, error_matrix.type)
+                builder.store(builder.load(error_matrix), dst)
+
+            builder.call(function, [mf_params, mf_state, function_variable, learning_signal])
+
+            # Sum learning_signals and error_signals
+            builder = _gen_llvm_accumulate(ctx, builder, value, learning_signal)
+
+        builder = self._gen_llvm_output_ports(ctx, builder, value, params, state, arg_in, arg_out)
+        return builder
+
     # @property
     # def learning_enabled(self):
     #     try:
@@ -805,8 +805,10 @@ def _instantiate_parameter_ports(owner, function=None, context=None):
     # function may also be a Function class, in which case parameter
     # ports are still created for the modulable Parameters
 
+    # Parameters are iterated in order of name so that the order of the
+    # ParameterPorts does not depend on the (hash based) order of parameters
     if is_instance_or_subclass(function, Function):
-        for p in function.parameters:
+        for p in sorted(function.parameters, key=lambda p: p.name):
             if not skip_parameter_port(p):
                 try:
                     value = owner.initial_function_parameters[p.name]
@@ -824,7 +826,7 @@ def _instantiate_parameter_ports(owner, function=None, context=None):
                     function=function
                 )
 
-    for p in owner.parameters:
+    for p in sorted(owner.parameters, key=lambda p: p.name):
         if (
             not skip_parameter_port(p)
             and p.name not in owner.parameter_ports.names
@@ -764,6 +764,7 @@ Class Reference
 
 import abc
 import abc
+import collections
 import inspect
 import itertools
 import numbers
@@ -829,6 +830,17 @@ STANDARD_PORT_ARGS = {PORT_TYPE, OWNER, REFERENCE_VALUE, VARIABLE, NAME, PARAMS,
 PORT_SPEC = 'port_spec'
 REMOVE_PORTS = 'REMOVE_PORTS'
 
+# classification of an afferent Projection of a Port used by Port._update (see Port._get_afferent_plan):
+#    params_type: the entry of runtime params containing params for the Projection's type (e.g., MAPPING_PROJECTION_PARAMS)
+#    is_pathway: True for PathwayProjections, False for ModulatoryProjections
+#    is_learning: True for LearningProjections
+#    identity_eligible: False if the Projection must be executed even if its function is an identity function
+#    from_process_input_port: True if the Projection's sender is a ProcessInputPort
+_PortAfferent = collections.namedtuple(
+    '_PortAfferent',
+    'projection params_type is_pathway is_learning identity_eligible from_process_input_port'
+)
+
 
 def _is_port_class(spec):
     if inspect.isclass(spec) and issubclass(spec, Port):
@@ -1857,22 +1869,17 @@ class Port_Base(Port):
         # AGGREGATE INPUT FROM PROJECTIONS -----------------------------------------------------------------------
 
         # Get type-specific params from PROJECTION_PARAMS
-        mapping_params = merge_param_dicts(self.portParams, MAPPING_PROJECTION_PARAMS, PROJECTION_PARAMS)
-        learning_projection_params = merge_param_dicts(self.portParams, LEARNING_PROJECTION_PARAMS, PROJECTION_PARAMS)
-        control_projection_params = merge_param_dicts(self.portParams, CONTROL_PROJECTION_PARAMS, PROJECTION_PARAMS)
-        gating_projection_params = merge_param_dicts(self.portParams, GATING_PROJECTION_PARAMS, PROJECTION_PARAMS)
+        if self.portParams:
+            projection_type_params = {
+                params_type: merge_param_dicts(self.portParams, params_type, PROJECTION_PARAMS)
+                for params_type in (MAPPING_PROJECTION_PARAMS, LEARNING_PROJECTION_PARAMS,
+                                    CONTROL_PROJECTION_PARAMS, GATING_PROJECTION_PARAMS)
+            }
+        else:
+            projection_type_params = None
 
         #For each projection: get its params, pass them to it, get the projection's value, and append to relevant list
 
-        from psyneulink.core.components.process import ProcessInputPort
-        from psyneulink.core.components.projections.pathway.pathwayprojection import PathwayProjection_Base
-        from psyneulink.core.components.projections.modulatory.modulatoryprojection import ModulatoryProjection_Base
-        from psyneulink.core.components.projections.pathway.mappingprojection import MappingProjection
-        from psyneulink.core.components.projections.modulatory.learningprojection import LearningProjection
-        from psyneulink.core.components.projections.modulatory.controlprojection import ControlProjection
-        from psyneulink.core.components.projections.modulatory.gatingprojection import GatingProjection
-        from psyneulink.library.components.projections.pathway.maskedmappingprojection import MaskedMappingProjection
-
         modulatory_override = False
 
         # Get values of all Projections
@@ -1880,11 +1887,12 @@ class Port_Base(Port):
         # self._path_proj_values = []
         mod_proj_values = {}
 
-        for projection in self.all_afferents:
+        afferent_plan = self._get_afferent_plan()
 
-            if hasattr(projection, 'sender'):
-                sender = projection.sender
-            else:
+        for afferent in afferent_plan:
+            projection = afferent.projection
+
+            if not hasattr(projection, 'sender'):
                 if self.verbosePref:
                     warnings.warn("{} to {} {} of {} ignored [has no sender]".format(projection.__class__.__name__,
                                                                                      self.name,
@@ -1896,36 +1904,29 @@ class Port_Base(Port):
                 continue
 
             # Only accept projections from a Process to which the owner Mechanism belongs
-            if isinstance(sender, ProcessInputPort):
-                if not sender.owner in self.owner.processes.keys():
+            if afferent.from_process_input_port:
+                if not projection.sender.owner in self.owner.processes.keys():
                     continue
 
             # Merge with relevant projection type-specific params
-            if isinstance(projection, MappingProjection):
-                projection_params = merge_param_dicts(self.portParams, projection.name, mapping_params, )
-            elif isinstance(projection, LearningProjection):
-                projection_params = merge_param_dicts(self.portParams, projection.name, learning_projection_params)
-            elif isinstance(projection, ControlProjection):
-                projection_params = merge_param_dicts(self.portParams, projection.name, control_projection_params)
-            elif isinstance(projection, GatingProjection):
-                projection_params = merge_param_dicts(self.portParams, projection.name, gating_projection_params)
-            if not projection_params:
+            if projection_type_params is None or afferent.params_type is None:
                 projection_params = None
+            else:
+                projection_params = merge_param_dicts(
+                    self.portParams, projection.name, projection_type_params[afferent.params_type]
+                )
+                if not projection_params:
+                    projection_params = None
 
             # Update LearningSignals only if context == LEARNING;  otherwise, assign zero for projection_value
             # IMPLEMENTATION NOTE: done here rather than in its own method in order to exploit parsing of params above
-            is_learning_projection = isinstance(projection, LearningProjection)
-            if (is_learning_projection and ContextFlags.LEARNING not in context.execution_phase):
+            if (afferent.is_learning and ContextFlags.LEARNING not in context.execution_phase):
                 projection_value = projection.defaults.value * 0.0
             elif (
-                # learning projections add extra behavior in _execute that invalidates identity function
-                not is_learning_projection
-                # masked mapping projections apply a mask separate from their function - consider replacing it
-                # with a masked linear matrix and removing this special class?
-                and not isinstance(projection, MaskedMappingProjection)
+                afferent.identity_eligible
                 and projection.function._is_identity(context)
                 # has no parameter ports with afferents (these can modulate parameters and make it non-identity)
-                and len(list(itertools.chain.from_iterable([p.all_afferents for p in projection.parameter_ports]))) == 0
+                and not any(p.path_afferents or p.mod_afferents for p in projection.parameter_ports)
                 # matrix ParameterPort may be a non identity Accumulator integrator
                 and all(pport.function._is_identity(context) for pport in projection.parameter_ports)
             ):
@@ -1964,13 +1965,13 @@ class Port_Base(Port):
 
             # KDM 6/20/18: consider moving handling of Pathway and Modulatory projections
             # into separate methods
-            if isinstance(projection, PathwayProjection_Base):
+            if afferent.is_pathway:
                 # Add projection_value to list of PathwayProjection values (for aggregation below)
                 # self._path_proj_values.append(projection_value)
                 variable.append(projection_value)
 
             # If it is a ModulatoryProjection, add its value to the list in the dict entry for the relevant mod_param
-            elif isinstance(projection, ModulatoryProjection_Base):
+            else:
                 # Get the meta_param to be modulated from modulation attribute of the  projection's ModulatorySignal
                 #    and get the function parameter to be modulated to type_match the projection value below
                 mod_spec, mod_param_name, mod_param_value = self._get_modulated_param(projection, context=context)
@@ -2040,7 +2041,7 @@ class Port_Base(Port):
             function_params = None
 
         if (
-            len(self.all_afferents) == 0
+            len(afferent_plan) == 0
             and self.function._is_identity(context)
             and function_params is None
         ):
@@ -2055,6 +2056,61 @@ class Port_Base(Port):
         else:
             self.execute(context=context, runtime_params=function_params)
 
+    def _get_afferent_plan(self):
+        """Return a list of `_PortAfferent` classifying each Projection in `all_afferents <Port.all_afferents>`, in
+        order, for use by `_update <Port._update>`.  The list is cached, and rebuilt only if the Port's afferents have
+        changed since it was last built.
+        """
+        afferents = self.all_afferents
+
+        try:
+            cached_afferents, afferent_plan = self._afferent_plan
+        except AttributeError:
+            pass
+        else:
+            if cached_afferents == afferents:
+                return afferent_plan
+
+        from psyneulink.core.components.process import ProcessInputPort
+        from psyneulink.core.components.projections.pathway.pathwayprojection import PathwayProjection_Base
+        from psyneulink.core.components.projections.pathway.mappingprojection import MappingProjection
+        from psyneulink.core.components.projections.modulatory.learningprojection import LearningProjection
+        from psyneulink.core.components.projections.modulatory.controlprojection import ControlProjection
+        from psyneulink.core.components.projections.modulatory.gatingprojection import GatingProjection
+        from psyneulink.library.components.projections.pathway.maskedmappingprojection import MaskedMappingProjection
+
+        afferent_plan = []
+        for projection in afferents:
+            if isinstance(projection, MappingProjection):
+                params_type = MAPPING_PROJECTION_PARAMS
+            elif isinstance(projection, LearningProjection):
+                params_type = LEARNING_PROJECTION_PARAMS
+            elif isinstance(projection, ControlProjection):
+                params_type = CONTROL_PROJECTION_PARAMS
+            elif isinstance(projection, GatingProjection):
+                params_type = GATING_PROJECTION_PARAMS
+            else:
+                params_type = None
+
+            is_learning = isinstance(projection, LearningProjection)
+
+            afferent_plan.append(
+                _PortAfferent(
+                    projection=projection,
+                    params_type=params_type,
+                    is_pathway=isinstance(projection, PathwayProjection_Base),
+                    is_learning=is_learning,
+                    # learning projections add extra behavior in _execute that invalidates identity function
+                    # masked mapping projections apply a mask separate from their function - consider replacing it
+                    # with a masked linear matrix and removing this special class?
+                    identity_eligible=not is_learning and not isinstance(projection, MaskedMappingProjection),
+                    from_process_input_port=isinstance(getattr(projection, 'sender', None), ProcessInputPort),
+                )
+            )
+
+        self._afferent_plan = (afferents, afferent_plan)
+        return afferent_plan
+
     def _execute(self, variable=None, context=None, runtime_params=None):
         if variable is None:
             variable = self._get_fallback_variable(context)
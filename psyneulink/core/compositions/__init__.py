@@ -2,14 +2,17 @@ from . import composition
 from . import pathwaycomposition
 from . import systemcomposition
 from . import compositionfunctionapproximator
+from . import resultsink
 
 
 from .composition import *
 from .pathwaycomposition import *
 from .systemcomposition import *
 from .compositionfunctionapproximator import *
+from .resultsink import *
 
 __all__ = list(composition.__all__)
 __all__.extend(systemcomposition.__all__)
 __all__.extend(pathwaycomposition.__all__)
 __all__.extend(compositionfunctionapproximator.__all__)
+__all__.extend(resultsink.__all__)
@@ -19,6 +19,8 @@ Contents
   * `Composition_Run`
       - `Composition_Run_Inputs`
       - `Composition_Input_as_Function`
+      - `Composition_Run_Batched`
+      - `Composition_Run_Results_Sink`
       - `Composition_Scope_of_Execution`
   * `Composition_Controller`
       - `Composition_Controller_Assignment`
@@ -507,6 +509,64 @@ Environment.
     comp.run(inputs=input_dictionary)
 COMMENT
 
+.. _Composition_Run_Batched:
+
+*Batched Runs*
+==============
+
+If the **batch_size** argument of `run <Composition.run>` is specified, the input sets are not presented one `TRIAL`
+at a time; rather, up to **batch_size** `TRIAL`\\s are executed together, with the inputs, values of the Nodes and
+values of the Projections among them carrying an additional (leading) dimension over the `TRIAL`\\s in the batch.
+This replaces the per-`TRIAL` execution of each Node and Port with a small number of large array operations, which
+can be considerably faster when a Composition is run for many short `TRIAL`\\s.  The results are the same as for a
+standard run, and the values of the Nodes after the run are those of the last `TRIAL`.
+
+Batched runs are only possible if the `TRIAL`\\s are independent of one another, and if each Node executes exactly
+once per `TRIAL` in an order determined by the structure of the graph.  This requires that:
+
+* the Composition has no `controller <Composition.controller>`, learning components, nested Compositions, cycles
+  or `feedback <Composition_Initial_Values_and_Feedback>` Projections;
+* every Node is a `ProcessingMechanism` or a (non-integrating) `TransferMechanism`, the `function
+  <Mechanism_Base.function>` of which is an elementwise `TransferFunction` (`Identity`, `Linear`, `Exponential`,
+  `Logistic`, `Tanh`, `ReLU` or `Gaussian`) that is not subject to modulation;
+* every Projection is a `MappingProjection` that uses a `LinearMatrix` function and is not subject to learning;
+* the Composition's `scheduler <Composition.scheduler>` uses only its default `Conditions <Condition>` (or `Always`
+  and `EveryNCalls` with n=1 on a Node's senders), and its default termination Conditions.
+
+Inputs must be specified as a dictionary or list (see `Composition_Run_Inputs`), and the **call_before_trial** (and
+other callable), **runtime_params** and **animate** arguments of `run <Composition.run>` cannot be used.  If any of
+these requirements is not met, a `CompositionError` is raised that identifies it.
+
+.. _Composition_Run_Results_Sink:
+
+*Results Sinks*
+===============
+
+By default, the output of every `TRIAL` is appended to the Composition's `results <Composition.results>` attribute, so
+that the memory used grows with the number of `TRIAL`\s run.  If the **results_sink** argument of `run
+<Composition.run>` is specified, the output of each `TRIAL` is instead passed to it as soon as the `TRIAL` has been
+executed, and is not retained by the Composition (its `results <Composition.results>` attribute is not modified).  A
+results sink can be a callable, a generator, or an object with a *write* method such as an `NpyResultsWriter`, which
+writes the outputs to a file that can be loaded as a memory-mapped array (see `ResultsSink_Overview`).  For
+example, the following computes the mean output of a Composition over a long run without storing its outputs::
+
+    >>> import psyneulink as pnl
+    >>> m = pnl.TransferMechanism()
+    >>> comp = pnl.Composition()
+    >>> comp.add_node(m)
+    >>> def running_mean():
+    ...     total, count = 0, 0
+    ...     while True:
+    ...         output = yield total / max(count, 1)
+    ...         total, count = total + output[0][0], count + 1
+    >>> mean = running_mean()
+    >>> comp.run(inputs={m: [[1], [2], [3]]}, num_trials=300, results_sink=mean)
+    [array([3.])]
+    >>> mean.send([[0]]) == (2 * 300) / 301
+    True
+    >>> comp.results
+    []
+
 COMMENT:
 .. _Composition_Initial_Values_and_Feedback
 FIX:  ADD SECTION ON CYCLES, FEEDBACK, INITIAL VALUES, RELEVANCE TO MODULATORY MECHANISMS REINITIALIZATION
@@ -1119,11 +1179,13 @@ from inspect import isgenerator, isgeneratorfunction
 
 from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.component import Component, ComponentsMeta
-from psyneulink.core.components.functions.function import is_function_type
+from psyneulink.core.components.functions.function import FunctionOutputType, is_function_type
 from psyneulink.core.components.functions.interfacefunctions import InterfacePortMap
 from psyneulink.core.components.functions.learningfunctions import \
     LearningFunction, Reinforcement, BackPropagation, TDLearning
 from psyneulink.core.components.functions.combinationfunctions import LinearCombination, PredictionErrorDeltaFunction
+from psyneulink.core.components.functions.transferfunctions import \
+    Exponential, Gaussian, Identity, Linear, LinearMatrix, Logistic, ReLU, Tanh
 from psyneulink.core.components.mechanisms.mechanism import Mechanism_Base
 from psyneulink.core.components.mechanisms.modulatory.control.optimizationcontrolmechanism import \
     OptimizationControlMechanism
@@ -1145,21 +1207,24 @@ from psyneulink.core.components.ports.inputport import InputPort, SHADOW_INPUTS
 from psyneulink.core.components.ports.parameterport import ParameterPort
 from psyneulink.core.components.ports.outputport import OutputPort
 from psyneulink.core.components.ports.modulatorysignals.controlsignal import ControlSignal
+from psyneulink.core.compositions.resultsink import _get_results_sink_writer
 from psyneulink.core.components.mechanisms.processing.processingmechanism import ProcessingMechanism
+from psyneulink.core.components.mechanisms.processing.transfermechanism import TransferMechanism
 from psyneulink.core.globals.context import Context, ContextFlags, handle_external_context
 from psyneulink.core.globals.keywords import \
     AFTER, ALL, BEFORE, BOLD, BOTH, COMPARATOR_MECHANISM, COMPONENT, COMPOSITION, CONDITIONS, \
     CONTROL, CONTROLLER, CONTROL_SIGNAL, FUNCTIONS, HARD_CLAMP, IDENTITY_MATRIX, INPUT, \
     LABELS, LEARNED_PROJECTION, LEARNING_MECHANISM, MATRIX, MATRIX_KEYWORD_VALUES, MAYBE, MECHANISM, MECHANISMS, \
     MODEL_SPEC_ID_COMPOSITION, MODEL_SPEC_ID_NODES, MODEL_SPEC_ID_PROJECTIONS, MODEL_SPEC_ID_PSYNEULINK, \
-    MODEL_SPEC_ID_RECEIVER_MECH, MODEL_SPEC_ID_SENDER_MECH, MONITOR, MONITOR_FOR_CONTROL, MSE, NAME, NO_CLAMP, \
-    ONLINE, OUTCOME, OUTPUT, OWNER_VALUE, PATHWAY, PROJECTION, PROJECTIONS, PULSE_CLAMP, ROLES, \
-    SAMPLE, SIMULATIONS, SOFT_CLAMP, SSE, TARGET, TARGET_MECHANISM, VALUES, VARIABLE, WEIGHT
+    MODEL_SPEC_ID_RECEIVER_MECH, MODEL_SPEC_ID_SENDER_MECH, MONITOR, MONITOR_FOR_CONTROL, MSE, NAME, NO_CLAMP, NOISE, \
+    OFFSET, ONLINE, OUTCOME, OUTPUT, OWNER_VALUE, PATHWAY, PROJECTION, PROJECTIONS, PULSE_CLAMP, ROLES, \
+    SAMPLE, SCALE, SIMULATIONS, SOFT_CLAMP, SSE, SUM, TARGET, TARGET_MECHANISM, VALUES, VARIABLE, WEIGHT
 from psyneulink.core.globals.log import CompositionLog, LogCondition
 from psyneulink.core.globals.parameters import Parameter, ParametersBase
 from psyneulink.core.globals.registry import register_category
-from psyneulink.core.globals.utilities import ContentAddressableList, NodeRole, call_with_pruned_args, convert_to_list
-from psyneulink.core.scheduling.condition import All, Always, Condition, EveryNCalls
+from psyneulink.core.globals.utilities import \
+    ContentAddressableList, NodeRole, call_with_pruned_args, convert_to_list, is_numeric
+from psyneulink.core.scheduling.condition import All, AllHaveRun, Always, Condition, EveryNCalls, Never
 from psyneulink.core.scheduling.scheduler import Scheduler
 from psyneulink.core.scheduling.time import TimeScale
 from psyneulink.core.globals.preferences.preferenceset import PreferenceLevel, PreferenceSet, _assign_prefs
@@ -1193,6 +1258,11 @@ SHOW_LEARNING = 'show_learning'
 logger = logging.getLogger(__name__)
 CompositionRegistry = {}
 
+# Facts about a Node used by Composition.execute in every TIME_STEP that change only with the structure of the
+# Composition:  the LearningProjections for its afferent Projections, and whether it is an INPUT Node
+# (see Composition._build_execution_plan)
+_NodeExecutionPlan = collections.namedtuple('_NodeExecutionPlan', 'learning_projections is_input')
+
 
 class CompositionError(Exception):
 
@@ -1675,6 +1745,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         state_struct = None
         data_struct = None
         scheduler_conditions = None
+        input_struct = None
 
     def __init__(
             self,
@@ -1739,6 +1810,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self.feedback_senders = set()
         self.feedback_receivers = set()
 
+        self._execution_plan = None
+
         self._initialize_parameters(
             **param_defaults,
             retain_old_simulation_data=retain_old_simulation_data,
@@ -1747,9 +1820,9 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         # Compiled resources
         self.__generated_node_wrappers = {}
-        self.__generated_run = None
-        self.__generated_simulation = None
-        self.__generated_sim_run = None
+        self.__generated_run = self._CompiledFunctionWrapper(self, lambda ctx, comp: ctx.gen_composition_run(comp))
+        self.__generated_simulation = self._CompiledFunctionWrapper(self, lambda ctx, comp: ctx.gen_composition_exec(comp, True))
+        self.__generated_sim_run = self._CompiledFunctionWrapper(self, lambda ctx, comp: ctx.gen_composition_run(comp, True))
 
         self._compilation_data = self._CompilationData(owner=self)
 
@@ -1798,6 +1871,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
             if old_scheduler is not None:
                 self._scheduler.add_condition_set(old_scheduler.conditions)
+                self._scheduler.history_max_length = old_scheduler.history_max_length
 
             self.needs_update_scheduler = False
 
@@ -1821,6 +1895,14 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
     def termination_processing(self, termination_conds):
         self.scheduler.termination_conds = termination_conds
 
+    def _delete_contexts(self, *contexts, check_simulation_storage=False, visited=None):
+        super()._delete_contexts(*contexts, check_simulation_storage=check_simulation_storage, visited=visited)
+
+        # the scheduler also stores counts and a Clock for each execution_id in which it has run
+        if isinstance(self._scheduler, Scheduler):
+            for context in contexts:
+                self._scheduler._delete_counts(context.execution_id)
+
     # ******************************************************************************************************************
     #                                              GRAPH
     # ******************************************************************************************************************
@@ -1850,8 +1932,29 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self._create_CIM_ports(context=context)
         self._update_shadow_projections(context=context)
         self._check_for_projection_assignments(context=context)
+        self._execution_plan = self._build_execution_plan()
         self.needs_update_graph = False
 
+    def _build_execution_plan(self):
+        """Return a dict with a _NodeExecutionPlan for each Node, that is used by `execute <Composition.execute>`
+        in place of recomputing the information in it for every Node in every `TIME_STEP`.
+
+        The plan is rebuilt by _analyze_graph, and is invalidated by any change to the structure of the Composition.
+        """
+        input_nodes = set(self.get_nodes_by_role(NodeRole.INPUT))
+        projections = set(self.projections)
+        execution_plan = {}
+        for node in self.nodes:
+            learning_projections = []
+            if isinstance(node, Mechanism):
+                for projection in node.path_afferents:
+                    if projection in projections and isinstance(projection, MappingProjection):
+                        learning_projections.extend([a for a in projection.parameter_ports[MATRIX].mod_afferents
+                                                     if hasattr(a, 'learning_enabled')])
+            execution_plan[node] = _NodeExecutionPlan(learning_projections=learning_projections,
+                                                      is_input=node in input_nodes)
+        return execution_plan
+
     def _update_processing_graph(self):
         """
         Constructs the processing graph (the graph that contains only Nodes as vertices)
@@ -1950,6 +2053,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             self.needs_update_graph = True
             self.needs_update_graph_processing = True
             self.needs_update_scheduler = True
+            self._execution_plan = None
 
             try:
                 # activate any projections the node requires
@@ -2116,6 +2220,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             del self.nodes[node]
             self.node_ordering.remove(node)
 
+        self._execution_plan = None
+
     def add_required_node_role(self, node, role):
         if role not in NodeRole:
             raise CompositionError('Invalid NodeRole: {0}'.format(role))
@@ -2123,6 +2229,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         node_role_pair = (node, role)
         if node_role_pair not in self.required_node_roles:
             self.required_node_roles.append(node_role_pair)
+            self._execution_plan = None
 
     def remove_required_node_role(self, node, role):
         if role not in NodeRole:
@@ -2131,6 +2238,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         node_role_pair = (node, role)
         if node_role_pair in self.required_node_roles:
             self.required_node_roles.remove(node_role_pair)
+            self._execution_plan = None
 
     def get_roles_by_node(self, node):
         try:
@@ -2891,6 +2999,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self.needs_update_graph = True
         self.needs_update_graph_processing = True
         self.needs_update_scheduler = True
+        self._execution_plan = None
 
         projection._activate_for_compositions(self)
         for comp in nested_compositions:
@@ -2923,6 +3032,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # step 2 - remove Projection from Composition's list
         if projection in self.projections:
             self.projections.remove(projection)
+        self._execution_plan = None
 
         # step 3 - TBI? remove Projection from afferents & efferents lists of any node
 
@@ -6284,6 +6394,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             runtime_params=None,
             skip_initialization=False,
             animate=False,
+            batch_size=None,
+            results_sink=None,
             context=None,
             base_context=Context(execution_id=None),
             ):
@@ -6400,6 +6512,15 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                    as when setting the `log_condition <Parameter.log_condition>` directly, a value of `True` will
                    correspond to the `EXECUTION LogCondition <LogCondition.EXECUTION>`.
 
+            batch_size : int : default None
+                if specified, `TRIAL`\\s are executed together in batches of up to **batch_size** `TRIAL`\\s, using
+                array operations over the `TRIAL`\\s in each batch (see `Composition_Run_Batched` for the
+                Compositions to which this applies).
+
+            results_sink : callable, generator or object with a write method : default None
+                if specified, the output of each `TRIAL` is passed to **results_sink** rather than being stored in
+                the Composition's `results <Composition.results>` attribute (see `Composition_Run_Results_Sink`).
+
         COMMENT:
         REPLACE WITH EVC/OCM EXAMPLE
         Examples
@@ -6501,6 +6622,11 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         results = []
 
+        if results_sink is not None:
+            write_result = _get_results_sink_writer(results_sink, context)
+        else:
+            write_result = None
+
         self._assign_execution_ids(context)
 
         scheduler._init_counts(execution_id=context.execution_id)
@@ -6563,6 +6689,42 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         is_simulation = (context is not None and
                          ContextFlags.SIMULATION in context.execution_phase)
 
+        if batch_size is not None:
+            unsupported_args = [name for name, arg in [('bin_execute', bin_execute not in {False, 'Python'}),
+                                                       ('call_before_trial', call_before_trial),
+                                                       ('call_after_trial', call_after_trial),
+                                                       ('call_before_pass', call_before_pass),
+                                                       ('call_after_pass', call_after_pass),
+                                                       ('call_before_time_step', call_before_time_step),
+                                                       ('call_after_time_step', call_after_time_step),
+                                                       ('runtime_params', runtime_params),
+                                                       ('animate', self._animate is not False)] if arg]
+            if unsupported_args:
+                raise CompositionError(f"The following arguments of run cannot be used with batch_size "
+                                       f"(see Composition_Run_Batched): {', '.join(unsupported_args)}.")
+            if callable(inputs) or hasattr(inputs, '__next__') or self.env or is_simulation:
+                raise CompositionError(f"Inputs to {self.name} must be specified in a dictionary or list "
+                                       f"to be run with batch_size.")
+            if clamp_input != SOFT_CLAMP:
+                raise CompositionError(f"{self.name} cannot be run with batch_size when clamp_input is specified.")
+            if not isinstance(batch_size, int) or batch_size < 1:
+                raise CompositionError(f"batch_size for {self.name} ({batch_size}) must be a positive integer.")
+
+            results += self._run_batched(inputs=inputs,
+                                         scheduler=scheduler,
+                                         termination_processing=termination_processing,
+                                         num_trials=num_trials,
+                                         num_inputs_sets=num_inputs_sets,
+                                         batch_size=batch_size,
+                                         context=context)
+
+            self.parameters.input_specification._set(None, context)
+            scheduler.get_clock(context)._increment_time(TimeScale.RUN)
+
+            self._store_results(results, write_result, context)
+            self.most_recent_context = context
+            return results[-1] if results else None
+
         if (bin_execute is True or str(bin_execute).endswith('Run')):
             # There's no mode to run simulations.
             # Simulations are run as part of the controller node wrapper.
@@ -6570,23 +6732,17 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             try:
                 if bin_execute is True or bin_execute.startswith('LLVM'):
                     _comp_ex = pnlvm.CompExecution(self, [context.execution_id])
-                    results += _comp_ex.run(inputs, num_trials, num_inputs_sets)
+                    results += pnlvm._split_run_outputs(_comp_ex.run(inputs, num_trials, num_inputs_sets))
                 elif bin_execute.startswith('PTX'):
                     self.__ptx_initialize(context)
                     EX = self._compilation_data.ptx_execution._get(context)
-                    results += EX.cuda_run(inputs, num_trials, num_inputs_sets)
-
-                full_results = self.parameters.results._get(context)
-                if full_results is None:
-                    full_results = results
-                else:
-                    full_results.extend(results)
+                    results += pnlvm._split_run_outputs(EX.cuda_run(inputs, num_trials, num_inputs_sets))
 
-                self.parameters.results._set(full_results, context)
+                self._store_results(results, write_result, context)
                 # KAM added the [-1] index after changing Composition run()
                 # behavior to return only last trial of run (11/7/18)
                 self.most_recent_context = context
-                return full_results[-1]
+                return results[-1]
 
             except Exception as e:
                 if bin_execute is not True:
@@ -6681,7 +6837,10 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                 result_copy = trial_output
 
             if ContextFlags.SIMULATION not in context.execution_phase:
-                results.append(result_copy)
+                if write_result is None:
+                    results.append(result_copy)
+                else:
+                    write_result(result_copy)
 
                 if not self.parameters.retain_old_simulation_data._get():
                     if self.controller is not None:
@@ -6702,13 +6861,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         scheduler.get_clock(context)._increment_time(TimeScale.RUN)
 
-        full_results = self.parameters.results._get(context)
-        if full_results is None:
-            full_results = results
-        else:
-            full_results.extend(results)
-
-        self.parameters.results._set(full_results, context)
+        self._store_results(results, None, context)
 
         self.most_recent_context = context
 
@@ -6729,6 +6882,210 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         return trial_output
 
+    def _store_results(self, results, write_result=None, context=None):
+        """Append **results** (the outputs of the `TRIAL`\\s of a run) to the Composition's `results
+        <Composition.results>`, or pass each to **write_result** if a results sink was specified for the run (see
+        `Composition_Run_Results_Sink`).
+        """
+        if write_result is not None:
+            for result in results:
+                write_result(result)
+            return
+
+        full_results = self.parameters.results._get(context)
+        if full_results is None:
+            full_results = results
+        else:
+            full_results.extend(results)
+
+        self.parameters.results._set(full_results, context)
+
+    def _get_batched_execution_order(self, scheduler, termination_processing, context=None):
+        """Return the Nodes of the Composition in the order in which they are executed in a batched run
+
+        Checks the requirements listed under `Composition_Run_Batched`, and raises a CompositionError that
+        identifies the first one that is not met.
+        """
+
+        def batch_error(reason):
+            return CompositionError(f"{self.name} cannot be run with batch_size: {reason} "
+                                    f"(see Composition_Run_Batched).")
+
+        def converts_output_shape(function):
+            return (function.enable_output_type_conversion
+                    and function.output_type not in {None, FunctionOutputType.NP_2D_ARRAY, FunctionOutputType.DEFAULT})
+
+        elementwise_functions = (Identity, Linear, Exponential, Logistic, Tanh, ReLU, Gaussian)
+
+        if self.controller is not None and self.enable_controller:
+            raise batch_error(f"it has a controller ({self.controller.name})")
+        if self.get_nodes_by_role(NodeRole.LEARNING):
+            raise batch_error("it has learning components")
+        if scheduler.cycle_nodes or self.feedback_senders:
+            raise batch_error("it has cycles or feedback Projections")
+        if (not isinstance(termination_processing[TimeScale.RUN], Never)
+                or not isinstance(termination_processing[TimeScale.TRIAL], AllHaveRun)
+                or termination_processing[TimeScale.TRIAL].args):
+            raise batch_error("its termination Conditions are not the defaults")
+
+        scheduler._validate_run_state()
+        position = {node: i for i, consideration_set in enumerate(scheduler.consideration_queue)
+                    for node in consideration_set}
+
+        # Each Node must execute once per TRIAL, after all of the Nodes on which its Condition depends
+        def executes_once_after_dependencies(condition, node):
+            if isinstance(condition, Always):
+                return True
+            if isinstance(condition, EveryNCalls):
+                dependency, n = condition.args
+                return n == 1 and dependency in position and position[dependency] < position[node]
+            if isinstance(condition, All):
+                return all(executes_once_after_dependencies(c, node) for c in condition.args)
+            return False
+
+        execution_order = []
+        for consideration_set in scheduler.consideration_queue:
+            for node in consideration_set:
+                if type(node) not in {ProcessingMechanism, TransferMechanism}:
+                    raise batch_error(f"{node.name} is not a {ProcessingMechanism.__name__} "
+                                      f"or {TransferMechanism.__name__}")
+                if not executes_once_after_dependencies(scheduler.conditions[node], node):
+                    raise batch_error(f"the Condition for {node.name} ({scheduler.conditions[node]}) "
+                                      f"does not execute it exactly once per TRIAL")
+                if isinstance(node, TransferMechanism):
+                    if node.parameters.integrator_mode._get(context):
+                        raise batch_error(f"{node.name} is in integrator_mode")
+                    if not is_numeric(node.parameters.noise._get(context)):
+                        raise batch_error(f"the noise for {node.name} is not a numeric value")
+                if not isinstance(node.function, elementwise_functions) or converts_output_shape(node.function):
+                    raise batch_error(f"the function of {node.name} ({node.function.name}) "
+                                      f"is not an elementwise TransferFunction")
+                if np.array(node.defaults.variable).dtype == object:
+                    raise batch_error(f"the InputPorts of {node.name} have different lengths")
+                if any(port.mod_afferents for port in itertools.chain(node.input_ports,
+                                                                      node.parameter_ports,
+                                                                      node.output_ports)):
+                    raise batch_error(f"{node.name} receives ModulatoryProjections")
+
+                for input_port in node.input_ports:
+                    combination_function = input_port.function
+                    if (not isinstance(combination_function, LinearCombination)
+                            or combination_function.operation != SUM
+                            or combination_function.weights is not None
+                            or combination_function.exponents is not None):
+                        raise batch_error(f"the function of {input_port.name} of {node.name} "
+                                          f"is not a simple sum of its inputs")
+                    for projection in input_port.path_afferents:
+                        if not input_port.afferents_info[projection].is_active_in_composition(self):
+                            continue
+                        if (not isinstance(projection, MappingProjection)
+                                or not isinstance(projection.function, LinearMatrix)
+                                or converts_output_shape(projection.function)
+                                or any(port.mod_afferents for port in projection.parameter_ports)):
+                            raise batch_error(f"{projection.name} is not an unmodulated {MappingProjection.__name__} "
+                                              f"with a {LinearMatrix.__name__} function")
+
+                for output_port in node.output_ports:
+                    variable_spec = output_port._variable_spec
+                    if (not isinstance(variable_spec, tuple)
+                            or variable_spec[0] != OWNER_VALUE
+                            or not isinstance(variable_spec[1], int)
+                            or not isinstance(output_port.function, elementwise_functions)
+                            or converts_output_shape(output_port.function)):
+                        raise batch_error(f"{output_port.name} of {node.name} does not assign an item of "
+                                          f"the Mechanism's value, transformed elementwise, as its value")
+
+                execution_order.append(node)
+
+        return execution_order
+
+    def _run_batched(self, inputs, scheduler, termination_processing, num_trials, num_inputs_sets, batch_size,
+                     context=None):
+        """Execute **num_trials** `TRIAL`\\s in batches of up to **batch_size** `TRIAL`\\s, and return a list with
+        the output of each `TRIAL` (see `Composition_Run_Batched`)
+        """
+        execution_order = self._get_batched_execution_order(scheduler, termination_processing, context)
+
+        # Stack the inputs for each INPUT Node InputPort along a leading dimension over input sets
+        stimuli = {}
+        for input_port, (input_CIM_input_port, input_CIM_output_port) in self.input_CIM_ports.items():
+            node = input_port.owner
+            index = node.input_ports.index(input_port)
+            stimuli[input_CIM_output_port] = np.asarray([np.asarray(stimulus[index], dtype=float)
+                                                         for stimulus in inputs[node]])
+
+        output_CIM_senders = {output_CIM_output_port: output_port
+                              for output_port, (output_CIM_input_port, output_CIM_output_port)
+                              in self.output_CIM_ports.items()}
+        output_ports = [output_CIM_senders[port] for port in self.output_CIM.output_ports]
+
+        results = []
+        port_values = {}
+        node_values = {}
+        for batch_start in range(0, num_trials, batch_size):
+            trials = np.arange(batch_start, min(batch_start + batch_size, num_trials)) % num_inputs_sets
+            num_batch_trials = len(trials)
+
+            # port_values and node_values hold the value of each Port and Node for every TRIAL in the batch
+            for input_CIM_output_port, stimulus in stimuli.items():
+                port_values[input_CIM_output_port] = stimulus[trials % len(stimulus)]
+
+            for node in execution_order:
+                node_input = []
+                for input_port in node.input_ports:
+                    afferents = [p for p in input_port.path_afferents
+                                 if input_port.afferents_info[p].is_active_in_composition(self)]
+                    if afferents:
+                        port_value = np.sum([p.function._function(port_values[p.sender], context=context)
+                                             for p in afferents], axis=0)
+                        scale = input_port.function.get_current_function_param(SCALE, context)
+                        offset = input_port.function.get_current_function_param(OFFSET, context)
+                        if scale is not None:
+                            port_value = port_value * scale
+                        if offset is not None:
+                            port_value = port_value + offset
+                    else:
+                        default_value = np.atleast_1d(input_port.defaults.value)
+                        port_value = np.broadcast_to(default_value, (num_batch_trials,) + default_value.shape)
+                    port_values[input_port] = port_value
+                    node_input.append(port_value)
+
+                variable = np.stack(node_input, axis=1)
+                if isinstance(node, TransferMechanism):
+                    noise = node.get_current_mechanism_param(NOISE, context)
+                    if (np.array(noise) != 0).any():
+                        variable = variable + noise
+
+                value = node.function._function(variable, context=context)
+                if isinstance(node, TransferMechanism):
+                    value = node._clip_result(node.get_current_mechanism_param("clip", context), value)
+                node_values[node] = value
+
+                for output_port in node.output_ports:
+                    port_values[output_port] = output_port.function._function(value[:, output_port._variable_spec[1]],
+                                                                              context=context)
+
+                node._increment_execution_count(num_batch_trials)
+
+            outputs = [port_values[port] for port in output_ports]
+            results.extend([[output[i] for output in outputs] for i in range(num_batch_trials)])
+
+            clock = scheduler.get_clock(context)
+            for i in range(num_batch_trials):
+                clock._increment_time(TimeScale.TRIAL)
+
+        # Leave the Nodes and Ports with the values from the last TRIAL, as a standard run does
+        for port, value in port_values.items():
+            port.parameters.value._set(np.array(value[-1]), context)
+        for output_CIM_output_port in self.output_CIM.output_ports:
+            output_CIM_output_port.parameters.value._set(
+                np.array(port_values[output_CIM_senders[output_CIM_output_port]][-1]), context)
+        for node, value in node_values.items():
+            node.parameters.value._set(np.array(value[-1]), context)
+            node.most_recent_context = context
+
+        return results
+
     @handle_external_context(execution_phase=ContextFlags.PROCESSING)
     def execute(
             self,
@@ -6820,6 +7177,10 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         input_nodes = self.get_nodes_by_role(NodeRole.INPUT)
 
+        if self._execution_plan is None:
+            self._execution_plan = self._build_execution_plan()
+        execution_plan = self._execution_plan
+
         execution_scheduler = scheduler or self.scheduler
 
         context.source = ContextFlags.COMPOSITION
@@ -7070,13 +7431,15 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             # execute each node with EXECUTING in context
             for node in next_execution_set:
 
+                node_plan = execution_plan[node]
+
                 # Store values of all nodes in this execution_set for use by other nodes in the execution set
                 #    throughout this timestep (e.g., for recurrent Projections)
                 frozen_values[node] = node.get_output_values(context)
 
                 # FIX: 6/12/19 Deprecate?
                 # Handle input clamping
-                if node in input_nodes:
+                if node_plan.is_input:
                     if clamp_input:
                         if node in hard_clamp_inputs:
                             # clamp = HARD_CLAMP --> "turn off" recurrent projection
@@ -7092,7 +7455,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
                     execution_runtime_params = {}
 
-                    if node in runtime_params:
+                    if runtime_params and node in runtime_params:
                         for param in runtime_params[node]:
                             if runtime_params[node][param][1].is_satisfied(scheduler=execution_scheduler,
                                                # KAM 5/15/18 - not sure if this will always be the correct execution id:
@@ -7107,10 +7470,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                     # Set to LEARNING if Mechanism receives any PathwayProjections that are being learned
                     #    for which learning_enabled == True or ONLINE (i.e., not False or AFTER)
                     if self.enable_learning:
-                        projections = set(self.projections).intersection(set(node.path_afferents))
-                        if any([p for p in projections if
-                                any([a for a in p.parameter_ports[MATRIX].mod_afferents
-                                     if (hasattr(a, 'learning_enabled') and a.learning_enabled in {True, ONLINE})])]):
+                        if any(a.learning_enabled in {True, ONLINE} for a in node_plan.learning_projections):
                             context.replace_flag(ContextFlags.PROCESSING, ContextFlags.LEARNING)
 
                     # Execute node
@@ -7118,7 +7478,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                         _comp_ex.execute_node(node)
                     else:
                         if node is not self.controller:
-                            if nested and node in self.get_nodes_by_role(NodeRole.INPUT):
+                            if nested and node_plan.is_input:
                                 for port in node.input_ports:
                                     port._update(context=context)
                             node.execute(
@@ -7127,20 +7487,12 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                             )
 
                     # Reset runtime_params for node and its function if specified
-                        if context.execution_id in node._runtime_params_reset:
-                            for key in node._runtime_params_reset[context.execution_id]:
-                                node._set_parameter_value(key, node._runtime_params_reset[context.execution_id][key],
-                                                          context)
-                        node._runtime_params_reset[context.execution_id] = {}
-
-                        if context.execution_id in node.function._runtime_params_reset:
-                            for key in node.function._runtime_params_reset[context.execution_id]:
-                                node.function._set_parameter_value(
-                                        key,
-                                        node.function._runtime_params_reset[context.execution_id][key],
-                                        context)
-
-                        node.function._runtime_params_reset[context.execution_id] = {}
+                        for component in (node, node.function):
+                            runtime_params_reset = component._runtime_params_reset.get(context.execution_id)
+                            if runtime_params_reset:
+                                for key in runtime_params_reset:
+                                    component._set_parameter_value(key, runtime_params_reset[key], context)
+                                component._runtime_params_reset[context.execution_id] = {}
 
                     # Set execution_phase for node's context back to IDLE
                     if self.enable_learning:
@@ -7211,7 +7563,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
                 # FIX: 6/12/19 Deprecate?
                 # Handle input clamping
-                if node in input_nodes:
+                if node_plan.is_input:
                     if clamp_input:
                         if node in pulse_clamp_inputs:
                             for input_port in node.input_ports:
@@ -7221,14 +7573,14 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                 # Store new value generated by node,
                 #    then set back to frozen value for use by other nodes in execution_set
                 new_values[node] = node.get_output_values(context)
-                for i in range(len(node.output_ports)):
+                for i in range(len(frozen_values[node])):
                     node.output_ports[i].parameters.value._set(frozen_values[node][i], context,
                                                                skip_history=True, skip_log=True)
 
 
             # Set all nodes to new values
             for node in next_execution_set:
-                for i in range(len(node.output_ports)):
+                for i in range(len(new_values[node])):
                     node.output_ports[i].parameters.value._set(new_values[node][i], context,
                                                                skip_history=True, skip_log=True)
 
@@ -7349,6 +7701,14 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             return "heterogeneous"
         return False
 
+    def _input_array_matches_variable(self, input_array, var):
+        # input_array is a numeric array, each item of which is a homogeneous input_value for one trial
+        return (isinstance(input_array, np.ndarray)
+                and input_array.dtype != object
+                and input_array.ndim > 0
+                and len(input_array) > 0
+                and np.shape(np.atleast_2d(input_array[0])) == np.shape(var))
+
     def _adjust_stimulus_dict(self, stimuli):
 
         autodiff_stimuli = {}
@@ -7433,6 +7793,13 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                     adjusted_stimuli[node] = [stim_list]
                 nums_input_sets.add(1)
 
+            elif self._input_array_matches_variable(stim_list, input_must_match):
+                # a numeric array with one (homogeneous) input per trial along its first axis;
+                # split it into views of the 2d input for each trial rather than checking them one at a time
+                trial_shape = np.shape(input_must_match)
+                adjusted_stimuli[node] = list(stim_list.reshape((len(stim_list),) + trial_shape))
+                nums_input_sets.add(len(stim_list))
+
             else:
                 adjusted_stimuli[node] = []
                 for stim in stimuli[node]:
@@ -7641,44 +8008,67 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
     def _get_node_wrapper(self, node):
         if node not in self.__generated_node_wrappers:
             class node_wrapper():
-                def __init__(self, node, gen_f):
+                def __init__(self, composition, node, gen_f):
+                    self._comp = composition
                     self._node = node
                     self._gen_f = gen_f
                 def _gen_llvm_function(self):
                     return self._gen_f(self._node)
-            wrapper = node_wrapper(node, self.__gen_node_wrapper)
+                def _get_compilation_key(self, ctx):
+                    # Node wrappers access the structures of the whole composition
+                    return self._comp._get_compilation_key(ctx)
+            wrapper = node_wrapper(self, node, self.__gen_node_wrapper)
             self.__generated_node_wrappers[node] = wrapper
             return wrapper
 
         return self.__generated_node_wrappers[node]
 
+    class _CompiledFunctionWrapper():
+        def __init__(self, composition, gen_f):
+            self._comp = composition
+            self._gen_f = gen_f
+        def _gen_llvm_function(self):
+            with pnlvm.LLVMBuilderContext.get_global() as ctx:
+                return self._gen_f(ctx, self._comp)
+        def _get_compilation_key(self, ctx):
+            return self._comp._get_compilation_key(ctx)
+
+    def _get_compilation_key(self, ctx):
+        # The generated code depends on the layout of the compiled structures,
+        # the topology of the composition, and the scheduling conditions.
+        # Functions of the nodes and projections are keyed separately.
+        scheduler = self.scheduler
+        return (type(self),
+                str(ctx.get_param_struct_type(self)),
+                str(ctx.get_state_struct_type(self)),
+                str(ctx.get_data_struct_type(self)),
+                str(ctx.get_input_struct_type(self)),
+                str(ctx.get_output_struct_type(self)),
+                tuple(id(n) for n in self._all_nodes),
+                tuple((id(p), id(p.sender), id(p.receiver)) for p in self.projections),
+                tuple(frozenset(id(n) for n in group) for group in scheduler.consideration_queue),
+                tuple(id(scheduler.conditions[n]) if n in scheduler.conditions else None for n in self.nodes),
+                tuple((scale, id(cond)) for scale, cond in self.termination_processing.items()),
+                self.enable_learning,
+                self.enable_controller,
+                self.controller_mode,
+                id(self.controller))
+
     def _gen_llvm_function(self):
         with pnlvm.LLVMBuilderContext.get_global() as ctx:
                 return ctx.gen_composition_exec(self)
 
     @property
     def _llvm_run(self):
-        if self.__generated_run is None:
-            with pnlvm.LLVMBuilderContext.get_global() as ctx:
-                self.__generated_run = ctx.gen_composition_run(self)
-
-        return self.__generated_run
+        return pnlvm.LLVMBuilderContext.get_global().gen_llvm_function(self.__generated_run)
 
     @property
     def _llvm_simulation(self):
-        if self.__generated_simulation is None:
-            with pnlvm.LLVMBuilderContext.get_global() as ctx:
-                self.__generated_simulation = ctx.gen_composition_exec(self, True)
-
-        return self.__generated_simulation
+        return pnlvm.LLVMBuilderContext.get_global().gen_llvm_function(self.__generated_simulation)
 
     @property
     def _llvm_sim_run(self):
-        if self.__generated_sim_run is None:
-            with pnlvm.LLVMBuilderContext.get_global() as ctx:
-                self.__generated_sim_run = ctx.gen_composition_run(self, True)
-
-        return self.__generated_sim_run
+        return pnlvm.LLVMBuilderContext.get_global().gen_llvm_function(self.__generated_sim_run)
 
     @handle_external_context(execution_id=NotImplemented)
     def reinitialize(self, context=None):
@@ -7690,8 +8080,12 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self._compilation_data.state_struct.set(None, context)
         self._compilation_data.data_struct.set(None, context)
         self._compilation_data.scheduler_conditions.set(None, context)
+        self._compilation_data.input_struct.set(None, context)
 
     def __ptx_initialize(self, context=None):
+        # Regenerating the function of a modified composition
+        # drops the execution created for the previous layout
+        pnlvm.LLVMBuilderContext.get_global().gen_llvm_function(self)
         if self._compilation_data.ptx_execution._get(context) is None:
             self._compilation_data.ptx_execution._set(pnlvm.CompExecution(self, [context.execution_id]), context)
 
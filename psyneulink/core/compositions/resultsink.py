@@ -0,0 +1,232 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+
+
+# *******************************************  RESULTS SINKS  *********************************************************
+
+"""
+
+Contents
+--------
+
+  * `ResultsSink_Overview`
+  * `ResultsSink_Class_Reference`
+
+
+.. _ResultsSink_Overview:
+
+Overview
+--------
+
+A results sink receives the output of each `TRIAL` of a `Composition` as it is `run <Composition.run>`, in place of
+the Composition accumulating them in its `results <Composition.results>` attribute (see `Composition_Run_Results_Sink`).
+This keeps the memory used by a run constant regardless of the number of `TRIAL`\\s, and allows the outputs to be
+processed while the run is still going.  Any of the following can be specified as the **results_sink** argument of
+`run <Composition.run>`:
+
+  * a *callable* -- called with the output of each `TRIAL` (and, if it has a **context** argument, the `Context` of
+    the run);
+
+  * a *generator* -- sent the output of each `TRIAL` using its ``send`` method (it is advanced to its first ``yield``
+    before the first `TRIAL` if that has not already been done);
+
+  * an object with a *write* method -- called with the output of each `TRIAL`;  this includes `NpyResultsWriter`,
+    which writes the outputs to a file in NumPy ``.npy`` format, from which they can be loaded (including as a
+    memory-mapped array) using ``numpy.load``.
+
+.. _ResultsSink_Class_Reference:
+
+Class Reference
+---------------
+
+"""
+
+import inspect
+import struct
+
+import numpy as np
+
+__all__ = ['NpyResultsWriter', 'ResultsSinkError']
+
+# space reserved for the header of a file written by NpyResultsWriter, so that it can be rewritten with the final
+# number of results without moving the data;  a multiple of 64, as required for .npy headers
+NPY_HEADER_LENGTH = 256
+
+
+class ResultsSinkError(Exception):
+    def __init__(self, error_value):
+        self.error_value = error_value
+
+    def __str__(self):
+        return repr(self.error_value)
+
+
+class NpyResultsWriter:
+    """
+    NpyResultsWriter(        \
+        file,                \
+        chunk_size=1000      \
+        )
+
+    Write the output of each `TRIAL` of a `run <Composition.run>` to a file in NumPy ``.npy`` format.
+
+    The outputs are buffered and written in chunks of **chunk_size**; the file contains a single array, the first
+    dimension of which is over `TRIAL`\\s, and can be read (once the NpyResultsWriter is closed) using
+    ``numpy.load(file)``, or ``numpy.load(file, mmap_mode='r')`` to memory-map it rather than reading it into memory.
+    The output of every `TRIAL` must have the same shape (i.e., the OutputPorts of the Composition's `OUTPUT` Nodes
+    must all be the same length) and be numeric.
+
+    An NpyResultsWriter can be used for more than one call to `run <Composition.run>`, and must be closed (or used as
+    a context manager) when done::
+
+        >>> import psyneulink as pnl
+        >>> import numpy as np
+        >>> import os, tempfile
+        >>> m = pnl.TransferMechanism()
+        >>> comp = pnl.Composition()
+        >>> comp.add_node(m)
+        >>> path = os.path.join(tempfile.mkdtemp(), 'results.npy')
+        >>> with pnl.NpyResultsWriter(path) as writer:
+        ...     comp.run(inputs={m: [[1], [2], [3]]}, results_sink=writer)
+        [array([3.])]
+        >>> np.load(path, mmap_mode='r').shape
+        (3, 1, 1)
+
+    Arguments
+    ---------
+
+    file : str or path-like
+        the file to which the outputs are written;  it is overwritten if it exists.
+
+    chunk_size : int : default 1000
+        the number of outputs buffered before they are written to **file**.
+
+    Attributes
+    ----------
+
+    file : str or path-like
+        the file to which the outputs are written.
+
+    chunk_size : int
+        the number of outputs buffered before they are written to `file <NpyResultsWriter.file>`.
+
+    num_results : int
+        the number of outputs written so far (including any that are still buffered).
+
+    """
+
+    def __init__(self, file, chunk_size=1000):
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ResultsSinkError(f"chunk_size for {self.__class__.__name__} ({chunk_size}) "
+                                   f"must be a positive integer.")
+
+        self.file = file
+        self.chunk_size = chunk_size
+        self.num_results = 0
+
+        self._buffer = []
+        self._dtype = None
+        self._shape = None
+        self._fp = open(file, 'wb')
+        self._write_header()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, result):
+        """Add **result** (the output of one `TRIAL`) to the file, writing out the buffered results if the buffer
+        has reached `chunk_size <NpyResultsWriter.chunk_size>`.
+        """
+        if self._fp is None:
+            raise ResultsSinkError(f"Attempt to write to {self.__class__.__name__} for {self.file} after it was closed.")
+
+        try:
+            result = np.asarray(result, dtype=self._dtype)
+        except ValueError as e:
+            raise ResultsSinkError(f"Result written to {self.__class__.__name__} for {self.file} could not be "
+                                   f"converted to a numeric array ({e}).")
+
+        if self._shape is None:
+            if result.dtype == object:
+                raise ResultsSinkError(f"Results written to {self.__class__.__name__} for {self.file} must be "
+                                       f"numeric arrays of the same shape (got {result}).")
+            self._dtype = result.dtype
+            self._shape = result.shape
+        elif result.shape != self._shape:
+            raise ResultsSinkError(f"Results written to {self.__class__.__name__} for {self.file} must all have the "
+                                   f"same shape ({self._shape}; got {result.shape}).")
+
+        self._buffer.append(result)
+        self.num_results += 1
+
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write any buffered results to the file, and update its header to include them."""
+        if self._buffer:
+            self._fp.write(np.stack(self._buffer).tobytes())
+            self._buffer = []
+
+        self._write_header()
+        self._fp.flush()
+
+    def close(self):
+        """Write any buffered results, and close the file."""
+        if self._fp is not None:
+            self.flush()
+            self._fp.close()
+            self._fp = None
+
+    def _write_header(self):
+        dtype = self._dtype if self._dtype is not None else np.dtype(float)
+        shape = (self.num_results - len(self._buffer),) + (self._shape if self._shape is not None else ())
+
+        header = repr({
+            'descr': np.lib.format.dtype_to_descr(dtype),
+            'fortran_order': False,
+            'shape': shape,
+        })
+        # magic string (6 bytes), version (2 bytes), header length (2 bytes), header padded with spaces, newline
+        header_length = NPY_HEADER_LENGTH - 10
+        header = header.ljust(header_length - 1) + '\n'
+        if len(header) > header_length:
+            raise ResultsSinkError(f"Results written to {self.__class__.__name__} for {self.file} have too many "
+                                   f"dimensions ({shape}).")
+
+        position = self._fp.tell()
+        self._fp.seek(0)
+        self._fp.write(np.lib.format.magic(1, 0) + struct.pack('<H', header_length) + header.encode('latin1'))
+        if position > NPY_HEADER_LENGTH:
+            self._fp.seek(position)
+
+
+def _get_results_sink_writer(results_sink, context=None):
+    """Return a function that passes the output of a `TRIAL` to **results_sink** (see `ResultsSink_Overview`)"""
+    if inspect.isgenerator(results_sink):
+        if inspect.getgeneratorstate(results_sink) == inspect.GEN_CREATED:
+            next(results_sink)
+        return results_sink.send
+    elif hasattr(results_sink, 'write'):
+        return results_sink.write
+    elif callable(results_sink):
+        try:
+            takes_context = 'context' in inspect.signature(results_sink).parameters
+        except (TypeError, ValueError):
+            # builtins may not have a signature
+            takes_context = False
+
+        if takes_context:
+            return lambda result: results_sink(result, context=context)
+        else:
+            return results_sink
+    else:
+        raise ResultsSinkError(f"results_sink ({results_sink}) must be a callable, a generator, "
+                               f"or an object with a write method.")
@@ -77,6 +77,14 @@ For Developers
 Developers must keep in mind state when writing new components for PNL. Any parameters or values that may change during a `run <Run_Overview>`
 must become stateful Parameters, or they are at risk of computational errors like those encountered in parallel programming.
 
+When an execution context is initialized from another for a `simulation <OptimizationControlMechanism_Execution>`, its
+values and `history <Parameter.history>` are shared with those of the base context until they are needed
+(*copy-on-write*):  a value is copied the first time it is accessed through `get <Parameter.get>` (as the caller may
+modify it in place) or replaced through `set <Parameter.set>`, and a history is copied the first time it is appended
+to.  Values that cannot be modified in place (e.g., numbers and strings) are never copied.  Developers should
+therefore access Parameter values only through `get <Parameter.get>` and `set <Parameter.set>`, and not through
+`values <Parameter.values>` directly.
+
 
 Creating Parameters
 ^^^^^^^^^^^^^^^
@@ -240,10 +248,13 @@ Class Reference
 import collections
 import copy
 import logging
+import numbers
 import types
 import warnings
 import weakref
 
+import numpy as np
+
 from psyneulink.core.globals.keywords import MULTIPLICATIVE
 from psyneulink.core.globals.context import Context, ContextError, ContextFlags, _get_time, handle_external_context
 from psyneulink.core.globals.context import time as time_object
@@ -257,6 +268,30 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# enum members used in Parameter._log_value, which runs on every Parameter set;  bound here because accessing
+# them through their class is comparatively slow
+_COMMAND_LINE = ContextFlags.COMMAND_LINE
+_INITIALIZING = ContextFlags.INITIALIZING
+_LOG_CONDITION_OFF = LogCondition.OFF
+_LOG_CONDITION_INITIALIZATION = LogCondition.INITIALIZATION
+
+# types of Parameter values that cannot be modified in place, and so can always be shared between execution contexts
+_parameter_value_immutable_types = (type(None), numbers.Number, str, np.generic)
+
+
+def _copy_parameter_context_value(value):
+    """Return a copy of **value** for use in a new execution context, sharing any Components and methods"""
+    from psyneulink.core.components.component import Component
+
+    shared_types = (Component, types.MethodType)
+
+    if isinstance(value, (dict, list)):
+        return copy_iterable_with_shared(value, shared_types)
+    elif not isinstance(value, shared_types):
+        return copy.deepcopy(value)
+    else:
+        return value
+
 
 class ParameterError(Exception):
     pass
@@ -604,7 +639,7 @@ class Parameter(types.SimpleNamespace):
             :default: None
 
         history_max_length
-            the maximum length of the stored history.
+            the maximum length of the stored history;  if 0, no history is stored.
 
             :default: 1
 
@@ -759,6 +794,11 @@ class Parameter(types.SimpleNamespace):
         self.__inherited = False
         self._inherited = _inherited
 
+        # execution_ids whose value or history is still shared with the execution context from which it was
+        # initialized (see _initialize_from_context)
+        self._shared_value_execution_ids = set()
+        self._shared_history_execution_ids = set()
+
     def __repr__(self):
         return '{0} :\n{1}'.format(super(types.SimpleNamespace, self).__repr__(), str(self))
 
@@ -930,6 +970,9 @@ class Parameter(types.SimpleNamespace):
                 self._set_value(value, execution_id=execution_id, context=context)
             return value
         else:
+            if self._shared_value_execution_ids and execution_id in self._shared_value_execution_ids:
+                self._unshare_value(execution_id)
+
             try:
                 return self.values[execution_id]
             except KeyError:
@@ -1029,23 +1072,38 @@ class Parameter(types.SimpleNamespace):
         self._set_value(value, execution_id=execution_id, context=context, skip_history=skip_history, skip_log=skip_log)
 
     def _set_value(self, value, execution_id=None, context=None, skip_history=False, skip_log=False):
+        values = self.values
+
+        # the shared value is replaced below, so need not be copied
+        if self._shared_value_execution_ids:
+            self._shared_value_execution_ids.discard(execution_id)
+
         # store history
-        if not skip_history:
-            if execution_id in self.values:
+        if not skip_history and self.history_max_length:
+            try:
+                previous_value = values[execution_id]
+            except KeyError:
+                pass
+            else:
+                if self._shared_history_execution_ids and execution_id in self._shared_history_execution_ids:
+                    self._unshare_history(execution_id)
                 try:
-                    self.history[execution_id].append(self.values[execution_id])
+                    self.history[execution_id].append(previous_value)
                 except KeyError:
-                    self.history[execution_id] = collections.deque([self.values[execution_id]], maxlen=self.history_max_length)
+                    self.history[execution_id] = collections.deque([previous_value], maxlen=self.history_max_length)
 
         # log value
         if not skip_log and self.loggable:
             self._log_value(value, context)
 
         # set value
-        self.values[execution_id] = value
+        values[execution_id] = value
 
     @handle_external_context()
     def delete(self, context=None):
+        self._shared_value_execution_ids.discard(context.execution_id)
+        self._shared_history_execution_ids.discard(context.execution_id)
+
         try:
             del self.values[context.execution_id]
         except KeyError:
@@ -1060,19 +1118,19 @@ class Parameter(types.SimpleNamespace):
 
     def _log_value(self, value, context=None):
         # manual logging
-        if context is not None and context.source is ContextFlags.COMMAND_LINE:
+        if context is not None and context._source is _COMMAND_LINE:
             try:
                 time = _get_time(self._owner._owner, context)
             except (AttributeError, ContextError):
                 time = time_object(None, None, None, None)
 
             # this branch only ran previously when context was ContextFlags.COMMAND_LINE
-            context_str = ContextFlags._get_context_string(ContextFlags.COMMAND_LINE)
+            context_str = ContextFlags._get_context_string(_COMMAND_LINE)
             log_condition_satisfied = True
 
         # standard logging
         else:
-            if self.log_condition is None or self.log_condition is LogCondition.OFF:
+            if self.log_condition is None or self.log_condition is _LOG_CONDITION_OFF:
                 return
 
             if context is None:
@@ -1084,8 +1142,8 @@ class Parameter(types.SimpleNamespace):
 
         if (
             not log_condition_satisfied
-            and self.log_condition & LogCondition.INITIALIZATION
-            and self._owner._owner.initialization_status is ContextFlags.INITIALIZING
+            and self.log_condition & _LOG_CONDITION_INITIALIZATION
+            and self._owner._owner.initialization_status is _INITIALIZING
         ):
             log_condition_satisfied = True
 
@@ -1125,9 +1183,18 @@ class Parameter(types.SimpleNamespace):
         except TypeError:
             self.log.pop(execution_ids, None)
 
-    def _initialize_from_context(self, context=None, base_context=Context(execution_id=None), override=True):
-        from psyneulink.core.components.component import Component
-
+    def _initialize_from_context(
+        self,
+        context=None,
+        base_context=Context(execution_id=None),
+        override=True,
+        copy_on_write=False
+    ):
+        """
+            Initializes the value and history of this Parameter in **context** from those in **base_context**.
+            If **copy_on_write** is True, they are shared with **base_context** until they are accessed or modified
+            in **context** (see `Parameter_portfulness`), so **base_context** must not be modified in the meantime.
+        """
         try:
             try:
                 cur_val = self.values[context.execution_id]
@@ -1145,24 +1212,39 @@ class Parameter(types.SimpleNamespace):
                 except KeyError:
                     new_history = NotImplemented
 
-                shared_types = (Component, types.MethodType)
+                if new_history is None:
+                    raise ParameterError('history should always be a collections.deque if it exists')
 
-                if isinstance(new_val, (dict, list)):
-                    new_val = copy_iterable_with_shared(new_val, shared_types)
-                elif not isinstance(new_val, shared_types):
-                    new_val = copy.deepcopy(new_val)
+                self._shared_value_execution_ids.discard(context.execution_id)
+                self._shared_history_execution_ids.discard(context.execution_id)
 
-                self.values[context.execution_id] = new_val
+                if copy_on_write:
+                    self.values[context.execution_id] = new_val
+                    if not isinstance(new_val, _parameter_value_immutable_types):
+                        self._shared_value_execution_ids.add(context.execution_id)
 
-                if new_history is None:
-                    raise ParameterError('history should always be a collections.deque if it exists')
-                elif new_history is not NotImplemented:
-                    # shallow copy is OK because history should not change
-                    self.history[context.execution_id] = copy.copy(new_history)
+                    if new_history is not NotImplemented:
+                        self.history[context.execution_id] = new_history
+                        self._shared_history_execution_ids.add(context.execution_id)
+                else:
+                    self.values[context.execution_id] = _copy_parameter_context_value(new_val)
+
+                    if new_history is not NotImplemented:
+                        # shallow copy is OK because history should not change
+                        self.history[context.execution_id] = copy.copy(new_history)
 
         except ParameterError as e:
             raise ParameterError('Error when attempting to initialize from {0}: {1}'.format(base_context.execution_id, e))
 
+    def _unshare_value(self, execution_id):
+        self.values[execution_id] = _copy_parameter_context_value(self.values[execution_id])
+        self._shared_value_execution_ids.discard(execution_id)
+
+    def _unshare_history(self, execution_id):
+        # shallow copy is OK because history should not change
+        self.history[execution_id] = copy.copy(self.history[execution_id])
+        self._shared_history_execution_ids.discard(execution_id)
+
     # KDM 7/30/18: the below is weird like this in order to use this like a property, but also include it
     # in the interface for user simplicity: that is, inheritable (by this Parameter's children or from its parent),
     # visible in a Parameter's repr, and easily settable by the user
@@ -1175,8 +1257,12 @@ class Parameter(types.SimpleNamespace):
         if value < self.history_min_length:
             raise ParameterError(f'Parameter {self._owner._owner}.{self.name} requires history of length at least {self.history_min_length}.')
         super().__setattr__('history_max_length', value)
-        for execution_id in self.history:
-            self.history[execution_id] = collections.deque(self.history[execution_id], maxlen=value)
+        if value:
+            for execution_id in self.history:
+                self.history[execution_id] = collections.deque(self.history[execution_id], maxlen=value)
+        else:
+            self.history.clear()
+        self._shared_history_execution_ids.clear()
 
     def _set_log_condition(self, value):
         if not isinstance(value, LogCondition):
@@ -20,8 +20,9 @@ from .builder_context import *
 from .builder_context import _all_modules, _convert_llvm_ir_to_ctype
 from .debug import debug_env
 from .execution import *
-from .execution import _tupleize
+from .execution import _split_run_outputs, _tupleize
 from .jit_engine import *
+from .stats import *
 
 __all__ = ['LLVMBuilderContext']
 
@@ -95,13 +96,14 @@ class LLVMBinaryFunction:
         self.cuda_call(*wrap_args)
 
     @staticmethod
-    @functools.lru_cache(maxsize=32)
     def from_obj(obj):
+        # Generated functions are cached by the builder context,
+        # and regenerated only if the structure of obj changed
         name = LLVMBuilderContext.get_global().gen_llvm_function(obj).name
         return LLVMBinaryFunction.get(name)
 
     @staticmethod
-    @functools.lru_cache(maxsize=32)
+    @functools.lru_cache(maxsize=None)
     def get(name: str):
         _llvm_build(LLVMBuilderContext._llvm_generation)
         return LLVMBinaryFunction(name)
@@ -117,7 +119,7 @@ class LLVMBinaryFunction:
         return LLVMBinaryFunction.get(multirun_llvm.name)
 
 
-_cpu_engine = cpu_jit_engine()
+_cpu_engine = cpu_jit_engine(None if "no_disk_cache" in debug_env else disk_object_cache())
 if ptx_enabled:
     _ptx_engine = ptx_jit_engine()
 
@@ -149,9 +151,9 @@ def cleanup():
     _modules.clear()
     _compiled_modules.clear()
     _all_modules.clear()
+    LLVMBuilderContext.get_global().clear_cache()
 
     LLVMBinaryFunction.get.cache_clear()
-    LLVMBinaryFunction.from_obj.cache_clear()
     init_builtins()
 
 
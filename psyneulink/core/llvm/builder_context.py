@@ -18,7 +18,7 @@ from llvmlite import ir
 import numpy as np
 import os
 import re
-from typing import Set
+from typing import Any, List, NamedTuple, Set
 import weakref
 try:
     import torch
@@ -26,8 +26,9 @@ try:
 except ImportError:
     torch_available = False
 
+from psyneulink.core.globals.context import Context
 from psyneulink.core.scheduling.time import TimeScale
-from psyneulink.core.globals.keywords import AFTER, BEFORE
+from psyneulink.core.globals.keywords import AFTER, BEFORE, MATRIX
 
 from psyneulink.core import llvm as pnlvm
 from .debug import debug_env
@@ -36,7 +37,7 @@ from .helpers import ConditionGenerator
 __all__ = ['LLVMBuilderContext', '_modules', '_find_llvm_function']
 
 
-_modules: Set[ir.Module] = set()
+_modules: List[ir.Module] = []
 _all_modules: Set[ir.Module] = set()
 _struct_count = 0
 
@@ -49,7 +50,7 @@ def module_count():
 
 
 _BUILTIN_PREFIX = "__pnl_builtin_"
-_builtin_intrinsics = frozenset(('pow', 'log', 'exp', 'printf'))
+_builtin_intrinsics = frozenset(('pow', 'log', 'exp', 'printf', 'thread_create', 'thread_join'))
 
 
 class LLVMBuilderContext:
@@ -63,6 +64,8 @@ class LLVMBuilderContext:
         self._modules = []
         self._cache = weakref.WeakKeyDictionary()
         self._learningcache = weakref.WeakKeyDictionary()
+        # Objects used by the functions that are being generated
+        self._dependencies = []
 
     def __enter__(self):
         module = ir.Module(name="PsyNeuLinkModule-" + str(LLVMBuilderContext._llvm_generation))
@@ -73,7 +76,7 @@ class LLVMBuilderContext:
     def __exit__(self, e_type, e_value, e_traceback):
         assert len(self._modules) > 0
         module = self._modules.pop()
-        _modules.add(module)
+        _modules.append(module)
         _all_modules.add(module)
 
     @property
@@ -124,18 +127,63 @@ class LLVMBuilderContext:
 
         return builder
 
-    def gen_llvm_function(self, obj) -> ir.Function:
-        cache = self._cache
+    def clear_cache(self):
+        self._cache.clear()
+        self._learningcache.clear()
+
+    def _get_cache(self, obj):
         try:
             # HACK: allows for learning bin func and non-learning to differ
             if obj.learning_enabled is True:
-                cache = self._learningcache
+                return self._learningcache
         except AttributeError as e:
             pass
 
-        if obj not in cache:
-            cache[obj] = obj._gen_llvm_function()
-        return cache[obj]
+        return self._cache
+
+    def _get_compilation_key(self, obj):
+        get_key = getattr(obj, '_get_compilation_key', None)
+        return None if get_key is None else get_key(self)
+
+    def _is_up_to_date(self, obj, checked):
+        """
+        Check that the cached function of **obj** and functions of
+        all objects it uses were generated for their current structure.
+        """
+        if obj in checked:
+            return checked[obj]
+
+        # Break dependency cycles
+        checked[obj] = True
+        entry = self._get_cache(obj).get(obj)
+        up_to_date = entry is not None and entry.key == self._get_compilation_key(obj) and \
+                     all(self._is_up_to_date(d, checked) for d in entry.dependencies)
+        checked[obj] = up_to_date
+        return up_to_date
+
+    def gen_llvm_function(self, obj) -> ir.Function:
+        cache = self._get_cache(obj)
+        entry = cache.get(obj)
+        if entry is None or not self._is_up_to_date(obj, {}):
+            key = self._get_compilation_key(obj)
+            if entry is not None and entry.key != key:
+                _clear_compilation_data(obj)
+
+            if "compile" in debug_env:
+                print("GENERATING FUNCTION FOR: {}".format(obj))
+
+            self._dependencies.append(weakref.WeakSet())
+            try:
+                function = obj._gen_llvm_function()
+            finally:
+                dependencies = self._dependencies.pop()
+            entry = _CachedFunction(key, dependencies, function)
+            cache[obj] = entry
+
+        if len(self._dependencies) > 0:
+            self._dependencies[-1].add(obj)
+
+        return entry.function
 
     def import_llvm_function(self, obj) -> ir.Function:
         """
@@ -423,11 +471,22 @@ class LLVMBuilderContext:
             zero = self.int32_ty(0)
             any_cond = ir.IntType(1)(0)
 
+            # Learning nodes are excluded from execution if learning is disabled
+            if composition.enable_learning:
+                disabled_nodes = set()
+            else:
+                from psyneulink.core.compositions.composition import NodeRole
+                disabled_nodes = set(composition.get_nodes_by_role(NodeRole.LEARNING))
+
             # Calculate execution set before running the mechanisms
             for idx, mech in enumerate(composition.nodes):
                 run_set_mech_ptr = builder.gep(run_set_ptr,
                                                [zero, self.int32_ty(idx)],
                                                name="run_cond_ptr_" + mech.name)
+                if mech in disabled_nodes:
+                    builder.store(ir.IntType(1)(0), run_set_mech_ptr)
+                    continue
+
                 mech_cond = cond_gen.generate_sched_condition(
                     builder, composition._get_processing_condition_set(mech),
                     cond, mech)
@@ -489,6 +548,9 @@ class LLVMBuilderContext:
 
             builder.position_at_end(exit_block)
 
+            if simulation is False and composition.enable_learning:
+                self._gen_composition_learning_updates(composition, builder, state, params, data, cond, cond_gen)
+
             if simulation is False and composition.enable_controller and \
                composition.controller_mode == AFTER:
                 assert composition.controller is not None
@@ -504,6 +566,81 @@ class LLVMBuilderContext:
 
         return builder.function
 
+    def _gen_composition_learning_updates(self, composition, builder, state, params, data, cond, cond_gen):
+        # Apply weight changes of the LearningProjections whose LearningMechanism
+        # ran in this trial, and refresh the error matrices of LearningMechanisms
+        # so that the next trial uses the updated weights.
+        zero = self.int32_ty(0)
+        learned_projections = set()
+        for lp in composition.projections:
+            learned_proj = lp.receiver.owner
+            if learned_proj not in composition.projections or not lp.learning_enabled:
+                continue
+
+            learning_mech = lp.sender.owner
+            lm_idx = composition._get_node_index(learning_mech)
+            port_idx = learning_mech.output_ports.index(lp.sender)
+            learning_signal = builder.gep(data, [zero, zero, self.int32_ty(lm_idx),
+                                                 self.int32_ty(port_idx)])
+
+            lp_idx = composition.projections.index(lp)
+            lp_params = builder.gep(params, [zero, self.int32_ty(1), self.int32_ty(lp_idx)])
+            lp_state = builder.gep(state, [zero, self.int32_ty(1), self.int32_ty(lp_idx)])
+            lp_function = self.import_llvm_function(lp)
+
+            proj_idx = composition.projections.index(learned_proj)
+            proj_params = builder.gep(params, [zero, self.int32_ty(1), self.int32_ty(proj_idx)])
+            proj_f_params = self.get_param_ptr(learned_proj, builder, proj_params,
+                                               learned_proj.parameters.function.name)
+            # Matrix parameters are flattened (see Component._get_param_values)
+            matrix = self.get_param_ptr(learned_proj.function, builder, proj_f_params, MATRIX)
+            learned_projections.add(learned_proj)
+
+            ran = cond_gen.generate_ran_this_trial(builder, cond, learning_mech)
+            with builder.if_then(ran):
+                lp_in = _gen_reshape_learning_signal(self, builder, learning_signal,
+                                                     lp_function.args[2].type.pointee)
+                lp_out = builder.alloca(lp_function.args[3].type.pointee)
+                builder.call(lp_function, [lp_params, lp_state, lp_in, lp_out])
+
+                weight_changes = builder.bitcast(lp_out, self.float_ty.as_pointer())
+                weights = builder.bitcast(matrix, self.float_ty.as_pointer())
+                changes_len = _get_flat_count(lp_out.type.pointee)
+                weights_len = matrix.type.pointee.count
+                if changes_len == weights_len:
+                    stride = 1
+                elif changes_len ** 2 == weights_len:
+                    # A vector of weight changes modifies the diagonal (see LearningProjection._execute)
+                    stride = changes_len + 1
+                else:
+                    assert False, "Weight changes of {} ({}) don't match the matrix of {} ({})".format(
+                        lp.name, lp_out.type.pointee, learned_proj.name, matrix.type.pointee)
+
+                with pnlvm.helpers.for_loop_zero_inc(builder, self.int32_ty(changes_len), "apply_weight_changes") as (b1, idx):
+                    change = b1.load(b1.gep(weight_changes, [idx]))
+                    weight_ptr = b1.gep(weights, [b1.mul(idx, self.int32_ty(stride))])
+                    b1.store(b1.fadd(b1.load(weight_ptr), change), weight_ptr)
+
+        for node in composition.nodes:
+            error_matrices = getattr(node, 'error_matrices', None)
+            if error_matrices is None or len(node._get_mech_params_init(None)) == 0:
+                continue
+
+            node_idx = composition._get_node_index(node)
+            for i, error_matrix in enumerate(error_matrices):
+                source_proj = getattr(error_matrix, 'owner', None)
+                if source_proj not in learned_projections:
+                    continue
+
+                proj_idx = composition.projections.index(source_proj)
+                proj_params = builder.gep(params, [zero, self.int32_ty(1), self.int32_ty(proj_idx)])
+                proj_f_params = self.get_param_ptr(source_proj, builder, proj_params,
+                                                   source_proj.parameters.function.name)
+                matrix = self.get_param_ptr(source_proj.function, builder, proj_f_params, MATRIX)
+                dst = builder.gep(params, [zero, zero, self.int32_ty(node_idx),
+                                           self.int32_ty(2), self.int32_ty(i)])
+                builder.store(builder.load(matrix), dst)
+
     def gen_composition_run(self, composition, simulation=False, learning=False):
         name = 'run_sim_wrap_' if simulation else 'run_wrap_'
         name += composition.name
@@ -658,6 +795,49 @@ class LLVMBuilderContext:
         assert False, "Don't know how to convert {}".format(type(t))
 
 
+class _CachedFunction(NamedTuple):
+    key: Any
+    dependencies: weakref.WeakSet
+    function: ir.Function
+
+
+def _clear_compilation_data(obj):
+    # Structures allocated for the previous layout can't be
+    # passed to the regenerated function
+    for p in getattr(obj, '_compilation_data', ()):
+        for execution_id in list(p.values):
+            p.delete(Context(execution_id=execution_id))
+
+
+def _get_flat_count(ty):
+    count = 1
+    while isinstance(ty, ir.ArrayType):
+        count *= ty.count
+        ty = ty.element
+    return count
+
+
+def _gen_reshape_learning_signal(ctx, builder, learning_signal, target_ty):
+    if learning_signal.type.pointee == target_ty:
+        return learning_signal
+
+    signal_len = _get_flat_count(learning_signal.type.pointee)
+    if signal_len == _get_flat_count(target_ty):
+        return builder.bitcast(learning_signal, target_ty.as_pointer())
+
+    # Expand vector signal to a diagonal matrix (see LearningProjection._execute)
+    assert signal_len ** 2 == _get_flat_count(target_ty), \
+        "Learning signal ({}) doesn't match {}".format(learning_signal.type.pointee, target_ty)
+    matrix = builder.alloca(target_ty)
+    builder.store(target_ty(None), matrix)
+    src = builder.bitcast(learning_signal, ctx.float_ty.as_pointer())
+    dst = builder.bitcast(matrix, ctx.float_ty.as_pointer())
+    with pnlvm.helpers.for_loop_zero_inc(builder, ctx.int32_ty(signal_len), "diag_signal") as (b1, idx):
+        val = b1.load(b1.gep(src, [idx]))
+        b1.store(val, b1.gep(dst, [b1.mul(idx, ctx.int32_ty(signal_len + 1))]))
+    return matrix
+
+
 def _find_llvm_function(name: str, mods=_all_modules) -> ir.Function:
     f = None
     for m in mods:
@@ -10,7 +10,7 @@
 
 import ctypes
 from ctypes import util
-from llvmlite import ir
+from llvmlite import binding, ir
 from . import helpers
 from .builder_context import LLVMBuilderContext, _BUILTIN_PREFIX
 from psyneulink.core import llvm as pnlvm
@@ -31,6 +31,93 @@ def _setup_builtin_func_builder(ctx, name, args):
     return builder
 
 
+# Number of vectors processed in each iteration of the matrix builtins
+_VECTOR_UNROLL = 4
+# Number of matrix rows processed before moving on to the next block of
+# columns in vxm. The rows of a tile are read sequentially, one block at a
+# time, which keeps the hardware prefetcher busy and the lines in cache.
+_VXM_TILE = 8
+
+
+def _get_host_vector_width(ctx):
+    """Return the number of ctx.float_ty elements in the widest vector register of the host CPU."""
+    try:
+        features = binding.get_host_cpu_features()
+    except RuntimeError:
+        return 1
+
+    for feature, bits in (("avx512f", 512), ("avx", 256), ("sse2", 128), ("neon", 128), ("altivec", 128)):
+        if features.get(feature, False):
+            return bits // 8 // _get_float_size(ctx.float_ty)
+    return 1
+
+
+def _get_float_size(ty):
+    return 8 if isinstance(ty, ir.DoubleType) else 4
+
+
+def _get_fmuladd(module, ty):
+    # llvmlite can't generate intrinsic names for vector types
+    if isinstance(ty, ir.VectorType):
+        suffix = "v{}{}".format(ty.count, ty.element.intrinsic_name)
+    else:
+        suffix = ty.intrinsic_name
+    name = "llvm.fmuladd." + suffix
+    if name in module.globals:
+        return module.globals[name]
+    return ir.Function(module, ir.FunctionType(ty, [ty, ty, ty]), name=name)
+
+
+def _vector_ptr(builder, ptr, vec_ty):
+    return builder.bitcast(ptr, vec_ty.as_pointer())
+
+
+def _vector_load(builder, ptr, vec_ty):
+    # Arrays are only aligned to their element type
+    return builder.load(_vector_ptr(builder, ptr, vec_ty), align=_get_float_size(vec_ty.element))
+
+
+def _vector_store(builder, val, ptr):
+    builder.store(val, _vector_ptr(builder, ptr, val.type), align=_get_float_size(val.type.element))
+
+
+def _vector_splat(builder, val, vec_ty):
+    vec = builder.insert_element(ir.Constant(vec_ty, ir.Undefined), val, ir.IntType(32)(0))
+    mask = ir.Constant(ir.VectorType(ir.IntType(32), vec_ty.count), [0] * vec_ty.count)
+    return builder.shuffle_vector(vec, ir.Constant(vec_ty, ir.Undefined), mask)
+
+
+def _vector_reduce_add(builder, vec):
+    res = builder.extract_element(vec, ir.IntType(32)(0))
+    for i in range(1, vec.type.count):
+        res = builder.fadd(res, builder.extract_element(vec, ir.IntType(32)(i)))
+    return res
+
+
+def _gen_vector_map(ctx, builder, op, args, count, out, id):
+    """Store op applied to the elements of **args** to the first **count** elements of **out**.
+
+    Pointer arguments are arrays of **count** elements, other arguments are
+    scalars used with every element.
+    """
+    vec_ty = ir.VectorType(ctx.float_ty, _get_host_vector_width(ctx))
+    vec_args = [a if isinstance(a.type, ir.PointerType) else _vector_splat(builder, a, vec_ty) for a in args]
+
+    block = vec_ty.count * _VECTOR_UNROLL
+    count_blocks = builder.sub(count, builder.urem(count, count.type(block)))
+    with helpers.for_loop(builder, count.type(0), count_blocks, count.type(block), id + "_block") as (b1, index):
+        for u in range(_VECTOR_UNROLL):
+            vec_index = b1.add(index, count.type(u * vec_ty.count))
+            vals = [_vector_load(b1, b1.gep(a, [vec_index]), vec_ty) if isinstance(a.type, ir.PointerType) else a
+                    for a in vec_args]
+            _vector_store(b1, op(b1, *vals), b1.gep(out, [vec_index]))
+
+    # Remaining elements
+    with helpers.for_loop(builder, count_blocks, count, count.type(1), id + "_remainder") as (b1, index):
+        vals = [b1.load(b1.gep(a, [index])) if isinstance(a.type, ir.PointerType) else a for a in args]
+        b1.store(op(b1, *vals), b1.gep(out, [index]))
+
+
 def setup_vxm(ctx):
     # Setup types
     double_ptr_ty = ctx.float_ty.as_pointer()
@@ -43,29 +130,50 @@ def setup_vxm(ctx):
     builder = _setup_builtin_func_builder(ctx, "vxm", (double_ptr_ty, double_ptr_ty, ctx.int32_ty, ctx.int32_ty, double_ptr_ty))
     v, m, x, y, o = builder.function.args
 
+    vec_ty = ir.VectorType(ctx.float_ty, _get_host_vector_width(ctx))
+    vec_fmuladd = _get_fmuladd(builder.module, vec_ty)
+    fmuladd = _get_fmuladd(builder.module, ctx.float_ty)
+    acc_ptrs = [builder.alloca(vec_ty) for _ in range(_VECTOR_UNROLL)]
+    acc_ptr = builder.alloca(ctx.float_ty)
+
     # zero the output array
     with helpers.for_loop_zero_inc(builder, y, "zero") as (b1, index):
         ptr = b1.gep(o, [index])
         b1.store(ctx.float_ty(0), ptr)
 
-    # Multiplication
-    with helpers.for_loop_zero_inc(builder, x, "vxm_outer") as (b1, index_i):
-        with helpers.for_loop_zero_inc(b1, y, "vxm_inner") as (b2, index_j):
-            # Multiplication and accumulation
-            vector_ptr = builder.gep(v, [index_i])
-            matrix_index = builder.mul(index_i, y)
-            matrix_index = builder.add(matrix_index, index_j)
-            matrix_ptr = builder.gep(m, [matrix_index])
-            out_ptr = builder.gep(o, [index_j])
-
-            vector_el = builder.load(vector_ptr)
-            matrix_el = builder.load(matrix_ptr)
-            out_el = builder.load(out_ptr)
-
-            new_el = builder.fmul(vector_el, matrix_el)
-            new_el = builder.fadd(new_el, out_el)
-
-            builder.store(new_el, out_ptr)
+    # Blocks of columns that fill the unrolled vector accumulators
+    block = vec_ty.count * _VECTOR_UNROLL
+    y_blocks = builder.sub(y, builder.urem(y, y.type(block)))
+
+    # Multiplication, in tiles of rows
+    with helpers.for_loop(builder, x.type(0), x, x.type(_VXM_TILE), "vxm_tile") as (b1, tile_start):
+        tile_stop = helpers.uint_min(b1, b1.add(tile_start, x.type(_VXM_TILE)), x)
+        with helpers.for_loop(b1, y.type(0), y_blocks, y.type(block), "vxm_block") as (b2, index_j):
+            out_ptrs = [b2.gep(o, [b2.add(index_j, y.type(u * vec_ty.count))]) for u in range(_VECTOR_UNROLL)]
+            for acc, out_ptr in zip(acc_ptrs, out_ptrs):
+                b2.store(_vector_load(b2, out_ptr, vec_ty), acc)
+
+            with helpers.for_loop(b2, tile_start, tile_stop, x.type(1), "vxm_rows") as (b3, index_i):
+                vector_el = _vector_splat(b3, b3.load(b3.gep(v, [index_i])), vec_ty)
+                row_ptr = b3.gep(m, [b3.add(b3.mul(index_i, y), index_j)])
+                for u, acc in enumerate(acc_ptrs):
+                    matrix_ptr = b3.gep(row_ptr, [ctx.int32_ty(u * vec_ty.count)])
+                    matrix_el = _vector_load(b3, matrix_ptr, vec_ty)
+                    b3.store(b3.call(vec_fmuladd, [vector_el, matrix_el, b3.load(acc)]), acc)
+
+            for acc, out_ptr in zip(acc_ptrs, out_ptrs):
+                _vector_store(b2, b2.load(acc), out_ptr)
+
+        # Remaining columns
+        with helpers.for_loop(b1, y_blocks, y, y.type(1), "vxm_remainder") as (b2, index_j):
+            out_ptr = b2.gep(o, [index_j])
+            b2.store(b2.load(out_ptr), acc_ptr)
+            with helpers.for_loop(b2, tile_start, tile_stop, x.type(1), "vxm_remainder_rows") as (b3, index_i):
+                vector_el = b3.load(b3.gep(v, [index_i]))
+                matrix_index = b3.add(b3.mul(index_i, y), index_j)
+                matrix_el = b3.load(b3.gep(m, [matrix_index]))
+                b3.store(b3.call(fmuladd, [vector_el, matrix_el, b3.load(acc_ptr)]), acc_ptr)
+            b2.store(b2.load(acc_ptr), out_ptr)
 
     builder.ret_void()
 
@@ -82,30 +190,43 @@ def setup_vxm_transposed(ctx):
     builder = _setup_builtin_func_builder(ctx, "vxm_transposed", (double_ptr_ty, double_ptr_ty, ctx.int32_ty, ctx.int32_ty, double_ptr_ty))
     v, m, x, y, o = builder.function.args
 
-    # zero the output array
-    with helpers.for_loop_zero_inc(builder, x, "zero") as (b1, index):
-        ptr = b1.gep(o, [index])
-        b1.store(ctx.float_ty(0), ptr)
-
-    # Multiplication
-    with helpers.for_loop_zero_inc(builder, x, "trans_vxm_outer") as (b1, index_j):
-        with helpers.for_loop_zero_inc(b1, y, "trans_vxm_inner") as (b2, index_i):
-
-            # Multiplication and accumulation
-            vector_ptr = builder.gep(v, [index_i])
-            matrix_index = builder.mul(index_j, y)
-            matrix_index = builder.add(matrix_index, index_i)
-            matrix_ptr = builder.gep(m, [matrix_index])
-            out_ptr = builder.gep(o, [index_j])
-
-            vector_el = builder.load(vector_ptr)
-            matrix_el = builder.load(matrix_ptr)
-            out_el = builder.load(out_ptr)
-
-            new_el = builder.fmul(vector_el, matrix_el)
-            new_el = builder.fadd(new_el, out_el)
-
-            builder.store(new_el, out_ptr)
+    vec_ty = ir.VectorType(ctx.float_ty, _get_host_vector_width(ctx))
+    vec_fmuladd = _get_fmuladd(builder.module, vec_ty)
+    fmuladd = _get_fmuladd(builder.module, ctx.float_ty)
+    acc_ptrs = [builder.alloca(vec_ty) for _ in range(_VECTOR_UNROLL)]
+    sum_ptr = builder.alloca(ctx.float_ty)
+
+    # Each output element is a dot product of the vector and a matrix row.
+    # The rows are processed in blocks that share loads of the vector.
+    y_vectors = builder.sub(y, builder.urem(y, y.type(vec_ty.count)))
+
+    def _gen_dot_rows(b, index_j, acc_ptrs, id):
+        row_ptrs = [b.gep(m, [b.mul(b.add(index_j, x.type(r)), y)]) for r in range(len(acc_ptrs))]
+        for acc in acc_ptrs:
+            b.store(ir.Constant(vec_ty, [0] * vec_ty.count), acc)
+
+        with helpers.for_loop(b, y.type(0), y_vectors, y.type(vec_ty.count), id + "_vectors") as (b1, index_i):
+            vector_el = _vector_load(b1, b1.gep(v, [index_i]), vec_ty)
+            for row_ptr, acc in zip(row_ptrs, acc_ptrs):
+                matrix_el = _vector_load(b1, b1.gep(row_ptr, [index_i]), vec_ty)
+                b1.store(b1.call(vec_fmuladd, [vector_el, matrix_el, b1.load(acc)]), acc)
+
+        for r, (row_ptr, acc) in enumerate(zip(row_ptrs, acc_ptrs)):
+            b.store(_vector_reduce_add(b, b.load(acc)), sum_ptr)
+            with helpers.for_loop(b, y_vectors, y, y.type(1), id + "_remainder_" + str(r)) as (b1, index_i):
+                vector_el = b1.load(b1.gep(v, [index_i]))
+                matrix_el = b1.load(b1.gep(row_ptr, [index_i]))
+                b1.store(b1.call(fmuladd, [vector_el, matrix_el, b1.load(sum_ptr)]), sum_ptr)
+            out_ptr = b.gep(o, [b.add(index_j, x.type(r))])
+            b.store(b.load(sum_ptr), out_ptr)
+
+    x_blocks = builder.sub(x, builder.urem(x, x.type(_VECTOR_UNROLL)))
+    with helpers.for_loop(builder, x.type(0), x_blocks, x.type(_VECTOR_UNROLL), "trans_vxm_block") as (b1, index_j):
+        _gen_dot_rows(b1, index_j, acc_ptrs, "trans_vxm_block")
+
+    # Remaining rows
+    with helpers.for_loop(builder, x_blocks, x, x.type(1), "trans_vxm_remainder") as (b1, index_j):
+        _gen_dot_rows(b1, index_j, acc_ptrs[:1], "trans_vxm_remainder")
 
     builder.ret_void()
 
@@ -252,18 +373,8 @@ def setup_mat_scalar_mult(ctx):
     builder = _setup_builtin_func_builder(ctx, "mat_scalar_mult", (double_ptr_ty, ctx.float_ty, ctx.int32_ty, ctx.int32_ty, double_ptr_ty))
     m1, s, dim_x, dim_y, o = builder.function.args
 
-    with helpers.for_loop_zero_inc(builder, dim_x, "zero") as (b1, x):
-        with helpers.for_loop_zero_inc(b1, dim_y, "zero_inner") as (b2, y):
-            matrix_index = b2.mul(x, dim_y)
-            matrix_index = b2.add(matrix_index, y)
-
-            m1_ptr = b2.gep(m1, [matrix_index])
-            o_ptr = b2.gep(o, [matrix_index])
-
-            m1_val = b2.load(m1_ptr)
-            o_val = b2.fmul(s, m1_val)
-
-            b2.store(o_val, o_ptr)
+    size = builder.mul(dim_x, dim_y)
+    _gen_vector_map(ctx, builder, lambda b, s_val, m1_val: b.fmul(s_val, m1_val), [s, m1], size, o, "mat_scalar_mult")
 
     builder.ret_void()
 
@@ -282,18 +393,8 @@ def setup_mat_scalar_add(ctx):
     builder = _setup_builtin_func_builder(ctx, "mat_scalar_add", (double_ptr_ty, ctx.float_ty, ctx.int32_ty, ctx.int32_ty, double_ptr_ty))
     m1, s, dim_x, dim_y, o = builder.function.args
 
-    with helpers.for_loop_zero_inc(builder, dim_x, "mat_scalar_add_outer") as (b1, x):
-        with helpers.for_loop_zero_inc(b1, dim_y, "mat_scalar_add_inner") as (b2, y):
-            matrix_index = b2.mul(x, dim_y)
-            matrix_index = b2.add(matrix_index, y)
-
-            m1_ptr = b2.gep(m1, [matrix_index])
-            o_ptr = b2.gep(o, [matrix_index])
-
-            m1_val = b2.load(m1_ptr)
-            o_val = b2.fadd(s, m1_val)
-
-            b2.store(o_val, o_ptr)
+    size = builder.mul(dim_x, dim_y)
+    _gen_vector_map(ctx, builder, lambda b, s_val, m1_val: b.fadd(s_val, m1_val), [s, m1], size, o, "mat_scalar_add")
 
     builder.ret_void()
 
@@ -312,18 +413,8 @@ def setup_mat_hadamard(ctx):
     builder = _setup_builtin_func_builder(ctx, "mat_hadamard", (double_ptr_ty, double_ptr_ty, ctx.int32_ty, ctx.int32_ty, double_ptr_ty))
     m1, m2, dim_x, dim_y, o = builder.function.args
 
-    with helpers.for_loop_zero_inc(builder, dim_x, "mat_hadamard_outer") as (b1, x):
-        with helpers.for_loop_zero_inc(b1, dim_y, "mat_hadamard_inner") as (b2, y):
-            matrix_index = b2.mul(x, dim_y)
-            matrix_index = b2.add(matrix_index, y)
-            m1_ptr = b2.gep(m1, [matrix_index])
-            m2_ptr = b2.gep(m2, [matrix_index])
-            o_ptr = b2.gep(o, [matrix_index])
-
-            m1_val = b2.load(m1_ptr)
-            m2_val = b2.load(m2_ptr)
-            o_val = b2.fmul(m1_val, m2_val)
-            b2.store(o_val, o_ptr)
+    size = builder.mul(dim_x, dim_y)
+    _gen_vector_map(ctx, builder, lambda b, m1_val, m2_val: b.fmul(m1_val, m2_val), [m1, m2], size, o, "mat_hadamard")
 
     builder.ret_void()
 
@@ -342,18 +433,8 @@ def setup_mat_sub(ctx):
     builder = _setup_builtin_func_builder(ctx, "mat_sub", (double_ptr_ty, double_ptr_ty, ctx.int32_ty, ctx.int32_ty, double_ptr_ty))
     m1, m2, dim_x, dim_y, o = builder.function.args
 
-    with helpers.for_loop_zero_inc(builder, dim_x, "mat_sub_outer") as (b1, x):
-        with helpers.for_loop_zero_inc(b1, dim_y, "mat_sub_inner") as (b2, y):
-            matrix_index = b2.mul(x, dim_y)
-            matrix_index = b2.add(matrix_index, y)
-            m1_ptr = b2.gep(m1, [matrix_index])
-            m2_ptr = b2.gep(m2, [matrix_index])
-            o_ptr = b2.gep(o, [matrix_index])
-
-            m1_val = b2.load(m1_ptr)
-            m2_val = b2.load(m2_ptr)
-            o_val = b2.fsub(m1_val, m2_val)
-            b2.store(o_val, o_ptr)
+    size = builder.mul(dim_x, dim_y)
+    _gen_vector_map(ctx, builder, lambda b, m1_val, m2_val: b.fsub(m1_val, m2_val), [m1, m2], size, o, "mat_sub")
 
     builder.ret_void()
 
@@ -372,18 +453,8 @@ def setup_mat_add(ctx):
     builder = _setup_builtin_func_builder(ctx, "mat_add", (double_ptr_ty, double_ptr_ty, ctx.int32_ty, ctx.int32_ty, double_ptr_ty))
     m1, m2, dim_x, dim_y, o = builder.function.args
 
-    with helpers.for_loop_zero_inc(builder, dim_x, "zero") as (b1, x):
-        with helpers.for_loop_zero_inc(b1, dim_y, "zero_inner") as (b2, y):
-            matrix_index = b2.mul(x, dim_y)
-            matrix_index = b2.add(matrix_index, y)
-            m1_ptr = b2.gep(m1, [matrix_index])
-            m2_ptr = b2.gep(m2, [matrix_index])
-            o_ptr = b2.gep(o, [matrix_index])
-
-            m1_val = b2.load(m1_ptr)
-            m2_val = b2.load(m2_ptr)
-            o_val = b2.fadd(m1_val, m2_val)
-            b2.store(o_val, o_ptr)
+    size = builder.mul(dim_x, dim_y)
+    _gen_vector_map(ctx, builder, lambda b, m1_val, m2_val: b.fadd(m1_val, m2_val), [m1, m2], size, o, "mat_add")
 
     builder.ret_void()
 
@@ -402,6 +473,11 @@ def setup_pnl_intrinsics(ctx):
     printf_ty = ir.FunctionType(ir.IntType(32), [ir.IntType(8).as_pointer()], var_arg=True)
     ir.Function(ctx.module, printf_ty, name=_BUILTIN_PREFIX + "printf")
 
+    # Thread declarations
+    thread_create_ty, thread_join_ty = _get_thread_function_types()
+    ir.Function(ctx.module, thread_create_ty, name=_BUILTIN_PREFIX + "thread_create")
+    ir.Function(ctx.module, thread_join_ty, name=_BUILTIN_PREFIX + "thread_join")
+
 
 def _generate_intrinsic_wrapper(module, name, ret, args):
     intrinsic = module.declare_intrinsic("llvm." + name, list(set(args)))
@@ -415,6 +491,30 @@ def _generate_intrinsic_wrapper(module, name, ret, args):
     builder.ret(builder.call(intrinsic, function.args))
 
 
+def _get_thread_function_types():
+    # Threads are started with a function that takes, and returns, a pointer
+    # (as pthread_create does), and are identified by a 64bit handle.
+    void_ptr_ty = ir.IntType(8).as_pointer()
+    start_routine_ty = ir.FunctionType(void_ptr_ty, [void_ptr_ty])
+    handle_ty = ir.IntType(64)
+    thread_create_ty = ir.FunctionType(ir.IntType(32), [start_routine_ty.as_pointer(),
+                                                        void_ptr_ty,
+                                                        handle_ty.as_pointer()])
+    thread_join_ty = ir.FunctionType(ir.IntType(32), [handle_ty])
+    return thread_create_ty, thread_join_ty
+
+
+def _find_cpu_symbol(symbol, library):
+    try:
+        import llvmlite.binding as llvm
+        lib = ctypes.util.find_library(library)
+        llvm.load_library_permanently(lib)
+        # Address will be none if the symbol is not found
+        return llvm.address_of_symbol(symbol)
+    except:
+        return None
+
+
 def _generate_cpu_printf_wrapper(module):
     printf_ty = ir.FunctionType(ir.IntType(32), [ir.IntType(8).as_pointer()], var_arg=True)
     function = ir.Function(module, printf_ty, name=_BUILTIN_PREFIX + "printf")
@@ -423,23 +523,48 @@ def _generate_cpu_printf_wrapper(module):
     builder = ir.IRBuilder(block)
     builder.debug_metadata = LLVMBuilderContext.get_debug_location(function, None)
 
-    try:
-        import llvmlite.binding as llvm
-        libc = ctypes.util.find_library("c")
-        llvm.load_library_permanently(libc)
-        # Address will be none if the symbol is not found
-        printf_address = llvm.address_of_symbol("printf")
-    except:
-        printf_address = None
-
-    if printf_address is not None:
-        # Direct pointer constants don't work
-        printf = builder.inttoptr(pnlvm.ir.IntType(64)(printf_address), printf_ty.as_pointer())
+    if _find_cpu_symbol("printf", "c") is not None:
+        # Call the libc function by name, the JIT resolves the symbol when
+        # the code is loaded. Unlike an address constant, this doesn't
+        # change between processes and so doesn't defeat the object cache
+        printf = ir.Function(module, printf_ty, name="printf")
         builder.ret(builder.call(printf, function.args))
     else:
         builder.ret(ir.IntType(32)(-1))
 
 
+def _generate_cpu_thread_wrappers(module):
+    thread_create_ty, thread_join_ty = _get_thread_function_types()
+    create_function = ir.Function(module, thread_create_ty, name=_BUILTIN_PREFIX + "thread_create")
+    create_builder = ir.IRBuilder(create_function.append_basic_block(name="entry"))
+    create_builder.debug_metadata = LLVMBuilderContext.get_debug_location(create_function, None)
+    join_function = ir.Function(module, thread_join_ty, name=_BUILTIN_PREFIX + "thread_join")
+    join_builder = ir.IRBuilder(join_function.append_basic_block(name="entry"))
+    join_builder.debug_metadata = LLVMBuilderContext.get_debug_location(join_function, None)
+
+    # pthread functions live in libpthread for older glibc, and in libc otherwise
+    if _find_cpu_symbol("pthread_create", "pthread") is not None or \
+       _find_cpu_symbol("pthread_create", "c") is not None:
+        start_routine_ty, void_ptr_ty, handle_ptr_ty = thread_create_ty.args
+        pthread_create_ty = ir.FunctionType(ir.IntType(32), [handle_ptr_ty, void_ptr_ty,
+                                                             start_routine_ty, void_ptr_ty])
+        pthread_create = ir.Function(module, pthread_create_ty, name="pthread_create")
+        routine, arg, handle_ptr = create_function.args
+        create_builder.ret(create_builder.call(pthread_create, [handle_ptr, void_ptr_ty(None),
+                                                                routine, arg]))
+
+        pthread_join_ty = ir.FunctionType(ir.IntType(32), [thread_join_ty.args[0],
+                                                           void_ptr_ty.as_pointer()])
+        pthread_join = ir.Function(module, pthread_join_ty, name="pthread_join")
+        join_builder.ret(join_builder.call(pthread_join, [join_function.args[0],
+                                                          void_ptr_ty.as_pointer()(None)]))
+    else:
+        # Report failure to create threads, callers should run the work
+        # in the current thread instead
+        create_builder.ret(ir.IntType(32)(-1))
+        join_builder.ret(ir.IntType(32)(-1))
+
+
 def _generate_cpu_builtins_module(_float_ty):
     """Generate function wrappers for log, exp, and pow intrinsics."""
     module = ir.Module(name="cpu_builtins")
@@ -448,6 +573,7 @@ def _generate_cpu_builtins_module(_float_ty):
 
     _generate_intrinsic_wrapper(module, "pow", _float_ty, [_float_ty, _float_ty])
     _generate_cpu_printf_wrapper(module)
+    _generate_cpu_thread_wrappers(module)
     return module
 
 
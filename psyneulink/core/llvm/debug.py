@@ -18,6 +18,7 @@ Features:
 Increased debug output:
  * "compile" -- prints information messages when modules are compiled
  * "stat" -- prints code generation and compilation statistics at the end
+           (see psyneulink.core.llvm.stats for statistics returned as data)
  * "cuda_data" -- print data upload/download statistic (to GPU VRAM)
  * "comp_node_debug" -- print intermediate results after execution composition node wrapper.
  * "print_values" -- Enabled printfs in llvm code (from ctx printf helper)
@@ -33,6 +34,8 @@ Compilation modifiers:
  * "const_state" -- hardcode base context values into generate code,
                  instead of laoding them from the context argument
  * "no_ref_pass" -- Don't pass arguments to llvm functions by reference
+ * "no_disk_cache" -- Don't store compiled objects in, or load them from,
+                    the persistent cache (see jit_engine.disk_object_cache)
 
 Compiled code dump:
  * "llvm" -- dumps LLVM IR into a file (named after the dumped module).
@@ -11,14 +11,18 @@
 from psyneulink.core.globals.context import Context
 from psyneulink.core.globals.utilities import NodeRole
 
+import concurrent.futures
 import copy
 import ctypes
+import functools
 from collections import defaultdict
 import numpy as np
+import time
 
 from psyneulink.core import llvm as pnlvm
 from . import helpers, jit_engine
 from .debug import debug_env
+from .stats import ExecutionStats, _get_execution_stats
 
 __all__ = ['CompExecution', 'FuncExecution', 'MechExecution']
 
@@ -36,6 +40,49 @@ def _convert_ctype_to_python(x):
     assert False, "Don't know how to convert: {}".format(x)
 
 
+def _convert_ctype_to_numpy(x):
+    """Return a NumPy array that views the memory of ctypes array *x*.
+
+    Structures are represented using structured dtype with the same layout.
+    The array keeps *x* alive.
+    """
+    return np.ctypeslib.as_array(x)
+
+
+def _is_double_dtype(dt):
+    while dt.subdtype is not None:
+        dt = dt.base
+    if dt.names is None:
+        return dt == np.float64
+    return all(_is_double_dtype(dt.fields[name][0]) for name in dt.names)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_offsets(struct_ty):
+    """Return offsets (in doubles) of the fields of a structure that contains only doubles.
+
+    The last item is the size of the whole structure.
+    """
+    sizes = [ctypes.sizeof(t) // ctypes.sizeof(ctypes.c_double) for _, t in struct_ty._fields_]
+    return np.cumsum([0] + sizes)
+
+
+def _split_run_outputs(outputs):
+    """Split structured array of run outputs into a list of trial outputs.
+
+    The output of every trial is a list of views of the values of the
+    individual output ports. Outputs of runs with multiple execution
+    contexts are split into a list of trial outputs for each context.
+    """
+    if outputs.ndim > 1:
+        return [_split_run_outputs(o) for o in outputs]
+
+    values = [outputs[name] for name in outputs.dtype.names]
+    if len(values) == 0:
+        return [[] for _ in range(len(outputs))]
+    return [list(trial) for trial in zip(*values)]
+
+
 def _tupleize(x):
     try:
         return tuple(_tupleize(y) for y in x)
@@ -44,7 +91,7 @@ def _tupleize(x):
 
 
 class CUDAExecution:
-    def __init__(self, buffers=['param_struct', 'state_struct']):
+    def __init__(self, buffers=['param_struct', 'state_struct'], num_threads=1):
         for b in buffers:
             setattr(self, "_buffer_cuda_" + b, None)
         self._uploaded_bytes = 0
@@ -52,8 +99,13 @@ class CUDAExecution:
         self.__cuda_out_buf = None
         self.__debug_env = debug_env
         self.__vo_ty = None
+        self._num_threads = num_threads
+        self.__thread_pool = None
 
     def __del__(self):
+        if self.__thread_pool is not None:
+            self.__thread_pool.shutdown(wait=False)
+
         if "cuda_data" in self.__debug_env:
             try:
                 name = self._bin_func.name
@@ -68,6 +120,45 @@ class CUDAExecution:
         # CUDA uses the same function for single and multi run
         return self._bin_func
 
+    def _call_multirun(self, bin_multirun, *args):
+        """Call multirun wrapper *bin_multirun* for all execution contexts.
+
+        All array arguments in *args* have one element per execution context,
+        other arguments (e.g. the number of trials of a run) are shared.
+        The number of contexts is appended as the last argument.
+        If more than one thread is used, the contexts are split into
+        contiguous slices that are run in parallel; ctypes releases the GIL
+        for the duration of each call.
+        """
+        num_contexts = len(self._execution_contexts)
+        num_threads = min(self._num_threads, num_contexts)
+        if num_threads <= 1:
+            bin_multirun.wrap_call(*args, self._ct_len)
+            return
+
+        # Get the function before starting the threads; looking it up might
+        # compile the binary
+        c_func = bin_multirun.c_func
+
+        def _run_slice(contexts):
+            start = int(contexts[0])
+            ct_len = ctypes.c_int(len(contexts))
+            ptrs = []
+            for arg in args:
+                ptr = ctypes.addressof(arg)
+                if isinstance(arg, ctypes.Array):
+                    ptr += start * ctypes.sizeof(arg._type_)
+                ptrs.append(ptr)
+            ptrs.append(ctypes.addressof(ct_len))
+            c_func(*(ctypes.cast(p, t) for p, t in zip(ptrs, c_func.argtypes)))
+
+        if self.__thread_pool is None:
+            self.__thread_pool = concurrent.futures.ThreadPoolExecutor(self._num_threads)
+
+        slices = np.array_split(np.arange(num_contexts), num_threads)
+        # Consume the results to raise any exceptions
+        list(self.__thread_pool.map(_run_slice, slices))
+
     @property
     def _vo_ty(self):
         if self.__vo_ty is None:
@@ -129,8 +220,8 @@ class CUDAExecution:
 
 class FuncExecution(CUDAExecution):
 
-    def __init__(self, component, execution_ids=[None]):
-        super().__init__()
+    def __init__(self, component, execution_ids=[None], num_threads=1):
+        super().__init__(num_threads=num_threads)
         self._bin_func = pnlvm.LLVMBinaryFunction.from_obj(component)
         self._execution_contexts = [
             Context(execution_id=eid) for eid in execution_ids
@@ -186,17 +277,21 @@ class FuncExecution(CUDAExecution):
         return self._get_compilation_param('state_struct', '_get_state_initializer', 1, self._execution_contexts[0])
 
     def execute(self, variable):
-        new_variable = np.asfarray(variable)
-
         if len(self._execution_contexts) > 1:
+            new_variable = np.asfarray(variable)
             # wrap_call casts the arguments so we only need contiguous data
             # layout
             ct_vi = np.ctypeslib.as_ctypes(new_variable)
-            self._bin_multirun.wrap_call(self._param_struct,
-                                         self._state_struct,
-                                         ct_vi, self._ct_vo, self._ct_len)
+            self._call_multirun(self._bin_multirun,
+                                self._param_struct, self._state_struct,
+                                ct_vi, self._ct_vo)
         else:
-            ct_vi = new_variable.ctypes.data_as(ctypes.POINTER(self._vi_ty))
+            try:
+                new_variable = np.asfarray(variable)
+                ct_vi = new_variable.ctypes.data_as(ctypes.POINTER(self._vi_ty))
+            except ValueError:
+                # Items of different shapes are passed in a struct
+                ct_vi = ctypes.byref(self._vi_ty(*_tupleize(variable)))
             self._bin_func(ctypes.byref(self._param_struct),
                            ctypes.byref(self._state_struct),
                            ct_vi, ctypes.byref(self._ct_vo))
@@ -217,8 +312,9 @@ class MechExecution(FuncExecution):
 
 class CompExecution(CUDAExecution):
 
-    def __init__(self, composition, execution_ids=[None]):
-        super().__init__(buffers=['state_struct', 'param_struct', 'data_struct', 'conditions'])
+    def __init__(self, composition, execution_ids=[None], num_threads=1):
+        super().__init__(buffers=['state_struct', 'param_struct', 'data_struct', 'conditions'],
+                         num_threads=num_threads)
         self._composition = composition
         self._execution_contexts = [
             Context(execution_id=eid) for eid in execution_ids
@@ -230,6 +326,8 @@ class CompExecution(CUDAExecution):
         self.__bin_run_multi_func = None
         self.__debug_env = debug_env
         self.__frozen_vals = None
+        # Statistics of this execution, also added to the totals of the composition
+        self.stats = ExecutionStats(parent=_get_execution_stats(composition))
 
         # TODO: Consolidate these
         if len(execution_ids) > 1:
@@ -352,10 +450,13 @@ class CompExecution(CUDAExecution):
         return _convert_ctype_to_python(res_struct)
 
     def extract_node_struct(self, node, struct):
+        start = time.perf_counter()
         if len(self._execution_contexts) > 1:
-            return [self._extract_node_struct(node, struct[i]) for i, _ in enumerate(self._execution_contexts)]
+            res = [self._extract_node_struct(node, struct[i]) for i, _ in enumerate(self._execution_contexts)]
         else:
-            return self._extract_node_struct(node, struct)
+            res = self._extract_node_struct(node, struct)
+        self.stats._add_output(time.perf_counter() - start)
+        return res
 
     def extract_frozen_node_output(self, node):
         return self.extract_node_struct(node, self.__frozen_vals)
@@ -381,6 +482,10 @@ class CompExecution(CUDAExecution):
         # Either node or composition execute.
         # All execute functions expect inputs to be 3rd param.
         c_input = self._bin_func.byref_arg_types[2]
+        if _is_double_dtype(np.dtype(c_input)):
+            ct_input = self._get_input_struct_numpy(c_input, origins, inputs)
+            if ct_input is not None:
+                return ct_input
 
         # Read provided input data and separate each InputPort
         if len(self._execution_contexts) > 1:
@@ -392,6 +497,53 @@ class CompExecution(CUDAExecution):
 
         return c_input(*_tupleize(input_data))
 
+    def _get_input_struct_numpy(self, c_input, origins, inputs):
+        # The input structure contains only doubles, every input port
+        # occupies a fixed range of a flat buffer. The buffer is reused
+        # by subsequent executions in the same context, and every node's
+        # input is copied in using NumPy.
+        if len(self._execution_contexts) > 1:
+            c_input = c_input * len(self._execution_contexts)
+            ct_input = c_input()
+            inputs_per_context = inputs
+        else:
+            param = self._composition._compilation_data.input_struct
+            ct_input = param._get(self._execution_contexts[0])
+            if type(ct_input) is not c_input:
+                ct_input = c_input()
+                param._set(ct_input, context=self._execution_contexts[0])
+            inputs_per_context = [inputs]
+
+        if ctypes.sizeof(ct_input) == 0:
+            return None
+
+        offsets = _get_field_offsets(self._bin_func.byref_arg_types[2])
+        input_view = np.frombuffer(ct_input, dtype=np.float64)
+        input_view = input_view.reshape(len(self._execution_contexts), -1)
+        for ctx_view, inp in zip(input_view, inputs_per_context):
+            field = 0
+            for m in origins:
+                node_input = inp[m]
+                num_ports = len(node_input)
+                if field + num_ports >= len(offsets):
+                    return None
+                start = offsets[field]
+                end = offsets[field + num_ports]
+                try:
+                    # All input ports have the same shape
+                    values = np.asarray(node_input, dtype=np.float64).ravel()
+                except ValueError:
+                    values = np.concatenate([np.asarray(x, dtype=np.float64).ravel() for x in node_input])
+                if len(values) != end - start:
+                    return None
+                ctx_view[start:end] = values
+                field += num_ports
+
+            if field != len(offsets) - 1:
+                return None
+
+        return ct_input
+
     def freeze_values(self):
         self.__frozen_vals = copy.deepcopy(self._data_struct)
 
@@ -409,6 +561,7 @@ class CompExecution(CUDAExecution):
 
         # Set bin node to make sure self._*struct works as expected
         self._set_bin_node(node)
+        start = time.perf_counter()
         if inputs is not None:
             inputs = self._get_input_struct(inputs)
 
@@ -418,8 +571,11 @@ class CompExecution(CUDAExecution):
         if node is not self._composition.input_CIM and self.__frozen_vals is None:
             self.freeze_values()
 
-        self._bin_func(self._state_struct, self._param_struct,
-                       inputs, self.__frozen_vals, self._data_struct)
+        args = (self._state_struct, self._param_struct,
+                inputs, self.__frozen_vals, self._data_struct)
+        call_start = time.perf_counter()
+        self._bin_func(*args)
+        self.stats._add_call(call_start - start, time.perf_counter() - call_start)
 
         if "comp_node_debug" in self.__debug_env:
             print("RAN: {}. CTX: {}".format(node, self.extract_node_state(node)))
@@ -441,32 +597,43 @@ class CompExecution(CUDAExecution):
         return self.__bin_exec_multi_func
 
     def execute(self, inputs):
-        # NOTE: Make sure that input struct generation is inlined.
-        # We need the binary function to be setup for it to work correctly.
+        # NOTE: Make sure that the binary function is set up before
+        # generating the input struct, it needs the argument types.
+        if len(self._execution_contexts) > 1:
+            bin_func = self._bin_exec_multi_func
+        else:
+            bin_func = self._bin_exec_func
+
+        start = time.perf_counter()
+        args = (self._state_struct, self._param_struct,
+                self._get_input_struct(inputs),
+                self._data_struct, self._conditions)
+        call_start = time.perf_counter()
         if len(self._execution_contexts) > 1:
-            self._bin_exec_multi_func.wrap_call(self._state_struct,
-                                                self._param_struct,
-                                                self._get_input_struct(inputs),
-                                                self._data_struct,
-                                                self._conditions, self._ct_len)
+            self._call_multirun(bin_func, *args)
         else:
-            self._bin_exec_func(self._state_struct,
-                                self._param_struct,
-                                self._get_input_struct(inputs),
-                                self._data_struct, self._conditions)
+            bin_func(*args)
+        self.stats._add_call(call_start - start, time.perf_counter() - call_start)
 
     def cuda_execute(self, inputs):
-        # NOTE: Make sure that input struct generation is inlined.
-        # We need the binary function to be setup for it to work correctly.
-        self._bin_exec_func.cuda_call(self._cuda_state_struct,
-                                      self._cuda_param_struct,
-                                      self.upload_ctype(self._get_input_struct(inputs)),
-                                      self._cuda_data_struct,
-                                      self._cuda_conditions,
-                                      threads=len(self._execution_contexts))
+        # NOTE: Make sure that the binary function is set up before
+        # generating the input struct, it needs the argument types.
+        bin_func = self._bin_exec_func
+
+        start = time.perf_counter()
+        args = (self._cuda_state_struct,
+                self._cuda_param_struct,
+                self.upload_ctype(self._get_input_struct(inputs)),
+                self._cuda_data_struct,
+                self._cuda_conditions)
+        call_start = time.perf_counter()
+        bin_func.cuda_call(*args, threads=len(self._execution_contexts))
+        call_end = time.perf_counter()
+        self.stats._add_call(call_start - start, call_end - call_start)
 
         # Copy the data struct from the device
         self._data_struct = self.download_ctype(self._cuda_data_struct, self._vo_ty)
+        self.stats._add_output(time.perf_counter() - call_end)
 
     # Methods used to accelerate "Run"
 
@@ -478,11 +645,49 @@ class CompExecution(CUDAExecution):
             inputs = [inputs]
 
         assert len(inputs) == len(self._execution_contexts)
+        if _is_double_dtype(np.dtype(input_type)):
+            ct_inputs = self._get_run_input_struct_numpy(c_input, origins, inputs, num_input_sets)
+            if ct_inputs is not None:
+                return ct_inputs
+
         # Extract input for each trial and execution id
         run_inputs = ((([iv] for m in origins for iv in inp[m][i]) for i in range(num_input_sets)) for inp in inputs)
 
         return c_input(*_tupleize(run_inputs))
 
+    def _get_run_input_struct_numpy(self, c_input, origins, inputs, num_input_sets):
+        # The input structure contains only doubles, so it can be filled
+        # using NumPy one node at a time, instead of converting every
+        # value separately.
+        ct_inputs = c_input()
+        if ctypes.sizeof(ct_inputs) == 0:
+            return None
+        input_view = np.frombuffer(ct_inputs, dtype=np.float64)
+        input_view = input_view.reshape(len(inputs), num_input_sets, -1)
+
+        for ctx_view, inp in zip(input_view, inputs):
+            column = 0
+            for m in origins:
+                node_input = inp[m][:num_input_sets]
+                try:
+                    # All input ports have the same shape
+                    node_input = np.asarray(node_input, dtype=np.float64)
+                except ValueError:
+                    node_input = np.hstack([np.asarray([trial[i] for trial in node_input], dtype=np.float64).reshape(num_input_sets, -1)
+                                            for i in range(len(node_input[0]))])
+                node_input = node_input.reshape(num_input_sets, -1)
+
+                width = node_input.shape[1]
+                if column + width > ctx_view.shape[1]:
+                    return None
+                ctx_view[:, column:column + width] = node_input
+                column += width
+
+            if column != ctx_view.shape[1]:
+                return None
+
+        return ct_inputs
+
     @property
     def _bin_run_func(self):
         if self.__bin_run_func is None:
@@ -525,7 +730,20 @@ class CompExecution(CUDAExecution):
         return autodiff_stimuli_struct
 
 
-    def run(self, inputs, runs=0, num_input_sets=0, learning=False):
+    def run(self, inputs, runs=0, num_input_sets=0, learning=False, as_list=False):
+        """Run the composition for *runs* trials.
+
+        *inputs* maps each INPUT node to a list (or NumPy array) of trial
+        inputs. Returns a NumPy array, with structured dtype matching the
+        output structure, that views the output buffer of the compiled run.
+        The outputs are converted to nested lists if *as_list* is True.
+        """
+        if len(self._execution_contexts) > 1:
+            bin_func = self._bin_run_multi_func
+        else:
+            bin_func = self._bin_run_func
+
+        start = time.perf_counter()
         if learning:
             # Special case for autodiff, everything is stored in inputs param
             assert self._composition.learning_enabled
@@ -545,23 +763,34 @@ class CompExecution(CUDAExecution):
         outputs = ct_vo()
         runs_count = ctypes.c_int(runs)
         input_count = ctypes.c_int(num_input_sets)
+        args = (self._state_struct, self._param_struct,
+                self._data_struct, inputs, outputs,
+                runs_count, input_count)
+        call_start = time.perf_counter()
         if len(self._execution_contexts) > 1:
-            self._bin_run_multi_func.wrap_call(self._state_struct, self._param_struct,
-                                               self._data_struct, inputs, outputs,
-                                               runs_count, input_count, self._ct_len)
+            self._call_multirun(bin_func, *args)
         else:
-            self._bin_run_func.wrap_call(self._state_struct, self._param_struct,
-                                         self._data_struct, inputs, outputs,
-                                         runs_count, input_count, *extra_args)
-        return _convert_ctype_to_python(outputs)
+            bin_func.wrap_call(*args, *extra_args)
+        call_end = time.perf_counter()
+        self.stats._add_call(call_start - start, call_end - call_start)
 
-    def cuda_run(self, inputs, runs, num_input_sets):
+        if as_list:
+            res = _convert_ctype_to_python(outputs)
+        else:
+            res = _convert_ctype_to_numpy(outputs)
+        self.stats._add_output(time.perf_counter() - call_end)
+        return res
+
+    def cuda_run(self, inputs, runs, num_input_sets, as_list=False):
+        bin_func = self._bin_run_func
+
+        start = time.perf_counter()
         # Create input buffer
         inputs = self._get_run_input_struct(inputs, num_input_sets)
         data_in = self.upload_ctype(inputs)
 
         # Create output buffer
-        output_type = (self._bin_run_func.byref_arg_types[4] * runs)
+        output_type = (bin_func.byref_arg_types[4] * runs)
         if len(self._execution_contexts) > 1:
             output_type = output_type * len(self._execution_contexts)
         output_size = ctypes.sizeof(output_type)
@@ -571,12 +800,20 @@ class CompExecution(CUDAExecution):
         input_count = jit_engine.pycuda.driver.In(np.int32(num_input_sets))
         self._uploaded_bytes += 8   # runs_count + input_count
 
-        self._bin_run_func.cuda_call(self._cuda_state_struct,
-                                     self._cuda_param_struct,
-                                     self._cuda_data_struct,
-                                     data_in, data_out, runs_count, input_count,
-                                     threads=len(self._execution_contexts))
+        args = (self._cuda_state_struct,
+                self._cuda_param_struct,
+                self._cuda_data_struct,
+                data_in, data_out, runs_count, input_count)
+        call_start = time.perf_counter()
+        bin_func.cuda_call(*args, threads=len(self._execution_contexts))
+        call_end = time.perf_counter()
+        self.stats._add_call(call_start - start, call_end - call_start)
 
         # Copy the data struct from the device
         ct_out = self.download_ctype(data_out, output_type)
-        return _convert_ctype_to_python(ct_out)
+        if as_list:
+            res = _convert_ctype_to_python(ct_out)
+        else:
+            res = _convert_ctype_to_numpy(ct_out)
+        self.stats._add_output(time.perf_counter() - call_end)
+        return res
@@ -8,11 +8,18 @@
 
 # ********************************************* LLVM bindings **************************************************************
 
+import hashlib
+import llvmlite
+import os
+import tempfile
+import time
+
 from llvmlite import binding
 
 from .builder_context import LLVMBuilderContext, _find_llvm_function, _gen_cuda_kernel_wrapper_module
 from .builtins import _generate_cpu_builtins_module
 from .debug import debug_env
+from .stats import _record_compilation
 
 try:
     if "cuda" in debug_env:
@@ -36,7 +43,7 @@ except Exception as e:
     ptx_enabled = False
 
 
-__all__ = ['cpu_jit_engine', 'ptx_enabled']
+__all__ = ['cpu_jit_engine', 'disk_object_cache', 'ptx_enabled']
 
 if ptx_enabled:
     __all__.append('ptx_jit_engine')
@@ -139,6 +146,108 @@ def _try_parse_module(module):
     return mod
 
 
+class disk_object_cache:
+    """Persistent cache of compiled object code, shared by all processes using the same cache directory.
+
+    Objects are stored in files named by a hash of the optimized LLVM IR
+    of the module, the target machine, and the llvmlite/LLVM version.
+    The least recently used objects are removed once the size of the
+    cache exceeds *max_size* bytes.
+
+    The default cache directory is 'psyneulink/llvm' in the user cache
+    directory ($XDG_CACHE_HOME or ~/.cache), and can be changed using
+    the PNL_LLVM_CACHE_DIR environment variable. The default engine
+    does not use the cache if PNL_LLVM_DEBUG includes "no_disk_cache".
+    """
+    def __init__(self, directory=None, max_size=512 * 1024 * 1024):
+        if directory is None:
+            directory = _default_cache_directory()
+        self.directory = directory
+        self.max_size = max_size
+        self._target = None
+        self._pending_keys = {}
+
+    def set_target(self, target_machine, cpu_name, cpu_features):
+        self._target = "{};{};{};{};llvmlite-{};llvm-{}".format(
+            target_machine.triple, cpu_name, cpu_features,
+            target_machine.target_data, llvmlite.__version__,
+            '.'.join(str(v) for v in binding.llvm_version_info))
+
+    def _key(self, module):
+        h = hashlib.sha256(self._target.encode())
+        h.update(str(module).encode())
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.o')
+
+    def getbuffer(self, module):
+        # The module can be changed by code generation, so remember
+        # the key to store the resulting object under.
+        key = self._key(module)
+        self._pending_keys[module] = key
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                buf = f.read()
+            # Mark as recently used
+            os.utime(path)
+        except OSError:
+            return None
+
+        if "compile" in debug_env:
+            print("LOADED CACHED OBJECT: {}".format(path))
+        return buf
+
+    def notify(self, module, buf):
+        key = self._pending_keys.pop(module, None)
+        if key is None:
+            key = self._key(module)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first, other processes
+            # might be reading or writing the same entry.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(buf)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            if "compile" in debug_env:
+                print("FAILED to store object in cache {}: {}".format(self.directory, e))
+            return
+
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith('.o'):
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError:
+            return
+
+        total_size = sum(e[1] for e in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_size -= size
+
+
+def _default_cache_directory():
+    directory = os.environ.get("PNL_LLVM_CACHE_DIR")
+    if directory is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+        directory = os.path.join(cache_home, "psyneulink", "llvm")
+    return directory
+
+
 class jit_engine:
     def __init__(self):
         self._jit_engine = None
@@ -146,6 +255,8 @@ class jit_engine:
         self._target_machine = None
         self.__mod = None
         self.__opt_modules = 0
+        # Size of the last object emitted or loaded from the object cache
+        self._object_size = None
         # Add an extra reference to make sure it's not destroyed before
         # instances of jit_engine
         self.__debug_env = debug_env
@@ -155,7 +266,13 @@ class jit_engine:
             print("Total JIT modules in '{}': {}".format(type(self).__name__, self.__opt_modules))
 
     def opt_and_add_bin_module(self, module):
+        """Optimize and compile *module*.
+
+        Returns the time spent in optimization and code generation.
+        """
+        opt_start = time.perf_counter()
         self._pass_manager.run(module)
+        opt_time = time.perf_counter() - opt_start
         if "opt" in self.__debug_env:
             with open(self.__class__.__name__ + '-' + str(self.__opt_modules) + '.opt.ll', 'w') as dump_file:
                 dump_file.write(str(module))
@@ -165,10 +282,15 @@ class jit_engine:
             with open(self.__class__.__name__ + '-' + str(self.__opt_modules) + '.S', 'w') as dump_file:
                 dump_file.write(self._target_machine.emit_assembly(module))
 
+        codegen_start = time.perf_counter()
+        self._object_size = None
         self._engine.add_module(module)
         self._engine.finalize_object()
+        codegen_time = time.perf_counter() - codegen_start
         self.__opt_modules += 1
 
+        return opt_time, codegen_time
+
     def _remove_bin_module(self, module):
         if module is not None:
             self._engine.remove_module(module)
@@ -186,7 +308,7 @@ class jit_engine:
             with open(mod_name + '.linked.ll', 'w') as dump_file:
                 dump_file.write(str(self.__mod))
 
-        self.opt_and_add_bin_module(self.__mod)
+        return self.opt_and_add_bin_module(self.__mod)
 
     def clean_module(self):
         self._remove_bin_module(self.__mod)
@@ -212,14 +334,20 @@ class jit_engine:
     def compile_modules(self, modules, compiled_modules):
         # Parse generated modules and link them
         mod_bundle = binding.parse_assembly("")
+        instructions = {}
         for m in modules:
             new_mod = _try_parse_module(m)
             if new_mod is not None:
                 mod_bundle.link_in(new_mod)
                 mod_bundle.name = m.name  # Set the name of the last module
                 compiled_modules.add(m)
+                instructions.update((f.name, sum(len(b.instructions) for b in f.blocks))
+                                    for f in m.functions if not f.is_declaration)
 
-        self.opt_and_append_bin_module(mod_bundle)
+        name = mod_bundle.name
+        opt_time, codegen_time = self.opt_and_append_bin_module(mod_bundle)
+        _record_compilation(type(self).__name__, name, instructions,
+                            opt_time, codegen_time, self._object_size)
 
 
 class cpu_jit_engine(jit_engine):
@@ -235,7 +363,24 @@ class cpu_jit_engine(jit_engine):
 
         self._jit_engine, self._jit_pass_manager, self._target_machine = _cpu_jit_constructor()
         if self._object_cache is not None:
-            self._jit_engine.set_object_cache(self._object_cache)
+            self._object_cache.set_target(self._target_machine,
+                                          binding.get_host_cpu_name(),
+                                          binding.get_host_cpu_features().flatten())
+        # The hooks are installed even without a cache to record object sizes
+        self._jit_engine.set_object_cache(self._notify_object, self._get_object)
+
+    def _get_object(self, module):
+        buf = None
+        if self._object_cache is not None:
+            buf = self._object_cache.getbuffer(module)
+        if buf is not None:
+            self._object_size = len(buf)
+        return buf
+
+    def _notify_object(self, module, buf):
+        self._object_size = len(buf)
+        if self._object_cache is not None:
+            self._object_cache.notify(module, buf)
 
 
 _ptx_builtin_source = """
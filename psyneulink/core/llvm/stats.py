@@ -0,0 +1,141 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+
+
+# ********************************************* Compilation statistics **************************************************************
+"""
+Statistics of compilation and compiled execution.
+
+Unlike the "stat" and "compile" options of PNL_LLVM_DEBUG, which print
+messages, the statistics are collected at all times and returned as
+data structures:
+
+ * `get_compilation_stats` returns a `FunctionStats` entry for every
+   function compiled by a JIT engine.
+ * `CompExecution.stats <CompExecution>` is an `ExecutionStats` instance
+   that counts calls of compiled code of that execution, and
+   `get_execution_stats` returns the totals of all executions of a
+   Composition.
+
+All times are in seconds (measured by `time.perf_counter`).
+"""
+
+import weakref
+from typing import Dict, NamedTuple, Optional
+
+__all__ = ['ExecutionStats', 'FunctionStats', 'get_compilation_stats', 'get_execution_stats', 'reset_stats']
+
+
+class FunctionStats(NamedTuple):
+    """Compilation statistics of a compiled function.
+
+    LLVM optimizes and generates code for whole modules, *opt_time*,
+    *codegen_time*, and *binary_size* (the size of the object code in
+    bytes; None if not known) are those of the compiled module that
+    first included the function, and are shared by all functions
+    compiled in the same module.
+    """
+    name: str
+    engine: str
+    module: str
+    instructions: int
+    opt_time: float
+    codegen_time: float
+    binary_size: Optional[int]
+
+
+class ExecutionStats:
+    """Statistics of compiled executions.
+
+    Attributes
+    ----------
+
+    calls : int
+        number of calls of compiled code.
+
+    compiled_time : float
+        total time spent in compiled code.
+
+    input_time : float
+        total time spent converting inputs and preparing the structures
+        passed to compiled code.
+
+    output_time : float
+        total time spent converting outputs of compiled code.
+    """
+    def __init__(self, parent=None):
+        self._parent = parent
+        self._reset()
+
+    def _reset(self):
+        self.calls = 0
+        self.compiled_time = 0.0
+        self.input_time = 0.0
+        self.output_time = 0.0
+
+    @property
+    def marshal_time(self):
+        """Total time spent converting inputs and outputs."""
+        return self.input_time + self.output_time
+
+    def _add_call(self, input_time, compiled_time):
+        self.calls += 1
+        self.input_time += input_time
+        self.compiled_time += compiled_time
+        if self._parent is not None:
+            self._parent._add_call(input_time, compiled_time)
+
+    def _add_output(self, output_time):
+        self.output_time += output_time
+        if self._parent is not None:
+            self._parent._add_output(output_time)
+
+    def _asdict(self):
+        return {'calls': self.calls, 'compiled_time': self.compiled_time,
+                'input_time': self.input_time, 'output_time': self.output_time}
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__,
+                               ", ".join("{}={}".format(k, v) for k, v in self._asdict().items()))
+
+
+_function_stats: Dict[str, Dict[str, FunctionStats]] = {}
+_execution_stats = weakref.WeakKeyDictionary()
+
+
+def _record_compilation(engine, module, instructions, opt_time, codegen_time, binary_size):
+    engine_stats = _function_stats.setdefault(engine, {})
+    for name, count in instructions.items():
+        engine_stats[name] = FunctionStats(name, engine, module, count,
+                                           opt_time, codegen_time, binary_size)
+
+
+def _get_execution_stats(composition):
+    if composition not in _execution_stats:
+        _execution_stats[composition] = ExecutionStats()
+    return _execution_stats[composition]
+
+
+def get_compilation_stats(engine='cpu_jit_engine') -> Dict[str, FunctionStats]:
+    """Return statistics of functions compiled by *engine*, indexed by function name.
+
+    *engine* is the type name of the JIT engine, 'cpu_jit_engine' or 'ptx_jit_engine'.
+    """
+    return dict(_function_stats.get(engine, {}))
+
+
+def get_execution_stats(composition) -> ExecutionStats:
+    """Return the total statistics of compiled executions of *composition*."""
+    return _execution_stats.get(composition, ExecutionStats())
+
+
+def reset_stats():
+    """Discard all collected statistics."""
+    _function_stats.clear()
+    # Executions that are still alive keep adding to the totals
+    for execution_stats in _execution_stats.values():
+        execution_stats._reset()
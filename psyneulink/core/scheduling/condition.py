@@ -91,6 +91,13 @@ the standard `Condition()` with `mech_A` and `epsilon` as its arguments, and `co
 `NWhen` (which is satisfied the first N times after its condition becomes true),  The Condition is assigned to `mech_B`,
 thus scheduling it to execute one time when all of the elements of `mech_A` have changed by less than `epsilon`.
 
+.. note::
+    If a `Scheduler` has a `history_max_length <Scheduler.history_max_length>`, it retains only a limited part of
+    its `execution_list <Scheduler.execution_list>` and of the history of its `Clock`. A custom Condition whose
+    function inspects either of these should declare how much of that history it needs by assigning its
+    `required_history <Condition.required_history>` attribute (e.g., ``my_condition.required_history = None``
+    to ensure that the full history is retained).
+
 .. _Condition_Structure:
 
 Structure
@@ -431,7 +438,15 @@ class Condition(JSONDumpable):
     owner (Component):
         the `Component` with which the Condition is associated, and the execution of which it determines.
 
+    required_history (int or None):
+        the number of most recent `TIME_STEP`\\ s in a `Scheduler`'s `execution_list <Scheduler.execution_list>`
+        that must be retained to evaluate the Condition, including any required by the Conditions on which it depends
+        (see `Scheduler_History`).  None indicates that the full history must be retained, including that of the
+        Scheduler's `Clock`.
+
     """
+    _required_history = 0
+
     def __init__(self, func, *args, **kwargs):
         self.func = func
         self.args = args
@@ -455,6 +470,23 @@ class Condition(JSONDumpable):
         logger.debug('Condition ({0}) setting owner to {1}'.format(type(self).__name__, value))
         self._owner = value
 
+    @property
+    def required_history(self):
+        required_history = self._required_history
+        for condition in self._dependency_conditions:
+            if required_history is None or condition.required_history is None:
+                return None
+            required_history = max(required_history, condition.required_history)
+        return required_history
+
+    @required_history.setter
+    def required_history(self, value):
+        self._required_history = value
+
+    @property
+    def _dependency_conditions(self):
+        return [a for a in self.args if isinstance(a, Condition)]
+
     def is_satisfied(self, *args, context=None, execution_id=None, **kwargs):
         """
         the function called to determine satisfaction of this Condition.
@@ -725,6 +757,10 @@ class Not(Condition):
     def owner(self, value):
         self.condition.owner = value
 
+    @property
+    def _dependency_conditions(self):
+        return [self.condition]
+
 
 class NWhen(Condition):
     """NWhen
@@ -1230,9 +1266,12 @@ class BeforeNCalls(_DependencyValidation, Condition):
 
     """
     def __init__(self, dependency, n, time_scale=TimeScale.TRIAL):
+        self.time_scale = time_scale
+
         def func(dependency, n, scheduler=None, execution_id=None):
             try:
-                num_calls = scheduler.counts_total[execution_id][time_scale][dependency]
+                num_calls = scheduler.counts_total[execution_id][time_scale.value,
+                                                                 scheduler._node_indices[dependency]]
                 logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
                 return num_calls < n
             except AttributeError as e:
@@ -1266,9 +1305,12 @@ class AtNCalls(_DependencyValidation, Condition):
 
     """
     def __init__(self, dependency, n, time_scale=TimeScale.TRIAL):
+        self.time_scale = time_scale
+
         def func(dependency, n, scheduler=None, execution_id=None):
             try:
-                num_calls = scheduler.counts_total[execution_id][time_scale][dependency]
+                num_calls = scheduler.counts_total[execution_id][time_scale.value,
+                                                                 scheduler._node_indices[dependency]]
                 logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
                 return num_calls == n
             except AttributeError as e:
@@ -1296,9 +1338,12 @@ class AfterCall(_DependencyValidation, Condition):
 
     """
     def __init__(self, dependency, n, time_scale=TimeScale.TRIAL):
+        self.time_scale = time_scale
+
         def func(dependency, n, scheduler=None, execution_id=None):
             try:
-                num_calls = scheduler.counts_total[execution_id][time_scale][dependency]
+                num_calls = scheduler.counts_total[execution_id][time_scale.value,
+                                                                 scheduler._node_indices[dependency]]
                 logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
                 return num_calls > n
             except AttributeError as e:
@@ -1326,9 +1371,12 @@ class AfterNCalls(_DependencyValidation, Condition):
 
     """
     def __init__(self, dependency, n, time_scale=TimeScale.TRIAL):
+        self.time_scale = time_scale
+
         def func(dependency, n, scheduler=None, execution_id=None):
             try:
-                num_calls = scheduler.counts_total[execution_id][time_scale][dependency]
+                num_calls = scheduler.counts_total[execution_id][time_scale.value,
+                                                                 scheduler._node_indices[dependency]]
                 logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
                 return num_calls >= n
             except AttributeError as e:
@@ -1358,19 +1406,20 @@ class AfterNCallsCombined(_DependencyValidation, Condition):
 
     """
     def __init__(self, *dependencies, n=None, time_scale=TimeScale.TRIAL):
+        self.time_scale = time_scale
+
         logger.debug('{0} args: deps {1}, n {2}, ts {3}'.format(type(self).__name__, dependencies, n, time_scale))
 
         def func(*dependencies, n=None, scheduler=None, execution_id=None):
             if n is None:
                 raise ConditionError(f'{type(self).__name__}: required keyword argument n is None.')
-            count_sum = 0
-            for d in dependencies:
-                try:
-                    count_sum += scheduler.counts_total[execution_id][time_scale][d]
-                    logger.debug('{0} has reached {1} num_calls in {2}'.
-                                 format(d, scheduler.counts_total[execution_id][time_scale][d], time_scale.name))
-                except AttributeError as e:
-                    raise ConditionError(f'{type(self).__name__}: scheduler must be supplied to is_satisfied: {e}.')
+            try:
+                counts = scheduler.counts_total[execution_id][time_scale.value]
+                count_sum = sum(counts[scheduler._node_indices[d]] for d in dependencies)
+                logger.debug('{0} have reached {1} combined num_calls in {2}'.format(dependencies, count_sum,
+                                                                                     time_scale.name))
+            except AttributeError as e:
+                raise ConditionError(f'{type(self).__name__}: scheduler must be supplied to is_satisfied: {e}.')
 
             return count_sum >= n
         super().__init__(func, *dependencies, n=n)
@@ -1415,7 +1464,8 @@ class EveryNCalls(_DependencyValidation, Condition):
     def __init__(self, dependency, n):
         def func(dependency, n, scheduler=None, execution_id=None):
             try:
-                num_calls = scheduler.counts_useable[execution_id][dependency][self.owner]
+                num_calls = scheduler.counts_useable[execution_id][scheduler._node_indices[dependency],
+                                                                   scheduler._node_indices[self.owner]]
                 logger.debug('{0} has reached {1} num_calls'.format(dependency, num_calls))
                 return num_calls >= n
             except AttributeError as e:
@@ -1442,6 +1492,8 @@ class JustRan(_DependencyValidation, Condition):
           JustRan(A) is satisfied at the beginning of the next `TRIAL`.
 
     """
+    _required_history = 1
+
     def __init__(self, dependency):
         def func(dependency, scheduler=None, execution_id=None):
             logger.debug(f'checking if {dependency} in previous execution step set')
@@ -1469,20 +1521,20 @@ class AllHaveRun(_DependencyValidation, Condition):
 
     """
     def __init__(self, *dependencies, time_scale=TimeScale.TRIAL):
+        self.time_scale = time_scale
+
         def func(*dependencies, scheduler=None, execution_id=None):
-            if len(dependencies) == 0:
-                dependencies = scheduler.nodes
-            for d in dependencies:
-                try:
-                    if scheduler.counts_total[execution_id][time_scale][d] < 1:
-                        return False
-                except AttributeError as e:
-                    raise ConditionError(f'{type(self).__name__}: scheduler must be supplied to is_satisfied: {e}.')
-                except KeyError as e:
-                    raise ConditionError(
-                        f'{type(self).__name__}: execution_id ({scheduler}) must both be specified, and '
-                        f'execution_id must be in scheduler.counts_total (scheduler: {execution_id}): {e}.')
-            return True
+            try:
+                counts = scheduler.counts_total[execution_id][time_scale.value]
+                if len(dependencies) == 0:
+                    return bool((counts >= 1).all())
+                return all(counts[scheduler._node_indices[d]] >= 1 for d in dependencies)
+            except AttributeError as e:
+                raise ConditionError(f'{type(self).__name__}: scheduler must be supplied to is_satisfied: {e}.')
+            except KeyError as e:
+                raise ConditionError(
+                    f'{type(self).__name__}: execution_id ({scheduler}) must both be specified, and '
+                    f'execution_id must be in scheduler.counts_total (scheduler: {execution_id}): {e}.')
         super().__init__(func, *dependencies)
 
 
@@ -163,6 +163,34 @@ is met).  When the Scheduler terminates a `TRIAL`, the `Composition <Composition
 specified in the call to its `run <Composition.run>` method.  Thus, a `TRIAL` is defined as the scope of processing
 associated with a given input to the Composition.
 
+.. _Scheduler_Static_Schedule:
+
+*Static Schedules*
+~~~~~~~~~~~~~~~~~~
+
+If every Component's `Condition` and the `TRIAL` termination Condition depend only on counts that are reset at the
+start of each `TRIAL` (`Always`, `Never`, `EveryNCalls`, and `AllHaveRun`, `AfterNCalls` and the other call-count
+Conditions with a **time_scale** no larger than `TRIAL`, or `All`, `Any` and `Not` combinations of these), and the
+`RUN` termination Condition is `Never`, then the Scheduler produces the same sequence of `TIME_STEP`\\ s in every
+`TRIAL`.  In that case, the sequence is recorded on the first `TRIAL`, and replayed in subsequent ones without
+evaluating any Conditions (the Scheduler's counters and `Clock` are updated as they would otherwise be).  The recorded
+sequence is discarded if any Condition is added or replaced, or if the termination Conditions change.  Changes to the
+structure of a Composition cause it to build a new Scheduler.
+
+.. _Scheduler_History:
+
+*History*
+~~~~~~~~~
+
+By default, a Scheduler's `execution_list <Scheduler.execution_list>` and the history of its `Clock` grow with every
+`TIME_STEP` and `TRIAL` for every execution_id in which it is run.  For long runs (or ones that involve many
+simulations), this can be limited by specifying **history_max_length** in the Scheduler's constructor (or assigning
+its `history_max_length <Scheduler.history_max_length>` attribute).  The `execution_list <Scheduler.execution_list>`
+then retains only that many of the most recent `TIME_STEP`\\ s (none if it is 0), and the history of each `Clock`
+retains only the current `RUN` and `TRIAL`;  counts of the number of executions and of units of time (e.g., those used
+by `AfterNCalls` or `AfterNTrials`) are unaffected.  If a `Condition` requires more of the history (see
+`Condition.required_history`), the Scheduler retains as much as the Condition requires.
+
 
 .. _Scheduler_Termination_Conditions:
 
@@ -270,14 +298,18 @@ Class Reference
 import collections
 import copy
 import datetime
+import itertools
 import logging
 import warnings
 
+import numpy as np
+
 from toposort import toposort, toposort_flatten
 
 from psyneulink.core.globals.context import Context, handle_external_context
 from psyneulink.core.globals.json import JSONDumpable
-from psyneulink.core.scheduling.condition import All, AllHaveRun, Always, Condition, ConditionSet, EveryNCalls, Never
+from psyneulink.core.scheduling.condition import AfterCall, AfterNCalls, AfterNCallsCombined, All, AllHaveRun, \
+    Always, Any, AtNCalls, BeforeNCalls, Condition, ConditionSet, EveryNCalls, Never, Not
 from psyneulink.core.scheduling.time import Clock, TimeScale
 
 __all__ = [
@@ -286,6 +318,13 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# Conditions that depend only on call counts of their dependencies that are reset at the start of every TRIAL
+# (if their time_scale is no larger than TRIAL), and so are satisfied at the same points in every TRIAL
+# (see Scheduler_Static_Schedule)
+_STATIC_COUNT_CONDITIONS = {
+    AfterCall, AfterNCalls, AfterNCallsCombined, AllHaveRun, AtNCalls, BeforeNCalls, EveryNCalls
+}
+
 
 class SchedulerError(Exception):
 
@@ -325,6 +364,10 @@ class Scheduler(JSONDumpable):
         a graph specification dictionary - each entry of the dictionary must be a Component,
         and the value of each entry must be a set of zero or more Components that project directly to the key.
 
+    history_max_length : int : None
+        specifies the number of most recent `TIME_STEP`\\ s retained in `execution_list <Scheduler.execution_list>`
+        (see `Scheduler_History`).
+
     Attributes
     ----------
 
@@ -332,7 +375,13 @@ class Scheduler(JSONDumpable):
         the set of Conditions the Scheduler uses when running
 
     execution_list : list
-        the full history of time steps the Scheduler has produced
+        the history of time steps the Scheduler has produced (the full history, unless `history_max_length
+        <Scheduler.history_max_length>` is specified)
+
+    history_max_length : int or None
+        the number of most recent `TIME_STEP`\\ s retained in `execution_list <Scheduler.execution_list>`, in
+        addition to any required by the Scheduler's `Conditions <Condition>` (see `Scheduler_History`).  If None,
+        the full history is retained.
 
     consideration_queue: list
         a list form of the Scheduler's toposort ordering of its nodes
@@ -360,6 +409,7 @@ class Scheduler(JSONDumpable):
             TimeScale.TRIAL: AllHaveRun(),
         },
         default_execution_id=None,
+        history_max_length=None,
         **kwargs
     ):
         """
@@ -407,12 +457,19 @@ class Scheduler(JSONDumpable):
             raise SchedulerError('Must instantiate a Scheduler with either a Composition (kwarg composition) '
                                  'or a graph dependency dict (kwarg graph)')
 
+        # position of each node in self.nodes, used to index the arrays in counts_total and counts_useable
+        self._node_indices = {node: i for i, node in enumerate(self.nodes)}
+
+        self.history_max_length = history_max_length
+
         self.default_execution_id = default_execution_id
         self.execution_list = {self.default_execution_id: []}
         self.clocks = {self.default_execution_id: Clock()}
         self.counts_total = {}
         self.counts_useable = {}
         self._init_counts(execution_id=self.default_execution_id)
+        # (key, recorded sequence or None) for the conditions used in the last run (see _get_static_schedule)
+        self._static_schedule = None
         self.date_creation = datetime.datetime.now()
         self.date_last_run_end = None
 
@@ -556,40 +613,30 @@ class Scheduler(JSONDumpable):
 
         # stores total the number of occurrences of a node through the time scale
         # i.e. the number of times node has ran/been queued to run in a trial
+        # counts_total[execution_id][ts.value, i] is the count at TimeScale ts for the node at position i in self.nodes
         if execution_id not in self.counts_total:
-            self.counts_total[execution_id] = {}
-
             if base_execution_id is not None:
                 if base_execution_id not in self.counts_total:
                     raise SchedulerError('execution_id {0} not in {1}.counts_total'.format(base_execution_id, self))
 
-                self.counts_total[execution_id] = {
-                    ts: {n: self.counts_total[base_execution_id][ts][n] for n in self.nodes} for ts in TimeScale
-                }
+                self.counts_total[execution_id] = self.counts_total[base_execution_id].copy()
             else:
-                self.counts_total[execution_id] = {
-                    ts: {n: 0 for n in self.nodes} for ts in TimeScale
-                }
+                self.counts_total[execution_id] = np.zeros((len(TimeScale), len(self.nodes)), dtype=int)
 
-        # counts_useable is a dictionary intended to store the number of available "instances" of a certain node that
+        # counts_useable is an array intended to store the number of available "instances" of a certain node that
         # are available to expend in order to satisfy conditions such as "run B every two times A runs"
-        # specifically, counts_useable[a][b] = n indicates that there are n uses of a that are available for b to expend
-        # so, in the previous example B would check to see if counts_useable[A][B] >= 2, in which case B can run
-        # then, counts_useable[a][b] would be reset to 0, even if it was greater than 2
+        # specifically, counts_useable[a, b] = n (indexed by position in self.nodes) indicates that there are n uses
+        # of a that are available for b to expend
+        # so, in the previous example B would check to see if counts_useable[A, B] >= 2, in which case B can run
+        # then, counts_useable[A, B] would be reset to 0, even if it was greater than 2
         if execution_id not in self.counts_useable:
-            self.counts_useable[execution_id] = {}
-
             if base_execution_id is not None:
                 if base_execution_id not in self.counts_useable:
                     raise SchedulerError('execution_id {0} not in {1}.counts_useable'.format(base_execution_id, self))
 
-                self.counts_useable[execution_id] = {
-                    node: {n: self.counts_useable[base_execution_id][node][n] for n in self.nodes} for node in self.nodes
-                }
+                self.counts_useable[execution_id] = self.counts_useable[base_execution_id].copy()
             else:
-                self.counts_useable[execution_id] = {
-                    node: {n: 0 for n in self.nodes} for node in self.nodes
-                }
+                self.counts_useable[execution_id] = np.zeros((len(self.nodes), len(self.nodes)), dtype=int)
 
         if execution_id not in self.execution_list:
             if base_execution_id is not None:
@@ -614,18 +661,47 @@ class Scheduler(JSONDumpable):
             else:
                 self.clocks[execution_id] = Clock()
 
+    def _delete_counts(self, execution_id):
+        """Remove the counts, execution_list and Clock stored for **execution_id**"""
+        for execution_id_dict in [self.counts_total, self.counts_useable, self.execution_list, self.clocks]:
+            execution_id_dict.pop(execution_id, None)
+
+    def _get_retained_history_length(self, termination_conds):
+        """Return the number of `TIME_STEP`\\ s to retain in execution_list, or None to retain the full history
+        (see `Scheduler_History`).
+        """
+        if self.history_max_length is None:
+            return None
+
+        history_length = self.history_max_length
+        for condition in itertools.chain(self.conditions.conditions.values(), termination_conds.values()):
+            required_history = condition.required_history
+            if required_history is None:
+                return None
+            history_length = max(history_length, required_history)
+
+        return history_length
+
+    def _set_retained_history_length(self, history_length, execution_id=None):
+        execution_list = self.execution_list[execution_id]
+        if getattr(execution_list, 'maxlen', None) != history_length:
+            if history_length is None:
+                self.execution_list[execution_id] = list(execution_list)
+            else:
+                self.execution_list[execution_id] = collections.deque(execution_list, maxlen=history_length)
+
+        # the Clock keeps the current RUN and TRIAL, which is all that is needed for the current counts of time
+        clock_history_length = None if history_length is None else 1
+        if self.clocks[execution_id].history_max_length != clock_history_length:
+            self.clocks[execution_id].history_max_length = clock_history_length
+
     def _reset_counts_total(self, time_scale, execution_id=None):
-        for ts in TimeScale:
-            # only reset the values underneath the current scope
-            # this works because the enum is set so that higher granularities of time have lower values
-            if ts.value <= time_scale.value:
-                for c in self.counts_total[execution_id][ts]:
-                    self.counts_total[execution_id][ts][c] = 0
+        # only reset the values underneath the current scope
+        # this works because the enum is set so that higher granularities of time have lower values
+        self.counts_total[execution_id][:time_scale.value + 1] = 0
 
     def _reset_counts_useable(self, execution_id=None):
-        self.counts_useable[execution_id] = {
-            node: {n: 0 for n in self.nodes} for node in self.nodes
-        }
+        self.counts_useable[execution_id][:] = 0
 
     def update_termination_conditions(self, termination_conds):
         termination_conds = Scheduler._parse_termination_conditions(termination_conds)
@@ -724,6 +800,76 @@ class Scheduler(JSONDumpable):
                 )
             )
 
+    ################################################################################
+    # Static schedule methods
+    #   to replay the sequence of time steps when it is the same in every trial
+    ################################################################################
+    def _is_static_condition(self, condition):
+        """Return True if **condition** is satisfied at the same points in every `TRIAL`."""
+        condition_type = type(condition)
+        if condition_type in {Always, Never}:
+            return True
+        elif condition_type in {All, Any}:
+            return all(self._is_static_condition(c) for c in condition.args)
+        elif condition_type is Not:
+            return self._is_static_condition(condition.condition)
+        elif condition_type in _STATIC_COUNT_CONDITIONS:
+            if getattr(condition, 'time_scale', TimeScale.TRIAL).value > TimeScale.TRIAL.value:
+                return False
+            if condition_type in {AfterNCallsCombined, AllHaveRun}:
+                dependencies = condition.args
+            else:
+                dependencies = condition.args[:1]
+            return all(d in self._node_indices for d in dependencies)
+        return False
+
+    def _get_static_schedule(self, termination_conds):
+        """Return the list recording the `TIME_STEP`\\ s of each `PASS` of a `TRIAL` if the schedule is
+        `static <Scheduler_Static_Schedule>`, and None otherwise.  The list is empty until it has been recorded.
+        """
+        # conditions are compared by identity, so that adding or replacing any of them invalidates the recording
+        key = (
+            tuple((node, self.conditions.conditions[node]) for node in self.nodes),
+            termination_conds[TimeScale.TRIAL],
+            termination_conds[TimeScale.RUN],
+            tuple(frozenset(consideration_set) for consideration_set in self.consideration_queue),
+        )
+        if self._static_schedule is None or self._static_schedule[0] != key:
+            if (
+                type(termination_conds[TimeScale.RUN]) is Never
+                and self._is_static_condition(termination_conds[TimeScale.TRIAL])
+                and all(self._is_static_condition(condition) for _, condition in key[0])
+            ):
+                self._static_schedule = (key, [])
+            else:
+                self._static_schedule = (key, None)
+
+        return self._static_schedule[1]
+
+    def _replay_static_schedule(self, static_schedule, context):
+        counts_total = self.counts_total[context.execution_id]
+        counts_useable = self.counts_useable[context.execution_id]
+        execution_list = self.execution_list[context.execution_id]
+        clock = self.get_clock(context)
+
+        for time_steps in static_schedule:
+            self._reset_counts_total(TimeScale.PASS, context.execution_id)
+
+            for node_indices in time_steps:
+                # update counts in the order in which the nodes were added, as in _run_conditions
+                for i in node_indices:
+                    counts_total[:, i] += 1
+                    counts_useable[:, i] = 0
+                    counts_useable[i, :] += 1
+
+                execution_set = {self.nodes[i] for i in node_indices}
+                execution_list.append(execution_set)
+                yield execution_set
+
+                clock._increment_time(TimeScale.TIME_STEP)
+
+            clock._increment_time(TimeScale.PASS)
+
     ################################################################################
     # Run methods
     ################################################################################
@@ -746,9 +892,34 @@ class Scheduler(JSONDumpable):
             context = Context(execution_id=self.default_execution_id)
 
         self._init_counts(context.execution_id, base_context.execution_id)
+        self._set_retained_history_length(self._get_retained_history_length(termination_conds), context.execution_id)
         self._reset_counts_useable(context.execution_id)
         self._reset_counts_total(TimeScale.TRIAL, context.execution_id)
 
+        static_schedule = self._get_static_schedule(termination_conds)
+        if static_schedule:
+            yield from self._replay_static_schedule(static_schedule, context)
+        else:
+            yield from self._run_conditions(termination_conds, context, static_schedule)
+
+        if not skip_trial_time_increment:
+            self.get_clock(context)._increment_time(TimeScale.TRIAL)
+
+        if termination_conds[TimeScale.RUN].is_satisfied(scheduler=self, context=context):
+            self.date_last_run_end = datetime.datetime.now()
+
+        return self.execution_list[context.execution_id]
+
+    def _run_conditions(self, termination_conds, context, static_schedule=None):
+        """Generate the `TIME_STEP`\\ s of a `TRIAL` by evaluating the Conditions of the nodes in each
+        consideration_set.  If **static_schedule** is a list, the indices of the nodes added in each TIME_STEP of
+        each PASS are recorded in it once the TRIAL has terminated.
+        """
+        time_steps = []
+
+        counts_total = self.counts_total[context.execution_id]
+        counts_useable = self.counts_useable[context.execution_id]
+
         while (
             not termination_conds[TimeScale.TRIAL].is_satisfied(scheduler=self, context=context)
             and not termination_conds[TimeScale.RUN].is_satisfied(scheduler=self, context=context)
@@ -757,6 +928,8 @@ class Scheduler(JSONDumpable):
 
             execution_list_has_changed = False
             cur_index_consideration_queue = 0
+            cur_pass_time_steps = []
+            time_steps.append(cur_pass_time_steps)
 
             while (
                 cur_index_consideration_queue < len(self.consideration_queue)
@@ -765,6 +938,8 @@ class Scheduler(JSONDumpable):
             ):
                 # all nodes to be added during this time step
                 cur_time_step_exec = set()
+                # their indices in self.nodes, in the order in which they are added
+                cur_time_step_indices = []
                 # the current "layer/group" of nodes that MIGHT be added during this time step
                 cur_consideration_set = self.consideration_queue[cur_index_consideration_queue]
                 try:
@@ -786,24 +961,24 @@ class Scheduler(JSONDumpable):
                                 execution_list_has_changed = True
                                 cur_consideration_set_has_changed = True
 
-                                for ts in TimeScale:
-                                    self.counts_total[context.execution_id][ts][current_node] += 1
+                                current_node_index = self._node_indices[current_node]
+                                cur_time_step_indices.append(current_node_index)
+                                counts_total[:, current_node_index] += 1
                                 # current_node's node is added to the execution queue, so we now need to
                                 # reset all of the counts useable by current_node's node to 0
-                                for n in self.counts_useable[context.execution_id]:
-                                    self.counts_useable[context.execution_id][n][current_node] = 0
+                                counts_useable[:, current_node_index] = 0
                                 # and increment all of the counts of current_node's node useable by other
                                 # nodes by 1
-                                for n in self.counts_useable[context.execution_id]:
-                                    self.counts_useable[context.execution_id][current_node][n] += 1
+                                counts_useable[current_node_index, :] += 1
                     # do-while condition
                     if not cur_consideration_set_has_changed:
                         break
 
                 # add a new time step at each step in a pass, if the time step would not be empty
                 if len(cur_time_step_exec) >= 1:
+                    cur_pass_time_steps.append(cur_time_step_indices)
                     self.execution_list[context.execution_id].append(cur_time_step_exec)
-                    yield self.execution_list[context.execution_id][-1]
+                    yield cur_time_step_exec
 
                     self.get_clock(context)._increment_time(TimeScale.TIME_STEP)
 
@@ -811,20 +986,18 @@ class Scheduler(JSONDumpable):
 
             # if an entire pass occurs with nothing running, add an empty time step
             if not execution_list_has_changed:
-                self.execution_list[context.execution_id].append(set())
-                yield self.execution_list[context.execution_id][-1]
+                cur_pass_time_steps.append([])
+                empty_time_step_exec = set()
+                self.execution_list[context.execution_id].append(empty_time_step_exec)
+                yield empty_time_step_exec
 
                 self.get_clock(context)._increment_time(TimeScale.TIME_STEP)
 
             self.get_clock(context)._increment_time(TimeScale.PASS)
 
-        if not skip_trial_time_increment:
-            self.get_clock(context)._increment_time(TimeScale.TRIAL)
-
-        if termination_conds[TimeScale.RUN].is_satisfied(scheduler=self, context=context):
-            self.date_last_run_end = datetime.datetime.now()
-
-        return self.execution_list[context.execution_id]
+        # another execution_id (e.g., a simulation) may have finished recording first
+        if static_schedule is not None and not static_schedule:
+            static_schedule.extend(time_steps)
 
     @property
     def _dict_summary(self):
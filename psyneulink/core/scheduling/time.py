@@ -113,14 +113,26 @@ class Clock:
     ----------
         history : `TimeHistoryTree`
             a root `TimeHistoryTree` associated with this Clock
+
+        history_max_length : int : None
+            the maximum number of `TimeHistoryTree`\\ s retained for each :class:`TimeScale` in **history**
+            (see `TimeHistoryTree.max_children`). If None, the full history is retained
     """
-    def __init__(self):
-        self.history = TimeHistoryTree()
+    def __init__(self, history_max_length=None):
+        self.history = TimeHistoryTree(max_children=history_max_length)
         self._simple_time = SimpleTime()
 
     def __repr__(self):
         return 'Clock({0})'.format(self.time.__repr__())
 
+    @property
+    def history_max_length(self):
+        return self.history.max_children
+
+    @history_max_length.setter
+    def history_max_length(self, value):
+        self.history._set_max_children(value)
+
     def _increment_time(self, time_scale):
         """
         Calls `self.history.increment_time <TimeHistoryTree.increment_time>`
@@ -309,8 +321,15 @@ class TimeHistoryTree:
             `TimeScale.TIME_STEP`\\ s in a certain `TimeScale.PASS`), but
             this may use a large amount of memory in large simulations
 
+        max_children : int : None
+            the maximum number of children retained by this tree and each of its subtrees. When a new
+            child is created, the oldest ones are removed as needed, and can no longer be queried in
+            `get_total_times_relative`. The **total_times** of this tree still include the time that
+            occurred in them. If None, all children are retained
+
         index : int
-            the index this tree has in its parent's children list
+            the index this tree has in its parent's children list, counting any children that have been
+            removed because of **max_children**
 
         parent : `TimeHistoryTree` : None
             the parent node of this tree, if it exists. \
@@ -339,8 +358,12 @@ class TimeHistoryTree:
         max_depth=TimeScale.TRIAL,
         index=0,
         parent=None,
-        enable_current_time=True
+        enable_current_time=True,
+        max_children=None
     ):
+        if max_children is not None and max_children < 1:
+            raise TimeScaleError(f'max_children (given: {max_children}) must be None or at least 1')
+
         if enable_current_time:
             self.current_time = Time()
             self.previous_time = None
@@ -348,6 +371,9 @@ class TimeHistoryTree:
         self.time_scale = time_scale
         self.max_depth = max_depth
         self.parent = parent
+        self.max_children = max_children
+        # the number of (oldest) children that have been removed to respect max_children
+        self._num_removed_children = 0
 
         self.child_time_scale = TimeScale.get_child(time_scale)
 
@@ -358,7 +384,8 @@ class TimeHistoryTree:
                     max_depth=max_depth,
                     index=0,
                     parent=self,
-                    enable_current_time=False
+                    enable_current_time=False,
+                    max_children=max_children
                 )
             ]
         else:
@@ -381,11 +408,13 @@ class TimeHistoryTree:
                     TimeHistoryTree(
                         self.child_time_scale,
                         max_depth=self.max_depth,
-                        index=len(self.children),
+                        index=self._num_removed_children + len(self.children),
                         parent=self,
-                        enable_current_time=False
+                        enable_current_time=False,
+                        max_children=self.max_children
                     )
                 )
+                self._remove_old_children()
             else:
                 self.children[-1].increment_time(time_scale)
         self.total_times[time_scale] += 1
@@ -396,6 +425,30 @@ class TimeHistoryTree:
             # not all of these objects have time tracking
             pass
 
+    def _remove_old_children(self):
+        if self.max_children is not None and len(self.children) > self.max_children:
+            num_removed = len(self.children) - self.max_children
+            del self.children[:num_removed]
+            self._num_removed_children += num_removed
+
+    def _set_max_children(self, max_children):
+        if max_children is not None and max_children < 1:
+            raise TimeScaleError(f'max_children (given: {max_children}) must be None or at least 1')
+
+        self.max_children = max_children
+        self._remove_old_children()
+        for child in self.children:
+            child._set_max_children(max_children)
+
+    def _get_child(self, index):
+        """
+        Returns the child with **index**, raising an IndexError if it does not exist or has been removed
+        """
+        position = index - self._num_removed_children
+        if position < 0:
+            raise IndexError(index)
+        return self.children[position]
+
     def get_total_times_relative(
         self,
         query_time_scale,
@@ -477,13 +530,13 @@ class TimeHistoryTree:
             # assign them to their latest time values as default
             while node.time_scale > base_time_scale:
                 if base_indices[node.child_time_scale] is None:
-                    base_indices[node.child_time_scale] = len(node.children) - 1
-                node = node.children[base_indices[node.child_time_scale]]
+                    base_indices[node.child_time_scale] = node._num_removed_children + len(node.children) - 1
+                node = node._get_child(base_indices[node.child_time_scale])
 
             # attempt to retrieve the correct time count given the base_indices dictionary
             node = self
             while node.time_scale != base_time_scale:
-                node = node.children[base_indices[node.child_time_scale]]
+                node = node._get_child(base_indices[node.child_time_scale])
             return node.total_times[query_time_scale]
         except IndexError:
             raise TimeScaleError(
@@ -59,6 +59,10 @@ following requirements:
     * It may also implement a memory attribute;  if it does, it can be accessed by the EpisodicMemoryMechanism's
       `memory <EpisodicMemoryMechanism.memory>` attribute.
 
+The memory of a `ContentAddressableMemory` can be saved to and loaded from files (including as memory-mapped arrays)
+using its `save_memory <ContentAddressableMemory.save_memory>` and `load_memory <ContentAddressableMemory.load_memory>`
+methods (see `ContentAddressableMemory_Saving_And_Loading`).
+
 .. _EpisodicMemoryMechanism_Execution:
 
 Execution
@@ -168,6 +168,7 @@ from typing import Iterable
 import numpy as np
 import typecheck as tc
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.functions.combinationfunctions import PredictionErrorDeltaFunction
 from psyneulink.core.components.mechanisms.mechanism import Mechanism_Base
 from psyneulink.core.components.ports.outputport import OutputPort
@@ -328,3 +329,20 @@ class PredictionErrorMechanism(ComparatorMechanism):
         delta = delta[0][1:]
         delta = np.append(delta, 0)
         return delta
+
+    def _gen_llvm_function_postprocess(self, builder, ctx, mf_out):
+        # Shift the delta values one step back in time (see _execute)
+        mech_out_ty = ctx.convert_python_struct_to_llvm_ir(self.defaults.value)
+        mech_out = builder.alloca(mech_out_ty)
+
+        delta_in = ctx.unwrap_2d_array(builder, mf_out)
+        delta_out = ctx.unwrap_2d_array(builder, mech_out)
+
+        zero = ctx.int32_ty(0)
+        stop = ctx.int32_ty(delta_out.type.pointee.count - 1)
+        with pnlvm.helpers.for_loop_zero_inc(builder, stop, "delta_shift") as (b1, t):
+            val = b1.load(b1.gep(delta_in, [zero, b1.add(t, ctx.int32_ty(1))]))
+            b1.store(val, b1.gep(delta_out, [zero, t]))
+        builder.store(ctx.float_ty(0), builder.gep(delta_out, [zero, stop]))
+
+        return mech_out, builder
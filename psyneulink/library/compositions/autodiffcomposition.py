@@ -857,11 +857,11 @@ class AutodiffComposition(Composition):
                 try:
                     if bin_execute is True or bin_execute.startswith('LLVM'):
                         _comp_ex = pnlvm.CompExecution(self, [context.execution_id])
-                        results = _comp_ex.run(inputs, learning=True)
+                        results = pnlvm._split_run_outputs(_comp_ex.run(inputs, learning=True))
                     elif bin_execute.startswith('PTX'):
                         self.__ptx_initialize(context)
                         EX = self._compilation_data.ptx_execution._get(context)
-                        results = EX.cuda_run(inputs, learning=True)
+                        results = pnlvm._split_run_outputs(EX.cuda_run(inputs, learning=True))
 
                     return results
 
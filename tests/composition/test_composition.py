@@ -603,6 +603,25 @@ class TestAnalyzeGraph:
         assert comp.controller.objective_mechanism not in comp.get_nodes_by_role(NodeRole.OUTPUT)
         assert B in comp.get_nodes_by_role(NodeRole.OUTPUT)
 
+    def test_execution_plan_invalidated_by_structural_change(self):
+        comp = Composition()
+        A = TransferMechanism(name='composition-pytests-A')
+        B = TransferMechanism(name='composition-pytests-B')
+        comp.add_node(A)
+        comp._analyze_graph()
+        assert comp._execution_plan[A].is_input
+        assert comp._execution_plan[A].learning_projections == []
+
+        comp.add_node(B)
+        assert comp._execution_plan is None
+        comp.add_projection(MappingProjection(sender=A, receiver=B), A, B)
+        comp.run(inputs={A: [[1.0]]})
+        assert comp._execution_plan[A].is_input
+        assert not comp._execution_plan[B].is_input
+
+        comp.remove_projection(comp.projections[0])
+        assert comp._execution_plan is None
+
 
 class TestGraphCycles:
 
@@ -2463,6 +2482,134 @@ class TestRun:
         )
 
 
+class TestBatchedRun:
+
+    def _build_composition(self):
+        A = TransferMechanism(name='A', size=3, function=Logistic(gain=2.0))
+        B = ProcessingMechanism(name='B', size=2, function=Linear(slope=3.0, intercept=1.0))
+        C = TransferMechanism(name='C', size=2, function=pnl.ReLU, noise=0.5, clip=[0, 10])
+        D = TransferMechanism(name='D', size=2)
+        comp = Composition()
+        comp.add_linear_processing_pathway([A,
+                                            MappingProjection(matrix=[[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]),
+                                            B, C])
+        comp.add_linear_processing_pathway([A, MappingProjection(matrix=[[1, 0], [0, 1], [1, 1]]), D, C])
+        return comp, A
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize("batch_size", [1, 3, 7, 100])
+    def test_batched_run_matches_run(self, batch_size):
+        inputs = np.random.RandomState(0).rand(7, 3).tolist()
+        comp, A = self._build_composition()
+        expected = comp.run(inputs={A: inputs})
+        batched_comp, batched_A = self._build_composition()
+        output = batched_comp.run(inputs={batched_A: inputs}, batch_size=batch_size)
+
+        assert np.allclose(output, expected)
+        assert np.allclose(np.array(batched_comp.results), np.array(comp.results))
+        for batched_node, node in zip(batched_comp.nodes, comp.nodes):
+            assert np.allclose(batched_node.parameters.value.get(batched_comp),
+                               node.parameters.value.get(comp))
+        assert batched_comp.scheduler.clocks[batched_comp.default_execution_id].get_total_times_relative(
+            TimeScale.TRIAL, TimeScale.LIFE) == 7
+
+    @pytest.mark.composition
+    def test_batched_run_num_trials(self):
+        inputs = [[1.0, 2.0, 3.0], [-1.0, 0.0, 1.0]]
+        comp, A = self._build_composition()
+        comp.run(inputs={A: inputs}, num_trials=5)
+        batched_comp, batched_A = self._build_composition()
+        batched_comp.run(inputs={batched_A: inputs}, num_trials=5, batch_size=2)
+
+        assert len(batched_comp.results) == 5
+        assert np.allclose(np.array(batched_comp.results), np.array(comp.results))
+
+    @pytest.mark.composition
+    def test_batched_run_unsupported_composition(self):
+        A = TransferMechanism(name='A', integrator_mode=True)
+        B = TransferMechanism(name='B')
+        comp = Composition()
+        comp.add_linear_processing_pathway([A, B])
+        with pytest.raises(CompositionError) as error_text:
+            comp.run(inputs={A: [[1.0], [2.0]]}, batch_size=2)
+        assert "A is in integrator_mode" in str(error_text.value)
+
+    @pytest.mark.composition
+    def test_batched_run_unsupported_argument(self):
+        comp, A = self._build_composition()
+        with pytest.raises(CompositionError) as error_text:
+            comp.run(inputs={A: [[1.0, 2.0, 3.0]]}, batch_size=2, call_after_trial=lambda: None)
+        assert "cannot be used with batch_size" in str(error_text.value)
+        assert "call_after_trial" in str(error_text.value)
+
+
+class TestResultsSink:
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize("mode", ['Python', pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    def test_results_sink_callable(self, mode):
+        A = TransferMechanism(name='A', function=Linear(slope=2.0))
+        comp = Composition()
+        comp.add_node(A)
+
+        sunk = []
+        output = comp.run(inputs={A: [[1.0], [2.0], [3.0]]}, results_sink=sunk.append, bin_execute=mode)
+
+        assert np.allclose(output, [[6.0]])
+        assert np.allclose(sunk, [[[2.0]], [[4.0]], [[6.0]]])
+        assert comp.results == []
+
+    @pytest.mark.composition
+    def test_results_sink_generator(self):
+        A = TransferMechanism(name='A')
+        comp = Composition()
+        comp.add_node(A)
+
+        def total():
+            sum = 0
+            while True:
+                sum += (yield sum)[0][0]
+
+        sink = total()
+        comp.run(inputs={A: [[1.0], [2.0], [3.0]]}, num_trials=6, results_sink=sink)
+        comp.run(inputs={A: [[1.0], [2.0], [3.0]]}, batch_size=2, results_sink=sink)
+
+        assert sink.send([[0.0]]) == 18.0
+        assert comp.results == []
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+    def test_npy_results_writer(self, tmp_path, chunk_size):
+        A = TransferMechanism(name='A', size=2)
+        comp = Composition()
+        comp.add_node(A)
+        inputs = np.random.RandomState(0).rand(5, 2)
+        expected = Composition()
+        expected_A = TransferMechanism(name='A', size=2)
+        expected.add_node(expected_A)
+        expected.run(inputs={expected_A: inputs})
+        expected.run(inputs={expected_A: inputs})
+
+        path = str(tmp_path / 'results.npy')
+        with pnl.NpyResultsWriter(path, chunk_size=chunk_size) as writer:
+            comp.run(inputs={A: inputs}, results_sink=writer)
+            comp.run(inputs={A: inputs}, results_sink=writer)
+            assert writer.num_results == 10
+
+        results = np.load(path, mmap_mode='r')
+        assert results.shape == (10, 1, 2)
+        assert np.allclose(results, np.array(expected.results))
+        assert comp.results == []
+
+    @pytest.mark.composition
+    def test_npy_results_writer_inconsistent_shape(self, tmp_path):
+        with pnl.NpyResultsWriter(str(tmp_path / 'results.npy')) as writer:
+            writer.write([[1.0, 2.0]])
+            with pytest.raises(pnl.ResultsSinkError) as error_text:
+                writer.write([[1.0, 2.0, 3.0]])
+        assert "must all have the same shape" in str(error_text.value)
+
+
 class TestCallBeforeAfterTimescale:
 
     def test_call_before_record_timescale(self):
@@ -4717,6 +4864,78 @@ class TestInputSpecifications:
               num_trials=1)
         assert c.parameters.results.get(c) == [[np.array([0.])]]
 
+    @pytest.mark.composition
+    @pytest.mark.parametrize("mode", ['Python',
+                                      pytest.param('LLVMExec', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    def test_array_as_inputs(self, mode):
+        A = TransferMechanism(name='A', default_variable=[[0.0, 0.0], [0.0, 0.0]], input_ports=['a1', 'a2'])
+        B = TransferMechanism(name='B', size=3, function=Linear(slope=2.0))
+        comp = Composition()
+        comp.add_node(A)
+        comp.add_node(B)
+
+        A_inputs = np.arange(20.0).reshape(5, 2, 2)
+        B_inputs = np.arange(15.0).reshape(5, 3)
+        comp.run(inputs={A: A_inputs, B: B_inputs}, bin_execute=mode)
+
+        expected = [[A_inputs[i][0], A_inputs[i][1], 2 * B_inputs[i]] for i in range(5)]
+        assert len(comp.results) == 5
+        for result, expected_result in zip(comp.results, expected):
+            for r, e in zip(result, expected_result):
+                assert isinstance(r, np.ndarray)
+                assert np.allclose(r, e)
+
+    @pytest.mark.composition
+    @pytest.mark.llvm
+    def test_compiled_run_outputs(self):
+        A = TransferMechanism(name='A', size=2, function=Linear(slope=2.0))
+        comp = Composition()
+        comp.add_node(A)
+        comp._analyze_graph()
+
+        inputs = {A: np.arange(8.0).reshape(4, 1, 2)}
+        e = pnlvm.execution.CompExecution(comp)
+        outputs = e.run(inputs, 4, 4)
+
+        # Structured array that views the output buffer of the run
+        assert isinstance(outputs, np.ndarray)
+        assert outputs.shape == (4,)
+        assert len(outputs.dtype.names) == 1
+        assert not outputs.flags.owndata
+        assert np.allclose(outputs[outputs.dtype.names[0]], 2 * np.arange(8.0).reshape(4, 2))
+
+        list_outputs = pnlvm.execution.CompExecution(comp).run(inputs, 4, 4, as_list=True)
+        assert isinstance(list_outputs, list)
+        assert np.allclose(list_outputs, [[[0.0, 2.0]], [[4.0, 6.0]], [[8.0, 10.0]], [[12.0, 14.0]]])
+
+    @pytest.mark.composition
+    @pytest.mark.llvm
+    def test_compiled_execute_inputs(self):
+        A = TransferMechanism(name='A', default_variable=[[0.0, 0.0], [0.0]], input_ports=['a1', 'a2'])
+        B = TransferMechanism(name='B', size=3, function=Linear(slope=2.0))
+        comp = Composition()
+        comp.add_node(A)
+        comp.add_node(B)
+        comp._analyze_graph()
+
+        input_structs = []
+        for i in range(3):
+            # Ports of A have different shapes
+            inputs = {A: [[i, i + 1.0], [i + 2.0]], B: [np.arange(3.0) + i]}
+            e = pnlvm.execution.CompExecution(comp)
+            e.execute(inputs)
+            input_structs.append(comp._compilation_data.input_struct._get(e._execution_contexts[0]))
+
+            outputs = e.extract_node_output(comp.output_CIM)
+            assert np.allclose(outputs[0], [i, i + 1.0])
+            assert np.allclose(outputs[1], [i + 2.0])
+            assert np.allclose(outputs[2], 2 * (np.arange(3.0) + i))
+
+        # The input buffer is reused by subsequent executions
+        assert input_structs[0] is not None
+        assert all(s is input_structs[0] for s in input_structs)
+
     @pytest.mark.parametrize(
             "with_outer_controller,with_inner_controller",
             [(True, True), (True, False), (False, True), (False, False)]
@@ -5127,4 +5346,5 @@ class TestMisc:
         comp.disable_all_history()
         comp.run(inputs={A: [2]})
 
-        assert len(A.parameters.value.history[comp.default_execution_id]) == 0
+        assert comp.default_execution_id not in A.parameters.value.history
+        assert A.parameters.value.get_previous(comp) is None
@@ -1524,6 +1524,41 @@ class TestModelBasedOptimizationControlMechanisms:
         assert np.allclose(comp.results, [[np.array([0.75])], [np.array([1.5])], [np.array([2.25])]])
         benchmark(comp.run, inputs, bin_execute=mode)
 
+    @pytest.mark.control
+    @pytest.mark.composition
+    @pytest.mark.llvm
+    @pytest.mark.parametrize("mode", ["LLVM", "LLVMExec", "LLVMRun"])
+    @pytest.mark.parametrize("num_threads", [2, 4])
+    def test_model_based_ocm_threads(self, mode, num_threads):
+
+        A = pnl.ProcessingMechanism(name='A')
+        B = pnl.ProcessingMechanism(name='B')
+
+        comp = pnl.Composition(name='comp',
+                               controller_mode=pnl.BEFORE)
+        comp.add_linear_processing_pathway([A, B])
+
+        search_range = pnl.SampleSpec(start=0.25, stop=0.75, step=0.25)
+        control_signal = pnl.ControlSignal(projections=[(pnl.SLOPE, A)],
+                                           variable=1.0,
+                                           allocation_samples=search_range,
+                                           intensity_cost_function=pnl.Linear(slope=0.))
+
+        objective_mech = pnl.ObjectiveMechanism(monitor=[B])
+        ocm = pnl.OptimizationControlMechanism(agent_rep=comp,
+                                               features=[A.input_port],
+                                               objective_mechanism=objective_mech,
+                                               function=pnl.GridSearch(num_threads=num_threads),
+                                               control_signals=[control_signal])
+
+        comp.add_controller(ocm)
+
+        inputs = {A: [[[1.0]], [[2.0]], [[3.0]]]}
+
+        comp.run(inputs=inputs, bin_execute=mode)
+
+        assert np.allclose(comp.results, [[np.array([0.75])], [np.array([1.5])], [np.array([2.25])]])
+
     def test_model_based_ocm_with_buffer(self):
 
         A = pnl.ProcessingMechanism(name='A')
@@ -272,6 +272,44 @@ class TestReinforcement:
 
         assert np.allclose(trial_50_expected, delta_vals[49][0])
 
+    @pytest.mark.composition
+    @pytest.mark.llvm
+    def test_td_learning_compiled_run(self):
+
+        def _create_td_composition():
+            sample_mechanism = pnl.TransferMechanism(default_variable=np.zeros(60),
+                                                     name=pnl.SAMPLE)
+            action_selection = pnl.TransferMechanism(default_variable=np.zeros(60),
+                                                     function=pnl.Linear(slope=1.0, intercept=0.01),
+                                                     name='Action Selection')
+            sample_to_action_selection = pnl.MappingProjection(sender=sample_mechanism,
+                                                               receiver=action_selection,
+                                                               matrix=np.zeros((60, 60)))
+            comp = pnl.Composition(name='TD_Learning')
+            pathway = [sample_mechanism, sample_to_action_selection, action_selection]
+            learning_related_components = comp.add_td_learning_pathway(pathway, learning_rate=0.3)
+            target_mechanism = learning_related_components[pnl.TARGET_MECHANISM]
+            return comp, sample_mechanism, target_mechanism
+
+        stimulus_onset = 41
+        reward_delivery = 54
+
+        sample = [0.] * stimulus_onset + [1.] * (60 - stimulus_onset)
+        target = [0.] * 60
+        target[reward_delivery] = 1.
+
+        results = {}
+        for mode in ['Python', 'LLVMRun']:
+            comp, sample_mechanism, target_mechanism = _create_td_composition()
+            comp.run(inputs={sample_mechanism: [sample] * 20,
+                             target_mechanism: [target] * 20},
+                     bin_execute=mode)
+            results[mode] = comp.results
+
+        assert len(results['LLVMRun']) == len(results['Python'])
+        for compiled, python in zip(results['LLVMRun'], results['Python']):
+            assert np.allclose(compiled, python)
+
 
 class TestNestedLearning:
 
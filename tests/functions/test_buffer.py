@@ -103,6 +103,35 @@ class TestBuffer():
                 assert np.allclose(expected_val[i][j], val[i][j])
         benchmark(B.execute, [1, 2, 3])
 
+    @pytest.mark.parametrize("rate, noise, history", [
+        (0.5, 0.0, 5),
+        ([0.9, 0.5, 0.0], [1.0, -2.0, 0.5], 7),
+        (1.0, 3.0, None),
+        (0.01, 1.0, 40),
+    ])
+    def test_buffer_long_run(self, rate, noise, history):
+        B = Buffer(history=history, rate=rate, noise=noise)
+        expected = deque(maxlen=history)
+        rng = np.random.RandomState(5)
+        for i in range(100):
+            variable = rng.rand(3)
+            if len(expected):
+                expected = deque(np.array(expected) * rate + noise, maxlen=history)
+            expected.append(variable)
+            val = B.execute(variable)
+            assert len(val) == len(expected)
+            assert np.allclose(val, np.array(expected))
+        assert np.allclose(np.asarray(B.previous_value), np.array(expected))
+
+    def test_buffer_change_history(self):
+        B = Buffer(history=5)
+        for i in range(10):
+            B.execute([i])
+        B.history = 3
+        assert np.allclose(B.execute([10]), [[8], [9], [10]])
+        B.reinitialize()
+        assert np.allclose(B.execute([11]), [[11]])
+
     @pytest.mark.benchmark(group="BufferFunction")
     def test_buffer_initializer_len_3(self, benchmark):
         B = Buffer(default_variable=[[0.0], [1.0], [2.0]],
@@ -77,6 +77,22 @@ def test_basic(variable, metric, normalize, fail, expected, benchmark):
     assert np.isscalar(res) or len(res) == 1 or (metric == kw.PEARSON and res.size == 4)
 
 
+@pytest.mark.function
+@pytest.mark.distance_function
+@pytest.mark.parametrize("variable, metric, normalize, fail, expected", test_data, ids=names)
+def test_row_distances(variable, metric, normalize, fail, expected):
+    if fail is not None:
+        pytest.xfail(fail)
+
+    f = Functions.Distance(default_variable=variable, metric=metric, normalize=normalize)
+    rows = np.random.rand(10, SIZE) + Function.EPSILON
+    rows[3] = variable[1]
+    res = f._row_distances(variable[0], rows)
+    assert res.shape == (10,)
+    assert np.allclose(res, [f.function([variable[0], r]) for r in rows])
+    assert np.allclose(res[3], expected)
+
+
 @pytest.mark.llvm
 @pytest.mark.function
 @pytest.mark.distance_function
@@ -5,6 +5,7 @@ import psyneulink.core.globals.keywords as kw
 import pytest
 
 from math import e, pi, sqrt
+from statistics import NormalDist as StdNormalDist
 
 np.random.seed(0)
 test_var = np.random.rand()
@@ -15,11 +16,40 @@ RAND3 = np.random.rand()
 RAND4 = np.random.rand()
 RAND5 = np.random.rand()
 
+
+def random_helper(seed, sample):
+    state = np.random.RandomState([seed])
+    # compensate for construction
+    sample(state)
+    return sample(state)
+
+
+def uniform_to_normal_helper(seed, mean, standard_deviation):
+    uniform = random_helper(seed, lambda state: state.rand(1)[0])
+    return StdNormalDist(mean, standard_deviation).inv_cdf(uniform)
+
+
 test_data = [
     (Functions.DriftDiffusionAnalytical, test_var, {}, None,
      (1.9774974807292212, 0.012242689689501842, 1.9774974807292207, 1.3147677945132479, 1.7929299891370192, 1.9774974807292207, 1.3147677945132479, 1.7929299891370192)),
     (Functions.DriftDiffusionAnalytical, test_var, {"drift_rate": RAND1, "threshold": RAND2, "starting_point": RAND3, "t0":RAND4, "noise": RAND5}, None,
      (0.4236547993389047, -2.7755575615628914e-17, 0.5173675420165031, 0.06942854144616283, 6.302631815990666, 1.4934079600147951, 0.4288991185241868, 1.7740760781361433)),
+    (Functions.NormalDist, test_var, {"mean": RAND1, "standard_deviation": RAND2, "seed": 0}, None,
+     random_helper(0, lambda state: state.normal(RAND1, RAND2))),
+    (Functions.UniformToNormalDist, test_var, {"mean": RAND1, "standard_deviation": RAND2, "seed": 0}, None,
+     uniform_to_normal_helper(0, RAND1, RAND2)),
+    (Functions.ExponentialDist, test_var, {"beta": RAND1, "seed": 0}, None,
+     random_helper(0, lambda state: state.exponential(RAND1))),
+    (Functions.UniformDist, test_var, {"low": RAND1, "high": RAND1 + RAND2, "seed": 0}, None,
+     random_helper(0, lambda state: state.uniform(RAND1, RAND1 + RAND2))),
+    (Functions.GammaDist, test_var, {"scale": RAND1, "dist_shape": RAND2, "seed": 0}, None,
+     random_helper(0, lambda state: state.gamma(RAND2, RAND1))),
+    (Functions.GammaDist, test_var, {"scale": RAND1, "dist_shape": RAND2 + 1, "seed": 0}, None,
+     random_helper(0, lambda state: state.gamma(RAND2 + 1, RAND1))),
+    (Functions.GammaDist, test_var, {"scale": RAND1, "dist_shape": 1.0, "seed": 0}, None,
+     random_helper(0, lambda state: state.gamma(1.0, RAND1))),
+    (Functions.WaldDist, test_var, {"scale": RAND1, "mean": RAND2, "seed": 0}, None,
+     random_helper(0, lambda state: state.wald(RAND2, RAND1))),
 #    (Functions.DriftDiffusionAnalytical, 1e-4, {"drift_rate": 1e-5, "threshold": RAND2, "starting_point": RAND3, "t0":RAND4, "noise": RAND5}, "Rounding errors",
 #     (0.5828813465336954, 0.04801236718458773, 0.532471083815943, 0.09633801362499317, 6.111833139205608, 1.5821207676710864, 0.5392724012504414, 1.8065252817609618)),
 ]
@@ -28,6 +58,14 @@ test_data = [
 names = [
     "DriftDiffusionAnalytical-DefaultParameters",
     "DriftDiffusionAnalytical-RandomParameters",
+    "NormalDist",
+    "UniformToNormalDist",
+    "ExponentialDist",
+    "UniformDist",
+    "GammaDist-SmallShape",
+    "GammaDist-LargeShape",
+    "GammaDist-UnitShape",
+    "WaldDist",
 #    "DriftDiffusionAnalytical-SmallDriftRate",
 ]
 
@@ -43,6 +81,9 @@ def test_execute(func, variable, params, llvm_skip, expected, benchmark, mode):
     benchmark.group = "TransferFunction " + func.componentName
     if mode != "Python" and llvm_skip:
         pytest.skip(llvm_skip)
+    if func is Functions.UniformToNormalDist:
+        # Construction executes the Python function
+        pytest.importorskip("scipy")
     f = func(default_variable=variable, **params)
     if mode == "Python":
         ex = f
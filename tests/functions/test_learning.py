@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+import psyneulink.core.components.functions.learningfunctions as Functions
+import psyneulink.core.globals.keywords as kw
+import psyneulink.core.llvm as pnlvm
+
+from math import pi, sqrt
+
+SIZE = 10
+test_var = np.random.rand(SIZE)
+test_activation_input = np.random.rand(SIZE)
+test_activation_output = np.random.rand(SIZE)
+test_error_signal = np.random.rand(SIZE // 2)
+test_error_matrix = np.random.rand(SIZE, SIZE // 2)
+test_matrix = np.random.rand(SIZE, SIZE)
+
+test_selection = np.zeros(SIZE)
+test_selection[SIZE // 3] = np.random.rand()
+
+RAND1 = np.random.rand()
+RAND2 = np.random.rand()
+
+
+def hebbian_helper(variable, learning_rate):
+    return np.outer(variable, variable) * (1 - np.identity(len(variable))) * learning_rate
+
+
+def reinforcement_helper(output, error, learning_rate):
+    error_array = np.where(output, learning_rate * error, 0)
+    return [error_array, error_array]
+
+
+def backprop_helper(activation_input, activation_output, error_signal, error_matrix, learning_rate):
+    dE_dA = np.dot(error_matrix, error_signal)
+    dE_dW = dE_dA * activation_output * (1 - activation_output)
+    return [learning_rate * np.outer(activation_input, dE_dW), dE_dW]
+
+
+def kohonen_helper(input_pattern, activities, matrix, distance, learning_rate):
+    index_of_max = np.argmax(activities)
+    distances = np.array([distance(abs(i - index_of_max)) for i in range(len(activities))])
+    return (1 - distances) * (matrix - np.atleast_2d(input_pattern).transpose()) * learning_rate
+
+
+reinforcement_var = [test_activation_input, test_selection, [RAND2]]
+backprop_var = [test_activation_input, test_activation_output, test_error_signal]
+kohonen_var = [test_activation_input, test_var, test_matrix]
+
+test_data = [
+    (Functions.Hebbian, test_var, {'learning_rate': RAND1}, None,
+     hebbian_helper(test_var, RAND1)),
+    (Functions.ContrastiveHebbian, test_var, {'learning_rate': RAND1}, None,
+     hebbian_helper(test_var, RAND1)),
+    (Functions.Reinforcement, reinforcement_var, {'learning_rate': RAND1}, None,
+     reinforcement_helper(test_selection, RAND2, RAND1)),
+    (Functions.TDLearning, reinforcement_var, {'learning_rate': RAND1}, None,
+     reinforcement_helper(test_selection, RAND2, RAND1)),
+    (Functions.BackPropagation, backprop_var, {'learning_rate': RAND1}, test_error_matrix,
+     backprop_helper(*backprop_var, test_error_matrix, RAND1)),
+    (Functions.Kohonen, kohonen_var, {'learning_rate': RAND1, 'distance_function': kw.GAUSSIAN}, None,
+     kohonen_helper(*kohonen_var, lambda x: np.exp(-x * x / 2) / sqrt(2 * pi), RAND1)),
+    (Functions.Kohonen, kohonen_var, {'learning_rate': RAND1, 'distance_function': kw.LINEAR}, None,
+     kohonen_helper(*kohonen_var, lambda x: x, RAND1)),
+    (Functions.Kohonen, kohonen_var, {'learning_rate': RAND1, 'distance_function': kw.EXPONENTIAL}, None,
+     kohonen_helper(*kohonen_var, np.exp, RAND1)),
+]
+
+# use list, naming function produces ugly names
+names = [
+    "HEBBIAN",
+    "CONTRASTIVE_HEBBIAN",
+    "REINFORCEMENT",
+    "TD_LEARNING",
+    "BACKPROPAGATION",
+    "KOHONEN GAUSSIAN",
+    "KOHONEN LINEAR",
+    "KOHONEN EXPONENTIAL",
+]
+
+@pytest.mark.function
+@pytest.mark.learning_function
+@pytest.mark.benchmark
+@pytest.mark.parametrize("func, variable, params, error_matrix, expected", test_data, ids=names)
+@pytest.mark.parametrize("mode", [
+    "Python",
+    pytest.param("LLVM", marks=pytest.mark.llvm)])
+def test_execute(func, variable, params, error_matrix, expected, benchmark, mode):
+    f = func(default_variable=variable, **params)
+    benchmark.group = "LearningFunction " + func.componentName
+    kwargs = {}
+    if error_matrix is not None:
+        # Compiled execution reads error_matrix from the parameter
+        kwargs['error_matrix'] = error_matrix
+        f.parameters.error_matrix.set(error_matrix)
+
+    if mode == "Python":
+        ex = lambda x: f.function(x, **kwargs)
+    elif mode == "LLVM":
+        ex = pnlvm.execution.FuncExecution(f).execute
+    res = ex(variable)
+    if isinstance(expected, list):
+        assert len(res) == len(expected)
+        for r, e in zip(res, expected):
+            assert np.allclose(r, e)
+    else:
+        assert np.allclose(res, expected)
+    benchmark(ex, variable)
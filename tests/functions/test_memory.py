@@ -516,6 +516,148 @@ def test_ContentAddressableMemory_max_entries():
     assert np.allclose(em.memory, expected_memory)
 
 
+def test_ContentAddressableMemory_large_memory():
+
+    rng = np.random.RandomState(1)
+    keys = rng.rand(200, 5)
+    vals = rng.rand(200, 5)
+    em = ContentAddressableMemory(
+            initializer=[[k, v] for k, v in zip(keys, vals)],
+            duplicate_keys=True,
+            max_entries=150
+    )
+    assert np.allclose(em.memory, [[k, v] for k, v in zip(keys[50:], vals[50:])])
+
+    query = rng.rand(5)
+    cosine = np.array([np.dot(query, k) / np.linalg.norm(query) / np.linalg.norm(k) for k in keys[50:]])
+    best = 50 + np.argmin(1 - np.abs(cosine))
+    retrieved = em.get_memory(query)
+    assert np.allclose(retrieved[0], keys[best])
+    assert np.allclose(retrieved[1], vals[best])
+
+    # Storing more entries does not change contents that were retrieved before
+    contents = em.memory
+    em.add_to_memory(rng.rand(20, 2, 5))
+    assert len(em.memory) == 150
+    assert np.allclose(contents[20:], em.memory[:130])
+    assert np.allclose(contents, [[k, v] for k, v in zip(keys[50:], vals[50:])])
+
+
+def test_ContentAddressableMemory_duplicate_keys_large_memory():
+
+    rng = np.random.RandomState(3)
+    keys = rng.randint(0, 4, (2000, 6)).astype(float)
+    vals = rng.rand(2000, 6)
+    first = np.sort(np.unique(keys, axis=0, return_index=True)[1])
+    new_val = [4, 5, 6, 7, 8, 9]
+
+    em = ContentAddressableMemory(duplicate_keys=False, max_entries=5000)
+    em.add_to_memory([[k, v] for k, v in zip(keys, vals)])
+    assert np.allclose(em.memory, [[keys[i], vals[i]] for i in first])
+
+    # -0.0 matches 0.0
+    em.duplicate_keys = OVERWRITE
+    key = np.where(keys[first[3]] == 0, -0.0, keys[first[3]])
+    em.add_to_memory([key, new_val])
+    assert len(em.memory) == len(first)
+    assert np.allclose(em.memory[3][1], new_val)
+
+    # Keys are found after entries are deleted and evicted
+    em.delete_from_memory([keys[first[0]], vals[first[0]]])
+    em.max_entries = len(first) - 1
+    em.add_to_memory([[100] * 6, new_val])
+    em.add_to_memory([keys[first[0]], new_val])
+    em.add_to_memory([keys[first[1]], new_val])
+    em.add_to_memory([keys[first[4]], new_val])
+    assert len(em.memory) == len(first) - 1
+    assert np.allclose(em.memory[0], [keys[first[4]], new_val])
+    assert np.allclose(em.memory[-2][0], keys[first[0]])
+    assert np.allclose(em.memory[-1][0], keys[first[1]])
+
+
+def test_ContentAddressableMemory_approximate_retrieval():
+
+    rng = np.random.RandomState(2)
+    keys = rng.rand(300, 16) - 0.5
+    vals = rng.rand(300, 4)
+    em = ContentAddressableMemory(
+            initializer=[[k, v] for k, v in zip(keys, vals)],
+            duplicate_keys=True,
+            max_entries=250,
+            approximate_retrieval=True,
+            hash_tables=4,
+            hash_bits=8
+    )
+    assert np.allclose(em.memory, [[k, v] for k, v in zip(keys[50:], vals[50:])])
+
+    # Keys close to stored ones retrieve those entries
+    for i in [50, 120, 299]:
+        retrieved = em.get_memory(keys[i] + 1e-9)
+        assert np.allclose(retrieved[0], keys[i])
+        assert np.allclose(retrieved[1], vals[i])
+
+    # The index follows entries that are deleted, evicted and added
+    em.delete_from_memory([keys[120], vals[120]])
+    assert not np.allclose(em.get_memory(keys[120])[0], keys[120])
+    em.add_to_memory([[k, v] for k, v in zip(-keys[:10], vals[:10])])
+    assert len(em.memory) == 250
+    assert not np.allclose(em.get_memory(keys[50] + 1e-9)[0], keys[50])
+    for i in [5, 9]:
+        retrieved = em.get_memory(-keys[i])
+        assert np.allclose(retrieved[0], -keys[i])
+        assert np.allclose(retrieved[1], vals[i])
+    retrieved = em.get_memory(keys[200])
+    assert np.allclose(retrieved[0], keys[200])
+
+
+@pytest.mark.parametrize('mmap', [False, True])
+def test_ContentAddressableMemory_save_load(tmp_path, mmap):
+
+    rng = np.random.RandomState(4)
+    keys = rng.rand(50, 4)
+    vals = rng.rand(50, 3)
+    em = ContentAddressableMemory(initializer=[[k, v] for k, v in zip(keys, vals)])
+    path = str(tmp_path / 'memory')
+    em.save_memory(path)
+
+    loaded = ContentAddressableMemory()
+    loaded.load_memory(path, mmap=mmap)
+    assert isinstance(loaded.get_previous_value()[0], np.memmap) == mmap
+    assert np.allclose(loaded.memory, em.memory)
+    assert loaded.key_size == 4
+    assert loaded.val_size == 3
+    retrieved = loaded.get_memory(keys[10])
+    assert np.allclose(retrieved[0], keys[10])
+    assert np.allclose(retrieved[1], vals[10])
+
+    # Storing and deleting entries does not modify the files
+    loaded.add_to_memory([[1, 2, 3, 4], [5, 6, 7]])
+    loaded.delete_from_memory([keys[0], vals[0]])
+    assert len(loaded.memory) == 50
+    assert np.allclose(np.load(str(tmp_path / 'memory' / 'keys.npy')), keys)
+    assert np.allclose(np.load(str(tmp_path / 'memory' / 'values.npy')), vals)
+
+
+def test_ContentAddressableMemory_save_load_errors(tmp_path):
+
+    em = ContentAddressableMemory(initializer=[[[1, 2], [3, 4]]])
+    em.add_to_memory([[5, 6], [7, 8, 9]])
+    with pytest.raises(FunctionError) as error_text:
+        em.save_memory(str(tmp_path / 'ragged'))
+    assert 'must all be the same length' in str(error_text.value)
+
+    with pytest.raises(FunctionError) as error_text:
+        em.load_memory(str(tmp_path / 'missing'))
+    assert 'Could not read memory' in str(error_text.value)
+
+    em = ContentAddressableMemory(initializer=[[[1, 2], [3, 4]], [[5, 6], [7, 8]]])
+    em.save_memory(str(tmp_path / 'memory'))
+    small = ContentAddressableMemory(max_entries=1)
+    with pytest.raises(FunctionError) as error_text:
+        small.load_memory(str(tmp_path / 'memory'))
+    assert 'has more entries' in str(error_text.value)
+
+
 @pytest.mark.parametrize(
     'param_name',
     [
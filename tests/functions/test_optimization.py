@@ -88,6 +88,33 @@ def test_grid_search(obj_func, metric, normalize, direction, selection, benchmar
     assert np.allclose(res[3], result[3])
 
 
+@pytest.mark.function
+@pytest.mark.optimization_function
+@pytest.mark.parametrize("selection", ['FIRST', 'RANDOM'])
+@pytest.mark.parametrize("direction", [OPTFunctions.MINIMIZE, OPTFunctions.MAXIMIZE])
+@pytest.mark.parametrize("num_processes", [2, 3])
+def test_grid_search_processes(num_processes, direction, selection):
+    variable = test_var
+    result = results[Functions.Stability][kw.ENTROPY][False][direction][selection]
+
+    of = Functions.Stability(default_variable=variable, metric=kw.ENTROPY, normalize=False)
+    f = OPTFunctions.GridSearch(objective_function=of, default_variable=variable,
+                                search_space=search_space, direction=direction,
+                                select_randomly_from_optimal_values=(selection=='RANDOM'),
+                                seed=0, num_processes=num_processes)
+    res = f.function(variable)
+
+    assert np.allclose(res[0], result[0])
+    assert np.allclose(res[1], result[1])
+
+    serial_f = OPTFunctions.GridSearch(objective_function=of, default_variable=variable,
+                                       search_space=search_space, direction=direction, seed=0)
+    serial_f.function(variable)
+
+    assert np.allclose(f.saved_samples, serial_f.saved_samples)
+    assert np.allclose(f.saved_values, serial_f.saved_values)
+
+
 @pytest.mark.llvm
 @pytest.mark.function
 @pytest.mark.benchmark
@@ -141,3 +168,31 @@ def test_grid_search_ptx(obj_func, metric, normalize, direction, selection, benc
 
     assert np.allclose(res[0], result[0])
     assert np.allclose(res[1], result[1])
+
+
+@pytest.mark.llvm
+@pytest.mark.function
+@pytest.mark.optimization_function
+@pytest.mark.parametrize("selection", ['FIRST', 'RANDOM'])
+@pytest.mark.parametrize("direction", [OPTFunctions.MINIMIZE, OPTFunctions.MAXIMIZE])
+@pytest.mark.parametrize("metric", [kw.ENERGY, kw.ENTROPY])
+# 64 threads leaves some of them without samples to evaluate
+@pytest.mark.parametrize("num_threads", [2, 3, 64])
+def test_grid_search_llvm_threads(num_threads, metric, direction, selection):
+    variable = test_var
+    result = results[Functions.Stability][metric][False][direction][selection]
+
+    of = Functions.Stability(default_variable=variable, metric=metric, normalize=False)
+    f = OPTFunctions.GridSearch(objective_function=of, default_variable=variable,
+                                search_space=search_space, direction=direction,
+                                select_randomly_from_optimal_values=(selection=='RANDOM'),
+                                seed=0, num_threads=num_threads)
+    e = pnlvm.execution.FuncExecution(f)
+    res = e.execute(variable)
+
+    # Threads use their own random streams to select among optimal samples,
+    # so only the first optimal sample is guaranteed to match serial search
+    if selection == 'FIRST':
+        assert np.allclose(res[0], result[0])
+    assert np.allclose(res[1], result[1])
+    assert np.allclose(of.function(res[0]), result[1])
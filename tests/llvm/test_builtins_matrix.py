@@ -73,6 +73,70 @@ def test_mat_scalar(benchmark, op, builtin, result, mode):
     assert np.allclose(res, result)
 
 
+# Square sizes used by typical projections, and odd sizes that don't fill
+# the vector and unrolled blocks of the builtins
+SIZES = [(16, 16), (128, 128), (512, 512), (5, 3), (67, 131)]
+
+
+def _get_operands(dim_x, dim_y):
+    np.random.seed(dim_x * dim_y)
+    return np.random.rand(dim_x, dim_y), np.random.rand(dim_x, dim_y), np.random.rand(dim_x), np.random.rand(dim_y)
+
+
+def _as_ctype(array):
+    return array.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+
+
+@pytest.mark.parametrize("dim_x, dim_y", SIZES, ids=lambda x: str(x))
+@pytest.mark.parametrize("op, builtin", [
+                         (np.add, "__pnl_builtin_mat_add"),
+                         (np.subtract, "__pnl_builtin_mat_sub"),
+                         (np.multiply, "__pnl_builtin_mat_hadamard"),
+                         ], ids=["ADD", "SUB", "MUL"])
+@pytest.mark.parametrize("mode", ["Python",
+                                  pytest.param('LLVM', marks=pytest.mark.llvm)])
+def test_mat_hadamard_sizes(benchmark, op, builtin, mode, dim_x, dim_y):
+    benchmark.group = "Hadamard {}x{}".format(dim_x, dim_y)
+    m1, m2, _, _ = _get_operands(dim_x, dim_y)
+    if mode == 'Python':
+        res = benchmark(op, m1, m2)
+    elif mode == 'LLVM':
+        llvm_fun = pnlvm.LLVMBinaryFunction.get(builtin)
+        res = np.empty_like(m1)
+        benchmark(llvm_fun, _as_ctype(m1), _as_ctype(m2), dim_x, dim_y, _as_ctype(res))
+    assert np.allclose(res, op(m1, m2))
+
+
+@pytest.mark.parametrize("dim_x, dim_y", SIZES, ids=lambda x: str(x))
+@pytest.mark.parametrize("mode", ["Python",
+                                  pytest.param('LLVM', marks=pytest.mark.llvm)])
+def test_dot_sizes(benchmark, mode, dim_x, dim_y):
+    benchmark.group = "Dot {}x{}".format(dim_x, dim_y)
+    m, _, vec, _ = _get_operands(dim_x, dim_y)
+    if mode == 'Python':
+        res = benchmark(np.dot, vec, m)
+    elif mode == 'LLVM':
+        llvm_fun = pnlvm.LLVMBinaryFunction.get("__pnl_builtin_vxm")
+        res = np.empty(dim_y)
+        benchmark(llvm_fun, _as_ctype(vec), _as_ctype(m), dim_x, dim_y, _as_ctype(res))
+    assert np.allclose(res, np.dot(vec, m))
+
+
+@pytest.mark.parametrize("dim_x, dim_y", SIZES, ids=lambda x: str(x))
+@pytest.mark.parametrize("mode", ["Python",
+                                  pytest.param('LLVM', marks=pytest.mark.llvm)])
+def test_dot_transposed_sizes(benchmark, mode, dim_x, dim_y):
+    benchmark.group = "Dot transposed {}x{}".format(dim_x, dim_y)
+    m, _, _, trans_vec = _get_operands(dim_x, dim_y)
+    if mode == 'Python':
+        res = benchmark(np.dot, trans_vec, m.transpose())
+    elif mode == 'LLVM':
+        llvm_fun = pnlvm.LLVMBinaryFunction.get("__pnl_builtin_vxm_transposed")
+        res = np.empty(dim_x)
+        benchmark(llvm_fun, _as_ctype(trans_vec), _as_ctype(m), dim_x, dim_y, _as_ctype(res))
+    assert np.allclose(res, np.dot(trans_vec, m.transpose()))
+
+
 @pytest.mark.benchmark(group="Dot")
 def test_dot_numpy(benchmark):
     numpy_res = benchmark(np.dot, vector, u)
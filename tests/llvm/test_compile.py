@@ -2,6 +2,7 @@ import ctypes
 import numpy as np
 import pytest
 
+import psyneulink as pnl
 from psyneulink.core import llvm as pnlvm
 
 ITERATIONS=100
@@ -48,3 +49,69 @@ def test_recompile():
 
     binf(ct_vec, ct_mat, x, y, ct_res)
     assert np.array_equal(new_res, callable_res)
+
+
+def _gen_cache_test_module():
+    double = pnlvm.ir.DoubleType()
+    module = pnlvm.ir.Module(name="test_object_cache")
+    func = pnlvm.ir.Function(module, pnlvm.ir.FunctionType(double, [double]), name="__test_object_cache_double")
+    builder = pnlvm.ir.IRBuilder(func.append_basic_block(name="entry"))
+    builder.ret(builder.fadd(func.args[0], func.args[0]))
+    return module
+
+
+@pytest.mark.llvm
+def test_object_cache(tmp_path):
+    cache = pnlvm.jit_engine.disk_object_cache(str(tmp_path))
+    results = []
+    cached_files = []
+    # The second engine should load all objects from the cache
+    for i in range(2):
+        engine = pnlvm.jit_engine.cpu_jit_engine(cache)
+        engine.compile_modules([_gen_cache_test_module()], set())
+        ptr = engine._engine.get_function_address("__test_object_cache_double")
+        results.append(ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_double)(ptr)(2.5))
+        cached_files.append(sorted(p.name for p in tmp_path.iterdir()))
+
+    assert results == [5.0, 5.0]
+    # builtins and the test module
+    assert len(cached_files[0]) == 2
+    assert cached_files[0] == cached_files[1]
+
+
+@pytest.mark.llvm
+def test_object_cache_eviction(tmp_path):
+    cache = pnlvm.jit_engine.disk_object_cache(str(tmp_path), max_size=0)
+    engine = pnlvm.jit_engine.cpu_jit_engine(cache)
+    engine.compile_modules([_gen_cache_test_module()], set())
+
+    # Every object is evicted after it's stored
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.llvm
+@pytest.mark.composition
+def test_regenerate_modified_composition():
+    A = pnl.TransferMechanism(name="A")
+    B = pnl.TransferMechanism(name="B", function=pnl.Linear(slope=2.0))
+    comp = pnl.Composition()
+    comp.add_linear_processing_pathway([A, B])
+    ctx = pnlvm.LLVMBuilderContext.get_global()
+
+    res = comp.run(inputs={A: [[1.0]]}, bin_execute="LLVMRun")
+    assert np.allclose(res, [[2.0]])
+    node_function = ctx.gen_llvm_function(A)
+    run_function = comp._llvm_run
+
+    # Unchanged composition reuses generated functions
+    assert comp._llvm_run is run_function
+
+    C = pnl.TransferMechanism(name="C", function=pnl.Linear(slope=3.0))
+    comp.add_linear_processing_pathway([B, C])
+
+    res = comp.run(inputs={A: [[1.0]]}, bin_execute="LLVMRun")
+    assert np.allclose(res, [[6.0]])
+
+    # Only the functions affected by the change are regenerated
+    assert ctx.gen_llvm_function(A) is node_function
+    assert comp._llvm_run is not run_function
@@ -26,6 +26,7 @@ expected = np.linalg.norm(v1 - v2)
 @pytest.mark.parametrize("executions", [1,10,100])
 @pytest.mark.parametrize("mode", ['Python',
                                   pytest.param('LLVM', marks=pytest.mark.llvm),
+                                  pytest.param('LLVMThreads', marks=pytest.mark.llvm),
                                   pytest.param('PTX', marks=[pytest.mark.llvm, pytest.mark.cuda])])
 def test_function(benchmark, executions, mode):
     f = Functions.Distance(default_variable=test_var, metric=kw.EUCLIDEAN)
@@ -34,8 +35,9 @@ def test_function(benchmark, executions, mode):
     if mode == 'Python':
         e = lambda x : [f.function(x[i]) for i in range(executions)]
         res = benchmark(e if executions > 1 else f.function, var)
-    elif mode == 'LLVM':
-        e = pnlvm.execution.FuncExecution(f, [None for _ in range(executions)])
+    elif mode.startswith('LLVM'):
+        num_threads = 4 if mode == 'LLVMThreads' else 1
+        e = pnlvm.execution.FuncExecution(f, [None for _ in range(executions)], num_threads=num_threads)
         res = benchmark(e.execute, var)
     elif mode == 'PTX':
         e = pnlvm.execution.FuncExecution(f, [None for _ in range(executions)])
@@ -50,6 +52,7 @@ def test_function(benchmark, executions, mode):
 @pytest.mark.parametrize("executions", [1,10,100])
 @pytest.mark.parametrize("mode", ['Python',
                                   pytest.param('LLVM', marks=pytest.mark.llvm),
+                                  pytest.param('LLVMThreads', marks=pytest.mark.llvm),
                                   pytest.param('PTX', marks=[pytest.mark.llvm, pytest.mark.cuda])])
 def test_mechanism(benchmark, executions, mode):
     benchmark.group = "TransferMechanism multirun {}".format(executions)
@@ -66,8 +69,9 @@ def test_mechanism(benchmark, executions, mode):
     if mode == 'Python':
         f = lambda x : [T.execute(x[i]) for i in range(executions)]
         res = benchmark(f if executions > 1 else T.execute, var)
-    elif mode == 'LLVM':
-        e = pnlvm.execution.MechExecution(T, [None for _ in range(executions)])
+    elif mode.startswith('LLVM'):
+        num_threads = 4 if mode == 'LLVMThreads' else 1
+        e = pnlvm.execution.MechExecution(T, [None for _ in range(executions)], num_threads=num_threads)
         res = benchmark(e.execute, var)
     elif mode == 'PTX':
         e = pnlvm.execution.MechExecution(T, [None for _ in range(executions)])
@@ -86,6 +90,7 @@ def test_mechanism(benchmark, executions, mode):
 @pytest.mark.parametrize("executions", [1,10,100])
 @pytest.mark.parametrize("mode", ['Python',
                                   pytest.param('LLVM', marks=pytest.mark.llvm),
+                                  pytest.param('LLVMThreads', marks=pytest.mark.llvm),
                                   pytest.param('PTX', marks=[pytest.mark.llvm, pytest.mark.cuda])])
 def test_nested_composition_execution(benchmark, executions, mode):
     benchmark.group = "Nested Composition execution multirun {}".format(executions)
@@ -116,8 +121,9 @@ def test_nested_composition_execution(benchmark, executions, mode):
         f = lambda x : [outer_comp.execute(x[i], context=i) for i in range(executions)]
         res = f(var) if executions > 1 else outer_comp.execute(var)
         benchmark(f if executions > 1 else outer_comp.execute, var)
-    elif mode == 'LLVM':
-        e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)])
+    elif mode.startswith('LLVM'):
+        num_threads = 4 if mode == 'LLVMThreads' else 1
+        e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)], num_threads=num_threads)
         e.execute(var)
         res = e.extract_node_output(outer_comp.output_CIM)
         benchmark(e.execute, var)
@@ -138,6 +144,7 @@ def test_nested_composition_execution(benchmark, executions, mode):
 @pytest.mark.parametrize("executions", [1,10,100])
 @pytest.mark.parametrize("mode", ['Python',
                                   pytest.param('LLVM', marks=pytest.mark.llvm),
+                                  pytest.param('LLVMThreads', marks=pytest.mark.llvm),
                                   pytest.param('PTX', marks=[pytest.mark.llvm, pytest.mark.cuda])])
 def test_nested_composition_run(benchmark, executions, mode):
     benchmark.group = "Nested Composition multirun {}".format(executions)
@@ -168,13 +175,14 @@ def test_nested_composition_run(benchmark, executions, mode):
         f = lambda x : [outer_comp.run(x[i], context=i) for i in range(executions)]
         res = f(var) if executions > 1 else outer_comp.run(var)
         benchmark(f if executions > 1 else outer_comp.run, var)
-    elif mode == 'LLVM':
-        e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)])
-        res = e.run(var, 1, 1)
+    elif mode.startswith('LLVM'):
+        num_threads = 4 if mode == 'LLVMThreads' else 1
+        e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)], num_threads=num_threads)
+        res = pnlvm._split_run_outputs(e.run(var, 1, 1))
         benchmark(e.run, var, 1, 1)
     elif mode == 'PTX':
         e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)])
-        res = e.cuda_run(var, 1, 1)
+        res = pnlvm._split_run_outputs(e.cuda_run(var, 1, 1))
         benchmark(e.cuda_run, var, 1, 1)
 
     assert np.allclose(res, [expected for _ in range(executions)])
@@ -187,6 +195,7 @@ def test_nested_composition_run(benchmark, executions, mode):
 @pytest.mark.parametrize("executions", [1,10,100])
 @pytest.mark.parametrize("mode", ['Python',
                                   pytest.param('LLVM', marks=pytest.mark.llvm),
+                                  pytest.param('LLVMThreads', marks=pytest.mark.llvm),
                                   pytest.param('PTX', marks=[pytest.mark.llvm, pytest.mark.cuda])])
 def test_nested_composition_run_trials_inputs(benchmark, executions, mode):
     benchmark.group = "Nested Composition mutliple trials/inputs multirun {}".format(executions)
@@ -223,14 +232,40 @@ def test_nested_composition_run_trials_inputs(benchmark, executions, mode):
             return results
         res = f(var, 4, True) if executions > 1 else f([var], 4, True)
         benchmark(f if executions > 1 else outer_comp.run, var, num_trials=4)
-    elif mode == 'LLVM':
-        e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)])
-        res = e.run(var, 4, 2)
+    elif mode.startswith('LLVM'):
+        num_threads = 4 if mode == 'LLVMThreads' else 1
+        e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)], num_threads=num_threads)
+        res = pnlvm._split_run_outputs(e.run(var, 4, 2))
         benchmark(e.run, var, 4, 2)
     elif mode == 'PTX':
         e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)])
-        res = e.cuda_run(var, 4, 2)
+        res = pnlvm._split_run_outputs(e.cuda_run(var, 4, 2))
         benchmark(e.cuda_run, var, 4, 2)
 
     assert np.allclose(res, [expected for _ in range(executions)])
     assert len(res) == executions or executions == 1
+
+
+@pytest.mark.multirun
+@pytest.mark.llvm
+@pytest.mark.parametrize("num_threads", [1, 3, 20])
+def test_threaded_multirun_distinct_contexts(num_threads):
+    executions = 10
+    A = TransferMechanism(name="A", default_variable=[0, 0], integration_rate=1.0,
+                          noise=-2.0, integrator_mode=True)
+    comp = Composition(name="comp")
+    comp.add_node(A)
+    comp._analyze_graph()
+
+    # Every context gets different input, so results from any context
+    # executed with the wrong slice of a buffer would not match
+    var = [[[i, 2 * i]] for i in range(executions)]
+    e = pnlvm.execution.MechExecution(A, [None for _ in range(executions)], num_threads=num_threads)
+    res = e.execute(var)
+    assert np.allclose(res, [[[i - 2, 2 * i - 2]] for i in range(executions)])
+
+    inputs = [{A: [[[i, i + 1]], [[i + 2, i + 3]]]} for i in range(executions)]
+    e = pnlvm.execution.CompExecution(comp, [None for _ in range(executions)], num_threads=num_threads)
+    res = pnlvm._split_run_outputs(e.run(inputs, 3, 2))
+    expected = [[[[i - 2, i - 1]], [[i, i + 1]], [[i - 2, i - 1]]] for i in range(executions)]
+    assert np.allclose(res, expected)
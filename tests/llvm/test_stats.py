@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+import psyneulink as pnl
+from psyneulink.core import llvm as pnlvm
+
+
+@pytest.mark.llvm
+@pytest.mark.composition
+@pytest.mark.parametrize("mode", ["LLVMExec", "LLVMRun"])
+def test_execution_stats(mode):
+    A = pnl.TransferMechanism(name="A")
+    B = pnl.TransferMechanism(name="B", function=pnl.Linear(slope=2.0))
+    comp = pnl.Composition()
+    comp.add_linear_processing_pathway([A, B])
+
+    assert pnlvm.get_execution_stats(comp).calls == 0
+
+    inputs = {A: [[1.0], [2.0], [3.0]]}
+    res = comp.run(inputs=inputs, bin_execute=mode)
+    assert np.allclose(res, [[6.0]])
+
+    stats = pnlvm.get_execution_stats(comp)
+    # "Exec" calls the compiled composition once per trial
+    assert stats.calls == (3 if mode == "LLVMExec" else 1)
+    assert stats.compiled_time > 0
+    assert stats.input_time > 0
+    assert stats.output_time > 0
+    assert stats.marshal_time == stats.input_time + stats.output_time
+
+    calls = stats.calls
+    comp.run(inputs=inputs, bin_execute=mode)
+    assert pnlvm.get_execution_stats(comp).calls == 2 * calls
+
+
+@pytest.mark.llvm
+@pytest.mark.composition
+def test_compilation_stats():
+    A = pnl.TransferMechanism(name="A")
+    comp = pnl.Composition()
+    comp.add_node(A)
+    comp.run(inputs={A: [[1.0]]}, bin_execute="LLVMRun")
+
+    stats = pnlvm.get_compilation_stats()
+    run_stats = stats[comp._llvm_run.name]
+    assert run_stats.name == comp._llvm_run.name
+    assert run_stats.engine == "cpu_jit_engine"
+    assert run_stats.instructions > 0
+    assert run_stats.opt_time > 0
+    assert run_stats.codegen_time > 0
+    assert run_stats.binary_size is None or run_stats.binary_size > 0
+
+    # Functions called by the run wrapper are included
+    exec_name = pnlvm.LLVMBuilderContext.get_global().gen_llvm_function(comp).name
+    assert exec_name in stats
@@ -189,3 +189,31 @@ def test_dot_notation():
     assert t.parameters.value.get(c) == 5
     assert t.parameters.value.get(d) == 10
     assert t.parameters.value.get('custom execution id') == 20
+
+
+def test_initialize_from_context_copy_on_write():
+    t = pnl.TransferMechanism()
+    t._initialize_from_context(pnl.Context(execution_id='base'))
+    t.execute(1, context='base')
+    t.execute(2, context='base')
+
+    base_value = t.parameters.value.values['base']
+    base_history = list(t.parameters.value.history['base'])
+    t._initialize_from_context(pnl.Context(execution_id='sim'), pnl.Context(execution_id='base'), copy_on_write=True)
+
+    # shared until accessed
+    assert t.parameters.value.values['sim'] is base_value
+    assert t.parameters.value.history['sim'] is t.parameters.value.history['base']
+
+    sim_value = t.parameters.value.get('sim')
+    assert sim_value is not base_value
+    np.testing.assert_array_equal(sim_value, base_value)
+
+    sim_value[0][0] = 100
+    assert t.parameters.value.get('base') == 2
+
+    t.execute(3, context='sim')
+    assert t.parameters.value.get('sim') == 3
+    assert t.parameters.value.get('base') == 2
+    assert list(t.parameters.value.history['base']) == base_history
+    assert t.parameters.value.get_previous('sim') == 100
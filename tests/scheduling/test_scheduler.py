@@ -63,6 +63,110 @@ class TestScheduler:
 
         assert comp.scheduler.clocks[eid1].time.trial == 2
 
+    def test_counts_arrays(self):
+        comp = Composition()
+        A = TransferMechanism(name='scheduler-pytests-A')
+        B = TransferMechanism(name='scheduler-pytests-B')
+        comp.add_linear_processing_pathway([A, B])
+
+        sched = Scheduler(composition=comp)
+        sched.add_condition(B, EveryNCalls(A, 2))
+        termination_conds = {TimeScale.TRIAL: AfterNCalls(B, 1)}
+        comp.run(inputs={A: [[0]]}, scheduler=sched, termination_processing=termination_conds)
+
+        eid = comp.default_execution_id
+        a, b = sched._node_indices[A], sched._node_indices[B]
+        counts_total = sched.counts_total[eid]
+        counts_useable = sched.counts_useable[eid]
+        assert counts_total.shape == (len(TimeScale), 2)
+        assert counts_total[TimeScale.TRIAL.value, a] == 2
+        assert counts_total[TimeScale.TRIAL.value, b] == 1
+        assert counts_useable[a, b] == 0
+        assert counts_useable[b, a] == 1
+
+        sched._init_counts(execution_id='eid', base_execution_id=eid)
+        np.testing.assert_array_equal(sched.counts_total['eid'], counts_total)
+        assert sched.counts_total['eid'] is not counts_total
+
+    def test_static_schedule_replay(self):
+        comp = Composition()
+        A = TransferMechanism(name='scheduler-pytests-A')
+        B = TransferMechanism(name='scheduler-pytests-B')
+        C = TransferMechanism(name='scheduler-pytests-C')
+        comp.add_linear_processing_pathway([A, B, C])
+
+        sched = Scheduler(composition=comp)
+        sched.add_condition(B, EveryNCalls(A, 2))
+        sched.add_condition(C, EveryNCalls(B, 1))
+        termination_conds = {TimeScale.TRIAL: AfterNCalls(C, 2)}
+
+        comp.run(inputs={A: [[0]]}, scheduler=sched, termination_processing=termination_conds)
+        assert sched._static_schedule[1]
+
+        # replayed trials must not evaluate any Conditions
+        def fail(*args, **kwargs):
+            raise AssertionError('Condition evaluated during replay')
+
+        for cond in [sched.conditions[B], sched.conditions[C]]:
+            cond.func = fail
+
+        comp.run(inputs={A: [[0], [1]]}, scheduler=sched, termination_processing=termination_conds)
+        output = sched.execution_list[comp.default_execution_id]
+
+        expected_output = [A, A, B, C, A, A, B, C] * 3
+        assert output == pytest.helpers.setify_expected_output(expected_output)
+        assert sched.counts_total[comp.default_execution_id][TimeScale.RUN.value, sched._node_indices[A]] == 8
+        assert sched.get_clock(comp.default_execution_id).get_total_times_relative(TimeScale.PASS, TimeScale.LIFE) == 12
+
+    def test_static_schedule_invalidated(self):
+        comp = Composition()
+        A = TransferMechanism(name='scheduler-pytests-A')
+        B = TransferMechanism(name='scheduler-pytests-B')
+        comp.add_linear_processing_pathway([A, B])
+
+        sched = Scheduler(composition=comp)
+        sched.add_condition(B, EveryNCalls(A, 2))
+
+        comp.run(inputs={A: [[0], [1]]}, scheduler=sched)
+        sched.add_condition(B, EveryNCalls(A, 3))
+        comp.run(inputs={A: [[0]]}, scheduler=sched)
+
+        output = sched.execution_list[comp.default_execution_id]
+        expected_output = [A, A, B, A, A, B, A, A, A, B]
+        assert output == pytest.helpers.setify_expected_output(expected_output)
+
+        # a Condition that depends on the Clock is not static
+        sched.add_condition(B, AfterNPasses(1))
+        comp.run(inputs={A: [[0]]}, scheduler=sched)
+        assert sched._static_schedule[1] is None
+
+    def test_history_max_length(self):
+        comp = Composition()
+        A = TransferMechanism(name='scheduler-pytests-A')
+        B = TransferMechanism(name='scheduler-pytests-B')
+        comp.add_linear_processing_pathway([A, B])
+
+        sched = Scheduler(composition=comp, history_max_length=0)
+        sched.add_condition(B, EveryNCalls(A, 2))
+        comp.run(inputs={A: [[0], [1], [2]]}, scheduler=sched)
+
+        eid = comp.default_execution_id
+        clock = sched.get_clock(eid)
+        assert len(sched.execution_list[eid]) == 0
+        assert len(clock.history.children[0].children) == 1
+        assert clock.get_total_times_relative(TimeScale.TRIAL, TimeScale.LIFE) == 3
+        assert clock.get_total_times_relative(TimeScale.PASS, TimeScale.LIFE) == 6
+        assert sched.counts_total[eid][TimeScale.RUN.value, sched._node_indices[A]] == 6
+
+        # a Condition that depends on the last TIME_STEP is retained
+        sched.add_condition(B, JustRan(A))
+        comp.run(inputs={A: [[0]]}, scheduler=sched)
+        assert list(sched.execution_list[eid]) == pytest.helpers.setify_expected_output([B])
+
+        sched.history_max_length = None
+        comp.run(inputs={A: [[0]]}, scheduler=sched)
+        assert sched.execution_list[eid] == pytest.helpers.setify_expected_output([B, A, B])
+
     def test_two_compositions_one_scheduler(self):
         comp1 = Composition()
         comp2 = Composition()
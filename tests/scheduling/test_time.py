@@ -1,7 +1,7 @@
 import psyneulink as pnl
 import pytest
 
-from psyneulink.core.scheduling.time import Time, TimeHistoryTree, TimeScale
+from psyneulink.core.scheduling.time import Time, TimeHistoryTree, TimeScale, TimeScaleError
 
 
 class TestTime:
@@ -59,3 +59,24 @@ class TestTimeHistoryTree:
             assert node.time_scale >= max_depth
 
         assert found_max_depth
+
+    def test_max_children(self):
+        h = TimeHistoryTree(max_children=2)
+
+        for i in range(5):
+            h.increment_time(TimeScale.TIME_STEP)
+            h.increment_time(TimeScale.PASS)
+            h.increment_time(TimeScale.TRIAL)
+
+        run_node = h.children[0]
+        assert len(run_node.children) == 2
+        assert [node.index for node in run_node.children] == [4, 5]
+        assert h.get_total_times_relative(TimeScale.TRIAL, {TimeScale.RUN: 0}) == 5
+        assert h.get_total_times_relative(TimeScale.PASS, {TimeScale.TRIAL: 4}) == 1
+
+        with pytest.raises(TimeScaleError):
+            h.get_total_times_relative(TimeScale.PASS, {TimeScale.TRIAL: 3})
+
+        h._set_max_children(1)
+        assert [node.index for node in run_node.children] == [5]
+        assert h.get_total_times_relative(TimeScale.PASS, {TimeScale.LIFE: 0}) == 5
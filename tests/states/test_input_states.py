@@ -103,3 +103,20 @@ class TestInputPorts:
         m = pnl.TransferMechanism(input_ports=['EXTERNAL', pnl.InputPort(name='INTERNAL_ONLY', internal_only=True)])
         assert m.input_values == [[ 0.],[ 0.]]
         assert m.external_input_values == [[0.]]
+
+    def test_afferent_plan_rebuilt_on_new_projection(self):
+        A = pnl.TransferMechanism(name='A')
+        B = pnl.TransferMechanism(name='B')
+        C = pnl.TransferMechanism(name='C')
+        comp = pnl.Composition()
+        comp.add_linear_processing_pathway([A, C])
+
+        assert np.allclose(comp.run(inputs={A: [[1]]}), [[1]])
+        plan = C.input_port._get_afferent_plan()
+        assert [a.projection for a in plan] == C.input_port.path_afferents
+        assert all(a.is_pathway and a.params_type == pnl.MAPPING_PROJECTION_PARAMS for a in plan)
+        assert C.input_port._get_afferent_plan() is plan
+
+        comp.add_linear_processing_pathway([B, C])
+        assert np.allclose(comp.run(inputs={A: [[1]], B: [[2]]}), [[3]])
+        assert len(C.input_port._get_afferent_plan()) == 2